@@ -23,6 +23,11 @@ from starlette.middleware.cors import CORSMiddleware
 
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # optional speedup: brainbox[fast]
+    orjson = None
+
 from .auth import get_api_key, load_or_create_key, require_api_key
 from .config import settings
 from .rate_limit import limiter, rate_limit_exceeded_handler
@@ -124,17 +129,20 @@ def _audit_log(
 # SSE client management
 # ---------------------------------------------------------------------------
 
+# Queue items are (payload, session_name); the session is worked out once per
+# event here rather than by re-parsing the payload in every filtered client
 _sse_queues: set[asyncio.Queue] = set()
 _sse_drops: int = 0
 
 
-def _broadcast_sse(data: str) -> None:
+def _broadcast_sse(data: str, session_name: str | None = None) -> None:
     if not _sse_queues:
         return
     global _sse_drops
+    item = (data, session_name)
     for q in list(_sse_queues):
         try:
-            q.put_nowait(data)
+            q.put_nowait(item)
         except asyncio.QueueFull:
             _sse_drops += 1
             if _sse_drops % 50 == 1:
@@ -144,6 +152,21 @@ def _broadcast_sse(data: str) -> None:
                 )
 
 
+def _broadcast_hub_event(event: str, data: Any) -> None:
+    """Serialize a hub event once and fan it out to SSE clients."""
+    if not _sse_queues:
+        return
+    payload = data.model_dump() if hasattr(data, "model_dump") else data
+    message = {"hub": True, "event": event, "data": payload}
+    encoded = (
+        orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+        if orjson is not None
+        else json.dumps(message)
+    )
+    session_name = payload.get("session_name") if isinstance(payload, dict) else None
+    _broadcast_sse(encoded, session_name)
+
+
 # ---------------------------------------------------------------------------
 # Task tracking for async execution
 # ---------------------------------------------------------------------------
@@ -237,17 +260,7 @@ async def lifespan(app: FastAPI):
     load_or_create_key()
 
     # Forward hub events to SSE
-    on_event(
-        lambda event, data: _broadcast_sse(
-            json.dumps(
-                {
-                    "hub": True,
-                    "event": event,
-                    "data": data.model_dump() if hasattr(data, "model_dump") else data,
-                }
-            )
-        )
-    )
+    on_event(_broadcast_hub_event)
 
     # Start Docker events watcher
     global _docker_events_task
@@ -442,18 +455,11 @@ async def sse_events(
         try:
             yield {"data": "connected"}
             while True:
-                data = await queue.get()
-                # If a session filter is active, only forward matching events
-                if session:
-                    try:
-                        parsed = json.loads(data)
-                        event_session = parsed.get("data", {}).get("session_name") or parsed.get(
-                            "session_name"
-                        )
-                        if event_session and event_session != session:
-                            continue
-                    except (json.JSONDecodeError, TypeError, AttributeError):
-                        pass  # Non-JSON events (docker actions) pass through
+                data, event_session = await queue.get()
+                # If a session filter is active, only forward matching events;
+                # events without a session (docker actions) pass through
+                if session and event_session and event_session != session:
+                    continue
                 yield {"data": data}
         except asyncio.CancelledError:
             pass
@@ -764,7 +770,7 @@ async def api_exec_session(
 
     loop = asyncio.get_running_loop()
     exit_code, output = await loop.run_in_executor(
-        None, lambda: container.exec_run(["sh", "-c", body.command])
+        None, lambda: container.exec_run(("sh", "-c", body.command))
     )
     _audit_log(
         request,
@@ -1042,7 +1048,7 @@ async def _query_via_tmux(request: Request, name: str, body: QuerySessionRequest
     """Query container via tmux (legacy fallback)."""
     prefix = settings.resolved_prefix
     container_name = f"{prefix}{name}"
-    start_time = time.time()
+    start_time = time.monotonic()
 
     # Verify container exists and is running
     client = _docker()
@@ -1079,7 +1085,7 @@ async def _query_via_tmux(request: Request, name: str, body: QuerySessionRequest
         )
 
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.monotonic() - start_time
 
         # Parse the Claude CLI output for clean presentation
         parsed_response = _tmux_parse_output(raw_output, body.prompt, "")
@@ -1796,15 +1802,13 @@ async def api_push_config(request: Request, name: str, _key=Depends(require_api_
 
     from .bundle import build_config_bundle
     from .backends import create_backend
-    from .lifecycle import get_session
+    from .lifecycle import get_session, list_sessions
 
     ctx = get_session(name)
     if ctx is None:
         # Try to find by container name prefix
-        from .lifecycle import _sessions
-
-        for sess_name, sess_ctx in _sessions.items():
-            if sess_ctx.container_name == name or sess_name == name:
+        for sess_ctx in list_sessions():
+            if sess_ctx.container_name == name or sess_ctx.session_name == name:
                 ctx = sess_ctx
                 break
 
@@ -71,7 +71,7 @@ def upload_artifact(key: str, data: bytes, metadata: dict | None = None) -> Arti
     try:
         ensure_bucket()
         client = _s3_client()
-        now_ms = int(time.time() * 1000)
+        now_ms = time.time_ns() // 1_000_000
         tags = metadata or {}
         tags.setdefault("timestamp", str(now_ms))
 
@@ -24,8 +24,12 @@ def generate_api_key() -> str:
 def write_secure_file(path: Path, content: str, mode: int = 0o600) -> None:
     """Write *content* to *path* with restricted permissions."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
-    path.chmod(mode)
+    # Create the file with *mode* so it is never readable under default
+    # permissions; fchmod still covers files that already existed.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "w") as f:
+        os.fchmod(fd, mode)
+        f.write(content)
 
 
 def load_or_create_key() -> str:
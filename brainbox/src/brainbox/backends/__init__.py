@@ -110,7 +110,9 @@ class BackendProtocol(Protocol):
         """
         ...
 
-    async def health_check(self, ctx: SessionContext) -> dict[str, Any]:
+    async def health_check(
+        self, ctx: SessionContext, *, include_stats: bool = True
+    ) -> dict[str, Any]:
         """Phase 4: Check environment health and collect metrics.
 
         For Docker: Returns CPU/memory usage, container status.
@@ -118,6 +120,7 @@ class BackendProtocol(Protocol):
 
         Args:
             ctx: Session context
+            include_stats: Collect resource metrics (skip when only liveness matters)
 
         Returns:
             Health metrics dict with backend-specific fields
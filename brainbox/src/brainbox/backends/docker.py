@@ -9,6 +9,7 @@ import re
 import shlex
 import tarfile
 import textwrap
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
@@ -19,10 +20,29 @@ from docker.errors import NotFound
 from ..log import get_logger
 from ..models import SessionContext, SessionState
 
-# Docker client singleton
+# Docker client singleton, plus one pooled client per remote daemon URL
 _client: docker.DockerClient | None = None
+_remote_clients: dict[str, docker.DockerClient] = {}
+
+# Last (container CPU, system CPU) totals per container id.  One-shot stats
+# carry no previous sample, so CPU % is computed against the previous check.
+_cpu_samples: dict[str, tuple[int, int]] = {}
 _executor = ThreadPoolExecutor(max_workers=4)
 
+# One container listing per daemon serves every health check in a monitor
+# cycle: checks started within _LISTING_TTL of each other share the same
+# (possibly still in-flight) list call instead of inspecting one by one.
+# Each entry remembers the loop its future belongs to; a caller on another
+# loop starts its own listing rather than awaiting a foreign future.
+_LISTING_TTL = 1.0  # seconds
+_listings: dict[
+    str | None,
+    tuple[float, asyncio.AbstractEventLoop, asyncio.Future[dict[str, tuple[str, str]]]],
+] = {}
+
+# Listing states for which inspect reports State.Running as true
+_RUNNING_STATES = frozenset({"running", "paused", "restarting"})
+
 log = get_logger()
 
 
@@ -41,8 +61,13 @@ def _docker(docker_host: str | None = None) -> docker.DockerClient:
     """Get or create Docker client, optionally targeting a remote host."""
     global _client
     if docker_host:
-        # Remote host: create a fresh client (not cached — could be per-session)
-        return docker.DockerClient(base_url=docker_host)
+        # Remote host: one client per daemon URL, shared by every session on it
+        client = _remote_clients.get(docker_host)
+        if client is None:
+            client = _remote_clients.setdefault(
+                docker_host, docker.DockerClient(base_url=docker_host)
+            )
+        return client
     if _client is None:
         macos_sock = Path.home() / ".docker" / "run" / "docker.sock"
         if macos_sock.is_socket():
@@ -74,6 +99,50 @@ def _calc_cpu(stats: dict) -> float:
     return 0.0
 
 
+def _container_stats(client: docker.DockerClient, container_id: str) -> dict:
+    """Fetch a single stats sample for a container.
+
+    ``one_shot`` returns immediately instead of waiting ~1s for a second
+    sample; daemons older than API 1.41 fall back to the two-sample read.
+    """
+    try:
+        stats = client.api.stats(container_id, stream=False, one_shot=True)
+    except docker.errors.InvalidVersion:
+        return client.api.stats(container_id, stream=False)
+
+    cpu = stats.get("cpu_stats", {})
+    sample = (cpu.get("cpu_usage", {}).get("total_usage", 0), cpu.get("system_cpu_usage", 0))
+    prev = _cpu_samples.get(container_id)
+    if prev is None and len(_cpu_samples) >= 256:
+        _cpu_samples.clear()  # drop samples of long-gone containers
+    _cpu_samples[container_id] = sample
+    stats["precpu_stats"] = (
+        {"cpu_usage": {"total_usage": prev[0]}, "system_cpu_usage": prev[1]} if prev else {}
+    )
+    return stats
+
+
+def _list_managed(client: docker.DockerClient) -> dict[str, tuple[str, str]]:
+    """Map container name -> (id, state) for all brainbox-managed containers."""
+    listing = client.api.containers(all=True, filters={"label": "brainbox.managed=true"})
+    return {
+        name.lstrip("/"): (c["Id"], c.get("State", ""))
+        for c in listing
+        for name in c.get("Names") or ()
+    }
+
+
+async def _managed_containers(docker_host: str | None) -> dict[str, tuple[str, str]]:
+    """Recent listing of managed containers on *docker_host*, shared by callers."""
+    now = time.monotonic()
+    loop = asyncio.get_running_loop()
+    entry = _listings.get(docker_host)
+    if entry is None or now - entry[0] > _LISTING_TTL or entry[1] is not loop:
+        future = asyncio.ensure_future(_run(_list_managed, _docker(docker_host)))
+        entry = _listings[docker_host] = (now, loop, future)
+    return await asyncio.shield(entry[2])
+
+
 def _human_bytes(b: int) -> str:
     """Format bytes as human-readable string."""
     for unit in ("B", "KiB", "MiB", "GiB"):
@@ -450,7 +519,8 @@ class DockerBackend:
                     )
 
         # Write profile env to /run/profile/.env (after start)
-        profile_env = _resolve_profile_env(
+        profile_env = await _run(
+            _resolve_profile_env,
             workspace_profile=ctx.workspace_profile,
             workspace_home=ctx.workspace_home,
         )
@@ -513,15 +583,23 @@ class DockerBackend:
 
         return ctx
 
-    async def health_check(self, ctx: SessionContext) -> dict[str, Any]:
+    async def health_check(
+        self, ctx: SessionContext, *, include_stats: bool = True
+    ) -> dict[str, Any]:
         """Check Docker container health and collect CPU/memory metrics."""
         client = _docker(ctx.docker_host)
 
         try:
-            container = await _run(client.containers.get, ctx.container_name)
-            await _run(container.reload)
-
-            is_running = container.attrs["State"]["Running"]
+            try:
+                listed = (await _managed_containers(ctx.docker_host)).get(ctx.container_name)
+            except Exception:
+                listed = None  # fall back to inspecting this container directly
+            if listed is not None:
+                container_id, is_running = listed[0], listed[1] in _RUNNING_STATES
+            else:
+                # Not in the listing (e.g. unlabelled): inspect it directly
+                container = await _run(client.containers.get, ctx.container_name)
+                container_id, is_running = container.id, container.attrs["State"]["Running"]
 
             if not is_running:
                 return {
@@ -530,8 +608,10 @@ class DockerBackend:
                     "reason": "container not running",
                 }
 
-            # Get stats (non-streaming)
-            stats = await _run(container.stats, stream=False)
+            if not include_stats:
+                return {"backend": "docker", "healthy": True}
+
+            stats = await _run(_container_stats, client, container_id)
             cpu_pct = _calc_cpu(stats)
             mem = stats.get("memory_stats", {})
             mem_usage = mem.get("usage", 0)
@@ -760,11 +760,14 @@ class UTMBackend:
 
         return ctx
 
-    async def health_check(self, ctx: SessionContext) -> dict[str, Any]:
+    async def health_check(
+        self, ctx: SessionContext, *, include_stats: bool = True
+    ) -> dict[str, Any]:
         """Check UTM VM state and SSH connectivity.
 
         Args:
             ctx: Session context
+            include_stats: Unused; UTM health carries no resource metrics
 
         Returns:
             Health metrics dict with SSH status
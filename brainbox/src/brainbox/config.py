@@ -158,8 +158,11 @@ class Settings(BaseSettings):
     health_check_interval: int = 30  # seconds
     health_check_timeout: int = 5  # seconds
     health_check_retries: int = 3
+    health_check_concurrency: int = 8  # max in-flight checks per cycle
+    health_check_max_interval: int = 120  # seconds; back-off cap for stable sessions
 
     api_port: int = 9999
+    log_level: Literal["debug", "info", "warn", "error"] = "debug"
     op_vault: str = ""
 
     resources: ResourceSettings = Field(default_factory=ResourceSettings)
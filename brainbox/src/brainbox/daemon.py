@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import json
 import os
+import select
 import signal
 import subprocess
 import sys
@@ -17,6 +19,9 @@ from .log import get_logger
 
 log = get_logger()
 
+# Reuse a liveness probe for back-to-back status() calls within this window
+_STATUS_TTL = 0.5
+
 
 @dataclass
 class DaemonStatus:
@@ -54,6 +59,39 @@ class DaemonNotRunningError(DaemonError):
         super().__init__("Daemon not running")
 
 
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for ``pid`` to exit.
+
+    Blocks on a pidfd where the kernel supports it (Linux 5.3+), so we return
+    as soon as the process exits; otherwise polls ``os.kill(pid, 0)``.
+
+    Returns:
+        True if the process exited, False on timeout
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            pass  # No pidfd support (e.g. older kernel); fall back to polling
+        else:
+            try:
+                ready, _, _ = select.select([fd], [], [], timeout)
+            finally:
+                os.close(fd)
+            return bool(ready)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)  # Check if process exists
+        except ProcessLookupError:
+            return True
+        time.sleep(0.1)
+    return False
+
+
 class DaemonManager:
     """Manages the lifecycle of the brainbox API daemon process."""
 
@@ -67,6 +105,8 @@ class DaemonManager:
         self.pid_file = self.config_dir / "brainbox.pid"
         self.log_dir = self.config_dir / "logs"
         self.log_file = self.log_dir / "brainbox.log"
+        # (pid file mtime_ns or None, monotonic time, status)
+        self._status_cache: tuple[int | None, float, DaemonStatus] | None = None
 
     def start(
         self,
@@ -88,15 +128,13 @@ class DaemonManager:
             DaemonAlreadyRunningError: If daemon is already running
             DaemonError: If daemon fails to start
         """
-        # Check if already running
-        status = self.status()
+        # Check if already running. A fresh probe also removes any stale or
+        # malformed PID file, so nothing is left to clean up afterwards.
+        self._status_cache = None
+        status = self._probe_status()
         if status.running:
             raise DaemonAlreadyRunningError(status.pid, status.host, status.port)
 
-        # Clean up stale PID file
-        if self.pid_file.exists():
-            self.pid_file.unlink()
-
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -146,10 +184,7 @@ class DaemonManager:
         # Write PID file
         started_at = datetime.now(timezone.utc).isoformat()
         try:
-            self.pid_file.write_text(
-                f"{process.pid}\n{port}\n{host}\n{started_at}\n",
-                encoding="utf-8",
-            )
+            self._write_pid_file(process.pid, port, host, started_at)
         except Exception as e:
             # Kill the process if we can't write PID file
             try:
@@ -181,6 +216,7 @@ class DaemonManager:
             DaemonNotRunningError: If daemon is not running
             DaemonError: If daemon fails to stop
         """
+        self._status_cache = None
         status = self.status()
         if not status.running:
             raise DaemonNotRunningError()
@@ -198,15 +234,9 @@ class DaemonManager:
             raise DaemonError(f"Failed to send SIGTERM to process {pid}: {e}") from e
 
         # Wait for process to exit
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            try:
-                os.kill(pid, 0)  # Check if process exists
-                time.sleep(0.1)
-            except ProcessLookupError:
-                # Process is gone
-                self._cleanup_pid_file()
-                return f"Daemon stopped gracefully (PID {pid})"
+        if _wait_for_exit(pid, timeout):
+            self._cleanup_pid_file()
+            return f"Daemon stopped gracefully (PID {pid})"
 
         # Force kill with SIGKILL
         try:
@@ -219,14 +249,7 @@ class DaemonManager:
             raise DaemonError(f"Failed to send SIGKILL to process {pid}: {e}") from e
 
         # Wait for process to die after SIGKILL
-        kill_deadline = time.time() + 2  # Give it 2 more seconds
-        while time.time() < kill_deadline:
-            try:
-                os.kill(pid, 0)
-                time.sleep(0.1)
-            except ProcessLookupError:
-                # Process is gone
-                break
+        _wait_for_exit(pid, 2)  # Give it 2 more seconds
 
         self._cleanup_pid_file()
         return f"Daemon stopped forcefully (PID {pid})"
@@ -237,25 +260,33 @@ class DaemonManager:
         Returns:
             DaemonStatus object with current state
         """
-        if not self.pid_file.exists():
+        try:
+            mtime_ns: int | None = self.pid_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        now = time.monotonic()
+        cached = self._status_cache
+        if cached is not None and cached[0] == mtime_ns and now - cached[1] < _STATUS_TTL:
+            return cached[2]
+
+        status = self._probe_status()
+        self._status_cache = (mtime_ns, now, status)
+        return status
+
+    def _probe_status(self) -> DaemonStatus:
+        """Read the PID file and check whether the process is alive."""
+        # Read PID file
+        try:
+            data = self._read_pid_file()
+            pid = int(data["pid"])
+            port = int(data["port"])
+            host = data["host"]
+            started_at = data["started_at"]
+        except FileNotFoundError:
             return DaemonStatus(
                 running=False,
                 log_file=self.log_file if self.log_file.exists() else None,
             )
-
-        # Read PID file
-        try:
-            content = self.pid_file.read_text(encoding="utf-8")
-            lines = content.strip().split("\n")
-            if len(lines) < 4:
-                # Malformed PID file
-                self._cleanup_pid_file()
-                return DaemonStatus(running=False, log_file=self.log_file)
-
-            pid = int(lines[0])
-            port = int(lines[1])
-            host = lines[2]
-            started_at = lines[3]
         except Exception as exc:
             log.debug("daemon.pid_file_corrupt", metadata={"reason": str(exc)})
             self._cleanup_pid_file()
@@ -325,11 +356,38 @@ class DaemonManager:
         message = f"{stop_msg}\n{start_msg}"
         return pid, message
 
+    def _write_pid_file(self, pid: int, port: int, host: str, started_at: str) -> None:
+        """Atomically write the PID file as a single JSON object."""
+        data = {"pid": pid, "port": port, "host": host, "started_at": started_at}
+        tmp = self.pid_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.pid_file)
+        self._status_cache = None
+
+    def _read_pid_file(self) -> dict[str, Any]:
+        """Read the PID file in one read.
+
+        Falls back to the older four-line format so a daemon started by a
+        previous version is still recognised.
+
+        Raises:
+            FileNotFoundError: If there is no PID file
+            ValueError: If the file is malformed
+        """
+        raw = self.pid_file.read_bytes()
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            lines = raw.decode("utf-8").strip().split("\n")
+            if len(lines) < 4:
+                raise
+            return {"pid": lines[0], "port": lines[1], "host": lines[2], "started_at": lines[3]}
+
     def _cleanup_pid_file(self) -> None:
         """Remove the PID file if it exists."""
+        self._status_cache = None
         try:
-            if self.pid_file.exists():
-                self.pid_file.unlink()
+            self.pid_file.unlink(missing_ok=True)
         except Exception as exc:
             log.debug("daemon.cleanup_failed", metadata={"reason": str(exc)})
 
@@ -342,17 +400,18 @@ class DaemonManager:
         Returns:
             Dictionary representation
         """
-        result: dict[str, Any] = {
-            "running": status.running,
-        }
-
         if status.running:
-            result["pid"] = status.pid
-            result["url"] = f"http://{status.host}:{status.port}"
-            result["host"] = status.host
-            result["port"] = status.port
-            result["started_at"] = status.started_at
-            result["uptime_seconds"] = status.uptime_seconds
+            result: dict[str, Any] = {
+                "running": True,
+                "pid": status.pid,
+                "url": f"http://{status.host}:{status.port}",
+                "host": status.host,
+                "port": status.port,
+                "started_at": status.started_at,
+                "uptime_seconds": status.uptime_seconds,
+            }
+        else:
+            result = {"running": False}
 
         if status.log_file:
             result["log_file"] = str(status.log_file)
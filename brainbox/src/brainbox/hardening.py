@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from typing import Any
 
-from docker.types import Mount
-
 from .config import settings
 
 
@@ -19,6 +17,8 @@ def _parse_tmpfs_size(size: str) -> int:
 
 def get_hardening_kwargs(*, user: str | None = None) -> dict[str, Any]:
     """Return Docker SDK kwargs for a hardened container."""
+    from docker.types import Mount
+
     h = settings.hardening
     r = settings.resources
 
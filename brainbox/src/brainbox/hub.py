@@ -8,6 +8,12 @@ from __future__ import annotations
 
 import asyncio
 import json
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup: brainbox[fast]
+    orjson = None
 
 from .config import settings
 from .log import get_logger
@@ -89,11 +95,18 @@ async def shutdown() -> None:
 # ---------------------------------------------------------------------------
 
 
-async def _flush_state() -> None:
-    import time
+def _encode_state(state: dict) -> bytes:
+    """Encode the hub state file (indented JSON; orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(
+            state, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(state, indent=2, default=str, ensure_ascii=False).encode()
 
+
+async def _flush_state() -> None:
     state = {
-        "flushed_at": int(time.time() * 1000),
+        "flushed_at": time.time_ns() // 1_000_000,
         "registry": registry_get_state(),
         "router": router_get_state(),
         "messages": messages_get_state(),
@@ -101,11 +114,11 @@ async def _flush_state() -> None:
 
     state_file = settings.state_file
     tmp_file = state_file.with_suffix(".tmp")
-    content = json.dumps(state, indent=2, default=str)
+    content = _encode_state(state)
 
     try:
         state_file.parent.mkdir(parents=True, exist_ok=True)
-        await asyncio.to_thread(tmp_file.write_text, content)
+        await asyncio.to_thread(tmp_file.write_bytes, content)
         await asyncio.to_thread(tmp_file.rename, state_file)
     except Exception as exc:
         log.warning("hub.flush_failed", metadata={"reason": str(exc)})
@@ -114,12 +127,12 @@ async def _flush_state() -> None:
 async def _restore_state() -> None:
     state_file = settings.state_file
     try:
-        raw = await asyncio.to_thread(state_file.read_text)
+        raw = await asyncio.to_thread(state_file.read_bytes)
     except FileNotFoundError:
         return
 
     try:
-        state = json.loads(raw)
+        state = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except json.JSONDecodeError as exc:
         log.warning("hub.state_parse_failed", metadata={"reason": str(exc)})
         return
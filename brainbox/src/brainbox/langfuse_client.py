@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import base64
+import functools
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import Any
 
 import httpx
 
@@ -18,8 +24,33 @@ _log = get_logger()
 
 _httpx_client: httpx.Client | None = None
 
+# Used to overlap independent GETs (e.g. trace + observations in get_trace)
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="langfuse")
 
-@dataclass(frozen=True)
+_OBSERVATIONS_PAGE_SIZE = 100
+# Stop paginating past this many pages even if the server keeps returning
+# full ones (e.g. it ignores ``page`` and omits ``meta.totalPages``)
+_MAX_OBSERVATION_PAGES = 500
+
+_PREVIEW_MAX_LEN = 200
+
+# Short-lived caches that collapse bursts of identical dashboard polls
+_HEALTH_CACHE_TTL = 10.0  # seconds
+_TRACES_CACHE_TTL = 3.0  # seconds
+_TRACES_CACHE_MAX = 128
+_cache_lock = threading.Lock()
+_health_cache: tuple[float, bool] | None = None  # (ts, healthy)
+_traces_cache: dict[tuple[str, int], tuple[float, list[TraceResult]]] = {}
+
+# Last ETag + parsed body per (path, params) for conditional GETs
+_ETAG_CACHE_MAX = 256
+_etag_cache: dict[tuple[str, tuple], tuple[str, Any]] = {}
+
+# LangFuse ``level`` -> our status; anything other than ERROR is "ok"
+_LEVEL_STATUS = {"ERROR": "error"}
+
+
+@dataclass(frozen=True, slots=True)
 class TraceResult:
     id: str
     name: str
@@ -30,7 +61,7 @@ class TraceResult:
     output: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObservationResult:
     id: str
     trace_id: str
@@ -42,7 +73,7 @@ class ObservationResult:
     level: str = "DEFAULT"  # DEFAULT, DEBUG, WARNING, ERROR
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionSummary:
     session_id: str
     total_traces: int = 0
@@ -58,11 +89,50 @@ class LangfuseError(RuntimeError):
         super().__init__(f"langfuse {operation} failed: {reason}")
 
 
+def _check_status(resp: httpx.Response, operation: str) -> None:
+    """Raise LangfuseError for a non-2xx response."""
+    if not 200 <= resp.status_code < 300:
+        raise LangfuseError(operation, f"HTTP {resp.status_code}")
+
+
+def _get_json(
+    c: httpx.Client, path: str, operation: str, params: dict[str, Any] | None = None
+) -> Any:
+    """GET a JSON resource, revalidating with If-None-Match when an ETag is known.
+
+    A 304 response reuses the previously parsed body; servers that do not send
+    ETags simply get a plain GET.
+    """
+    key = (path, tuple(sorted(params.items())) if params else ())
+    with _cache_lock:
+        cached = _etag_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+
+    resp = c.get(path, params=params, headers=headers)
+    if cached and resp.status_code == 304:
+        return cached[1]
+    _check_status(resp, operation)
+    body = resp.json()
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        with _cache_lock:
+            if len(_etag_cache) >= _ETAG_CACHE_MAX:
+                _etag_cache.clear()
+            _etag_cache[key] = (etag, body)
+    return body
+
+
+@functools.cache
+def _basic_auth(public_key: str, secret_key: str) -> str:
+    """Encode a Basic Auth header value (memoized per key pair)."""
+    encoded = base64.b64encode(f"{public_key}:{secret_key}".encode()).decode()
+    return f"Basic {encoded}"
+
+
 def _auth_header() -> str:
     """Build HTTP Basic Auth header from public_key:secret_key."""
-    creds = f"{settings.langfuse.public_key}:{settings.langfuse.secret_key}"
-    encoded = base64.b64encode(creds.encode()).decode()
-    return f"Basic {encoded}"
+    return _basic_auth(settings.langfuse.public_key, settings.langfuse.secret_key)
 
 
 def _client() -> httpx.Client:
@@ -87,42 +157,71 @@ def _client() -> httpx.Client:
 
 
 def health_check() -> bool:
-    """Check if LangFuse is reachable."""
+    """Check if LangFuse is reachable (cached for a few seconds)."""
+    global _health_cache
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _health_cache
+    if cached and (now - cached[0]) < _HEALTH_CACHE_TTL:
+        return cached[1]
+
     try:
         c = _client()
         resp = c.get("/api/public/health")
-        return resp.status_code == 200
+        healthy = resp.status_code == 200
     except Exception as exc:
         _log.debug("langfuse.health_check_failed", metadata={"reason": str(exc)})
-        return False
+        healthy = False
+
+    with _cache_lock:
+        _health_cache = (now, healthy)
+    return healthy
 
 
 def list_traces(session_id: str, limit: int = 50) -> list[TraceResult]:
-    """List traces for a session."""
+    """List traces for a session (cached briefly per session/limit)."""
+    key = (session_id, limit)
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _traces_cache.get(key)
+    if cached and (now - cached[0]) < _TRACES_CACHE_TTL:
+        return list(cached[1])
+
+    results = _fetch_traces(session_id, limit)
+
+    with _cache_lock:
+        if len(_traces_cache) >= _TRACES_CACHE_MAX:
+            _traces_cache.clear()
+        _traces_cache[key] = (now, results)
+    return list(results)
+
+
+def _fetch_traces(session_id: str, limit: int) -> list[TraceResult]:
+    """Fetch traces for a session from the LangFuse API."""
     try:
         c = _client()
-        resp = c.get(
+        data = _get_json(
+            c,
             "/api/public/traces",
+            "list_traces",
             params={"sessionId": session_id, "limit": limit},
         )
-        resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for t in data.get("data", []):
-            # Determine status from observations or metadata
-            status = "error" if t.get("level") == "ERROR" else "ok"
-            results.append(
-                TraceResult(
-                    id=t["id"],
-                    name=t.get("name", ""),
-                    session_id=t.get("sessionId", session_id),
-                    timestamp=t.get("timestamp", ""),
-                    status=status,
-                    input=_truncate(str(t.get("input", ""))),
-                    output=_truncate(str(t.get("output", ""))),
-                )
+
+        preview = _preview
+        level_status = _LEVEL_STATUS.get
+        # Positional args follow TraceResult field order
+        results = [
+            TraceResult(
+                t["id"],
+                t.get("name", ""),
+                t.get("sessionId", session_id),
+                t.get("timestamp", ""),
+                level_status(t.get("level"), "ok"),
+                preview(t.get("input", "")),
+                preview(t.get("output", "")),
             )
+            for t in data.get("data", [])
+        ]
         return results
     except httpx.HTTPError as exc:
         raise LangfuseError("list_traces", str(exc))
@@ -132,86 +231,114 @@ def get_trace(trace_id: str) -> tuple[TraceResult, list[ObservationResult]]:
     """Get a single trace with its observations."""
     try:
         c = _client()
-        trace_resp = c.get(f"/api/public/traces/{trace_id}")
-        trace_resp.raise_for_status()
-        t = trace_resp.json()
-
-        obs_resp = c.get(
+        # The two requests are independent — fetch observations on the pool
+        # while the trace itself is fetched on the calling thread.
+        obs_future = _executor.submit(
+            _get_json,
+            c,
             "/api/public/observations",
+            "get_trace",
             params={"traceId": trace_id, "limit": 100},
         )
-        obs_resp.raise_for_status()
-        obs_data = obs_resp.json()
+        t = _get_json(c, f"/api/public/traces/{trace_id}", "get_trace")
+        obs_data = obs_future.result()
 
-        status = "error" if t.get("level") == "ERROR" else "ok"
+        status = _LEVEL_STATUS.get(t.get("level"), "ok")
         trace = TraceResult(
             id=t["id"],
             name=t.get("name", ""),
             session_id=t.get("sessionId", ""),
             timestamp=t.get("timestamp", ""),
             status=status,
-            input=_truncate(str(t.get("input", ""))),
-            output=_truncate(str(t.get("output", ""))),
+            input=_preview(t.get("input", "")),
+            output=_preview(t.get("output", "")),
         )
 
-        observations = []
-        for o in obs_data.get("data", []):
-            observations.append(
-                ObservationResult(
-                    id=o["id"],
-                    trace_id=trace_id,
-                    name=o.get("name", ""),
-                    type=o.get("type", "SPAN"),
-                    start_time=o.get("startTime", ""),
-                    end_time=o.get("endTime", ""),
-                    status="error" if o.get("level") == "ERROR" else "ok",
-                    level=o.get("level", "DEFAULT"),
-                )
+        level_status = _LEVEL_STATUS.get
+        # Positional args follow ObservationResult field order
+        observations = [
+            ObservationResult(
+                o["id"],
+                trace_id,
+                o.get("name", ""),
+                o.get("type", "SPAN"),
+                o.get("startTime", ""),
+                o.get("endTime", ""),
+                level_status(level := o.get("level", "DEFAULT"), "ok"),
+                level,
             )
+            for o in obs_data.get("data", [])
+        ]
         return trace, observations
     except httpx.HTTPError as exc:
         raise LangfuseError("get_trace", str(exc))
 
 
+def _fetch_observation_page(c: httpx.Client, session_id: str, page: int) -> dict:
+    """Fetch one page of observations for a session."""
+    return _get_json(
+        c,
+        "/api/public/observations",
+        "get_session_traces_summary",
+        params={"sessionId": session_id, "limit": _OBSERVATIONS_PAGE_SIZE, "page": page},
+    )
+
+
+def _iter_session_observation_pages(c: httpx.Client, session_id: str):
+    """Yield each page of observations for a session.
+
+    While the caller aggregates page N, page N+1 is already being fetched on
+    the module executor.
+    """
+    page = 1
+    body = _fetch_observation_page(c, session_id, page)
+    prev_first_id = None
+    while True:
+        data = body.get("data", [])
+        first_id = data[0].get("id") if data else None
+        if first_id is not None and first_id == prev_first_id:
+            return  # the server ignored ``page`` and sent the previous page again
+        prev_first_id = first_id
+        total_pages = body.get("meta", {}).get("totalPages")
+        has_more = (
+            len(data) >= _OBSERVATIONS_PAGE_SIZE
+            and (total_pages is None or page < total_pages)
+            and page < _MAX_OBSERVATION_PAGES
+        )
+        next_page = (
+            _executor.submit(_fetch_observation_page, c, session_id, page + 1) if has_more else None
+        )
+        yield data
+
+        if next_page is None:
+            return
+        page += 1
+        body = next_page.result()
+
+
 def get_session_traces_summary(session_id: str) -> SessionSummary:
     """Aggregate trace/observation counts for a session.
 
-    Optimized to batch-fetch all observations in a single API call instead of
-    N+1 queries (one per trace).
+    Observations are streamed page by page using the server-side ``sessionId``
+    filter, so large sessions are neither truncated nor loaded into memory at
+    once.
     """
     try:
         traces = list_traces(session_id, limit=100)
         total_traces = len(traces)
         error_count = sum(1 for t in traces if t.status == "error")
 
-        # Build a set of trace IDs for filtering observations
-        trace_ids = {t.id for t in traces}
-
-        # Batch-fetch ALL observations for the session in a single API call
-        tool_counts: dict[str, int] = {}
+        tool_counts: Counter[str] = Counter()
         total_observations = 0
 
         c = _client()
         try:
-            # Fetch all observations for this session (single API call)
-            obs_resp = c.get(
-                "/api/public/observations",
-                params={"sessionId": session_id, "limit": 1000},
-            )
-            obs_resp.raise_for_status()
-            obs_data = obs_resp.json()
-
-            # Process observations, filtering to only those in our trace set
-            for o in obs_data.get("data", []):
-                # Only count observations that belong to the traces we fetched
-                if o.get("traceId") in trace_ids:
-                    total_observations += 1
-                    name = o.get("name", "unknown")
-                    tool_counts[name] = tool_counts.get(name, 0) + 1
-                    if o.get("level") == "ERROR":
-                        error_count += 1
+            for data in _iter_session_observation_pages(c, session_id):
+                total_observations += len(data)
+                tool_counts.update(o.get("name", "unknown") for o in data)
+                error_count += sum(1 for o in data if o.get("level") == "ERROR")
         except Exception as exc:
-            # If batch fetch fails, return partial data from traces
+            # If a page fetch fails, return the partial counts gathered so far
             _log.debug("langfuse.batch_observations_failed", metadata={"reason": str(exc)})
 
         return SessionSummary(
@@ -219,7 +346,7 @@ def get_session_traces_summary(session_id: str) -> SessionSummary:
             total_traces=total_traces,
             total_observations=total_observations,
             error_count=error_count,
-            tool_counts=tool_counts,
+            tool_counts=dict(tool_counts),
         )
     except LangfuseError:
         raise
@@ -227,8 +354,11 @@ def get_session_traces_summary(session_id: str) -> SessionSummary:
         raise LangfuseError("get_session_traces_summary", str(exc))
 
 
-def _truncate(s: str, max_len: int = 200) -> str:
+def _truncate(s: str, max_len: int = _PREVIEW_MAX_LEN) -> str:
     """Truncate a string for preview display."""
-    if len(s) <= max_len:
-        return s
-    return s[:max_len] + "..."
+    return s if len(s) <= max_len else s[:max_len] + "..."
+
+
+def _preview(value: object) -> str:
+    """Truncated preview of a trace input/output, skipping str() for strings."""
+    return _truncate(value if type(value) is str else str(value))
@@ -8,37 +8,64 @@ from __future__ import annotations
 
 import asyncio
 import json
+import operator
 import os
+import re
 import stat
 import subprocess
+import threading
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any
-
-import docker
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup: brainbox[fast]
+    orjson = None
+
 from .config import settings
-from .cosign import CosignVerificationError, verify_image, verify_image_keyless
+from .cosign import CosignResult, CosignVerificationError, verify_image, verify_image_keyless
 from .hardening import get_hardening_kwargs, get_legacy_kwargs
 from .log import get_logger
 from .models import SessionContext, SessionState, Token
 
+if TYPE_CHECKING:
+    import docker
+
 # ---------------------------------------------------------------------------
 # Module state
 # ---------------------------------------------------------------------------
 
 _client: docker.DockerClient | None = None
 _sessions: dict[str, SessionContext] = {}
-_executor = ThreadPoolExecutor(max_workers=4)
+# Writes go through _register_session/_unregister_session so the cached
+# list_sessions() snapshot is dropped on every membership change
+_sessions_lock = threading.RLock()
+_sessions_snapshot: tuple[SessionContext, ...] | None = None
+# Docker SDK calls and cosign subprocesses can block for seconds; keep them
+# off the pool used for quick local file reads so bursts of provisions don't
+# starve each other.  Sized to docker-py's default connection pool (10).
+_docker_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="bb-docker")
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bb-io")
 
 log = get_logger()
 
+# orjson parses bytes directly (no intermediate str); its JSONDecodeError
+# subclasses json.JSONDecodeError so callers catch either.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 def _docker() -> docker.DockerClient:
     global _client
     if _client is None:
+        # Imported lazily: docker pulls in requests/urllib3/websocket, which
+        # session-lookup code paths never need
+        import docker
+
         macos_sock = Path.home() / ".docker" / "run" / "docker.sock"
         if macos_sock.is_socket():
             _client = docker.DockerClient(base_url=f"unix://{macos_sock}")
@@ -47,15 +74,16 @@ def _docker() -> docker.DockerClient:
     return _client
 
 
-async def _run(fn: Any, *args: Any, **kwargs: Any) -> Any:
-    """Run a blocking function in the thread pool."""
+async def _run_docker(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking Docker/cosign call in the Docker thread pool."""
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(_executor, lambda: fn(*args, **kwargs))
+    return await loop.run_in_executor(_docker_executor, lambda: fn(*args, **kwargs))
 
 
-def _load_cache_env_text(cache_env: Path) -> str:
-    """Read cache env file text synchronously."""
-    return cache_env.read_text()
+async def _run_io(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking local file-system helper in the I/O thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, lambda: fn(*args, **kwargs))
 
 
 # ---------------------------------------------------------------------------
@@ -63,8 +91,37 @@ def _load_cache_env_text(cache_env: Path) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _stat_mode(path: str | os.PathLike[str]) -> int | None:
+    """Return ``st_mode`` for *path*, or None if it cannot be stat'ed.
+
+    One ``os.stat`` answers both the exists and the dir/file question, without
+    the ``Path`` method dispatch of ``is_dir()`` / ``is_file()``.
+    """
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def _stat_mtime_ns(path: str | os.PathLike[str]) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, ValueError):
+        return None
+
+
+def _is_dir(path: str | os.PathLike[str]) -> bool:
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISDIR(mode)
+
+
+def _is_file(path: str | os.PathLike[str]) -> bool:
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISREG(mode)
+
+
 def _resolve_dir(
-    env_vars: list[str],
+    env_vars: list[str] | tuple[str, ...],
     fallback: Path,
     *,
     use_parent: bool = False,
@@ -82,72 +139,147 @@ def _resolve_dir(
     for var in env_vars:
         val = env_source.get(var)
         if val:
-            candidate = Path(val).parent if use_parent else Path(val)
-            if candidate.is_dir():
+            if not use_parent:
+                if _is_dir(val):
+                    return Path(val)
+                continue
+            candidate = Path(val).parent
+            if _is_dir(candidate):
                 return candidate
-    if fallback.is_dir():
+    if _is_dir(fallback):
         return fallback
     return None
 
 
-def _read_cache_vars(
-    workspace_profile: str,
-    workspace_home: str,
-) -> dict[str, str]:
-    """Read the volatile cache for a profile and return resolved env vars.
+def _profile_cache_env(workspace_profile: str) -> Path:
+    """Path of the volatile shell-profiler cache for a profile."""
+    tmpdir = os.environ.get("TMPDIR", "/tmp")
+    return Path(tmpdir) / "sp-profiles" / workspace_profile / ".env"
 
-    Expands ``$WORKSPACE_HOME`` references to the provided host path
-    and strips surrounding quotes from values.
+
+def _read_env_bytes(path: Path) -> bytes:
+    """Read a small env file in one ``os.read`` call, without decoding it."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+# One pass over a stripped ``[export ]NAME=VALUE`` line: name, then the value
+# with one pair of matching surrounding quotes removed
+_ENV_LINE_RE = re.compile(rb"""(?:export )?\s*([^=]*?)\s*=\s*(?:"(.*)"|'(.*)'|(.*))""", re.DOTALL)
+
+# Parsed profile .env files: path -> ((mtime_ns, size), vars, container env).
+# _read_cache_vars (provision) and _resolve_profile_env (start) read the same
+# file, so one parse serves both until the file changes.
+_env_parse_cache: dict[str, tuple[tuple[int, int], dict[str, str], str]] = {}
+
+
+def _parse_profile_cache(cache_env: Path) -> tuple[dict[str, str], str] | None:
+    """Parse a profile .env once into both of its views.
+
+    Returns ``(vars, container_env)`` where *vars* maps names to unquoted
+    values (``$WORKSPACE_HOME`` left unexpanded) and *container_env* is the
+    file's assignment lines minus host-only vars.  Returns None when the file
+    is missing or unreadable.
     """
-    tmpdir = os.environ.get("TMPDIR", "/tmp")
-    cache_env = Path(tmpdir) / "sp-profiles" / workspace_profile / ".env"
-    if not cache_env.is_file():
-        return {}
+    try:
+        st = os.stat(cache_env)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
 
     # Warn if cache file is world-readable and enforce 0o600 permissions
-    try:
-        mode = cache_env.stat().st_mode
-        if mode & stat.S_IROTH:
-            slog = get_logger()
-            slog.warning(
-                "lifecycle.profile_cache_world_readable",
-                metadata={"path": str(cache_env), "mode": oct(mode)},
-            )
+    if st.st_mode & stat.S_IROTH:
+        slog = get_logger()
+        slog.warning(
+            "lifecycle.profile_cache_world_readable",
+            metadata={"path": str(cache_env), "mode": oct(st.st_mode)},
+        )
+        try:
             cache_env.chmod(0o600)
+        except OSError:
+            pass
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _env_parse_cache.get(str(cache_env))
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+
+    try:
+        data = _read_env_bytes(cache_env)
     except OSError:
-        pass
+        return None
 
-    result: dict[str, str] = {}
-    for raw_line in _load_cache_env_text(cache_env).splitlines():
+    # Parse on bytes; only the surviving names/values are decoded
+    env_vars: dict[str, str] = {}
+    lines: list[bytes] = []
+    host_only = _HOST_ONLY_VARS_BYTES
+    for raw_line in data.splitlines():
         stripped = raw_line.strip()
-        if not stripped or stripped.startswith("#"):
+        if not stripped or stripped.startswith(b"#"):
             continue
-        if stripped.startswith("export "):
-            stripped = stripped[7:]
-        name, _, value = stripped.partition("=")
-        name = name.strip()
-        value = value.strip()
-        if not name or not value:
+        m = _ENV_LINE_RE.fullmatch(stripped)
+        if m is None:
+            # Not an assignment: no var to record, but pass it through
+            if stripped.removeprefix(b"export ").strip() not in host_only:
+                lines.append(stripped)
+            continue
+        name = m[1]
+        if name not in host_only:
+            lines.append(stripped)
+        # Group 2/3 hold a quoted value (possibly empty), group 4 a bare one
+        value = m[m.lastindex]
+        if not name or (m.lastindex == 4 and not value):
             continue
-        # Strip surrounding quotes
-        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-            value = value[1:-1]
-        # Expand $WORKSPACE_HOME to actual host path
-        value = value.replace("$WORKSPACE_HOME", workspace_home)
-        result[name] = value
-    return result
+        env_vars[name.decode()] = value.decode()
+
+    container_env = b"\n".join(lines).decode()
+    _env_parse_cache[str(cache_env)] = (key, env_vars, container_env)
+    return env_vars, container_env
+
+
+def _read_cache_vars(
+    workspace_profile: str,
+    workspace_home: str,
+) -> dict[str, str]:
+    """Read the volatile cache for a profile and return resolved env vars.
+
+    Expands ``$WORKSPACE_HOME`` references to the provided host path
+    and strips surrounding quotes from values.
+    """
+    parsed = _parse_profile_cache(_profile_cache_env(workspace_profile))
+    if parsed is None:
+        return {}
+    # Expand $WORKSPACE_HOME to actual host path
+    return {
+        name: value.replace("$WORKSPACE_HOME", workspace_home) for name, value in parsed[0].items()
+    }
 
 
 def _compute_mount_context(
     workspace_profile: str | None,
     workspace_home: str | None,
+    *,
+    real_home: Path | None = None,
+    environ: dict[str, str] | None = None,
 ) -> dict:
     """Compute the path and env-override context needed for mount resolution.
 
-    Returns a dict with keys: ``home``, ``ws_path``, ``env_override``,
-    ``workspace_home``, and ``use_env_vars`` (bool — whether env-var names
-    should be consulted when locating credential directories).
+    *real_home* and *environ* are the caller's snapshot of ``Path.home()`` and
+    the relevant process env vars; both are taken here when omitted.
+
+    Returns a dict with keys: ``home``, ``real_home``, ``ws_path``,
+    ``env_override``, ``workspace_home``, and ``use_env_vars`` (bool — whether
+    env-var names should be consulted when locating credential directories).
     """
+    if real_home is None:
+        real_home = Path.home()
+    if environ is None:
+        environ = _mount_environ()
+
     if workspace_home:
         ws_path = Path(workspace_home)
         home = ws_path
@@ -157,16 +289,18 @@ def _compute_mount_context(
             cache_vars = {}
         use_env = bool(cache_vars)
     else:
-        home = Path.home()
-        ws = os.environ.get("WORKSPACE_HOME", "")
+        home = real_home
+        ws = environ.get("WORKSPACE_HOME", "")
         ws_path = Path(ws) if ws else home
         cache_vars = {}
         use_env = True
 
-    env_override = cache_vars if cache_vars else None
+    # Without a profile cache, env lookups read the snapshot, not os.environ
+    env_override = cache_vars if cache_vars else environ
 
     return {
         "home": home,
+        "real_home": real_home,
         "ws_path": ws_path,
         "env_override": env_override,
         "workspace_home": workspace_home,
@@ -174,126 +308,107 @@ def _compute_mount_context(
     }
 
 
+# Credential / config mounts, in resolution order:
+# (name, env vars naming the host path, fallback base ("home" or "ws"),
+#  fallback path under that base, env var value is a file whose parent is mounted)
+# ``name`` matches the ``settings.profile.mount_<name>`` toggle.
+_MOUNT_SPECS: tuple[tuple[str, tuple[str, ...], str, str, bool], ...] = (
+    ("aws", ("AWS_CONFIG_FILE", "AWS_SHARED_CREDENTIALS_FILE"), "home", ".aws", True),
+    ("azure", ("AZURE_CONFIG_DIR",), "home", ".azure", False),
+    ("kube", ("KUBECONFIG",), "home", ".kube", True),
+    # ssh prefers ws_path/.ssh and falls back to the real home
+    ("ssh", (), "ws", ".ssh", False),
+    ("gitconfig", ("GIT_CONFIG_GLOBAL",), "ws", ".gitconfig", False),
+    ("gcloud", ("CLOUDSDK_CONFIG",), "home", ".gcloud", False),
+    ("terraform", ("TF_CLI_CONFIG_FILE",), "home", ".terraform.d", True),
+)
+
+_CONTAINER_TARGETS: dict[str, str] = {
+    "aws": "/home/developer/.aws",
+    "azure": "/home/developer/.azure",
+    "kube": "/home/developer/.kube",
+    "ssh": "/home/developer/.ssh",
+    "gitconfig": "/home/developer/.gitconfig",
+    "gcloud": "/home/developer/.gcloud",
+    "terraform": "/home/developer/.terraform.d",
+}
+_BIND_TO_NAME: dict[str, str] = {target: name for name, target in _CONTAINER_TARGETS.items()}
+
+# Credential mounts default to read-only to prevent containers
+# from modifying host credentials.  Gitconfig stays rw so git can
+# write commit metadata.
+_RW_MOUNTS = frozenset({"gitconfig"})
+
+
 def _build_volume_map(env_vars: dict) -> dict[str, dict[str, str]]:
     """Translate the env context into a host-path → volume-spec mount map."""
     home: Path = env_vars["home"]
     ws_path: Path = env_vars["ws_path"]
+    real_home: Path = env_vars["real_home"]
     env_override: dict[str, str] | None = env_vars["env_override"]
     workspace_home: str | None = env_vars["workspace_home"]
     use_env_vars: bool = env_vars["use_env_vars"]
 
+    # Read every toggle off the settings model once, up front
     p = settings.profile
-
-    mount_specs: list[tuple[bool, str, list[str], Path, bool]] = [
-        # (enabled, name, mount_env_vars, fallback, use_parent)
-        (
-            p.mount_aws,
-            "aws",
-            ["AWS_CONFIG_FILE", "AWS_SHARED_CREDENTIALS_FILE"] if use_env_vars else [],
-            home / ".aws",
-            True,
-        ),
-        (
-            p.mount_azure,
-            "azure",
-            ["AZURE_CONFIG_DIR"] if use_env_vars else [],
-            home / ".azure",
-            False,
-        ),
-        (
-            p.mount_kube,
-            "kube",
-            ["KUBECONFIG"] if use_env_vars else [],
-            home / ".kube",
-            True,
-        ),
-        (
-            p.mount_ssh,
-            "ssh",
-            [],
-            ws_path / ".ssh" if (ws_path / ".ssh").is_dir() else Path.home() / ".ssh",
-            False,
-        ),
-        (
-            p.mount_gitconfig,
-            "gitconfig",
-            ["GIT_CONFIG_GLOBAL"] if use_env_vars else [],
-            ws_path / ".gitconfig",
-            False,
-        ),
-        (
-            p.mount_gcloud,
-            "gcloud",
-            ["CLOUDSDK_CONFIG"] if use_env_vars else [],
-            home / ".gcloud",
-            False,
-        ),
-        (
-            p.mount_terraform,
-            "terraform",
-            ["TF_CLI_CONFIG_FILE"] if use_env_vars else [],
-            home / ".terraform.d",
-            True,
-        ),
-    ]
-
-    container_targets = {
-        "aws": "/home/developer/.aws",
-        "azure": "/home/developer/.azure",
-        "kube": "/home/developer/.kube",
-        "ssh": "/home/developer/.ssh",
-        "gitconfig": "/home/developer/.gitconfig",
-        "gcloud": "/home/developer/.gcloud",
-        "terraform": "/home/developer/.terraform.d",
+    enabled = {
+        "aws": p.mount_aws,
+        "azure": p.mount_azure,
+        "kube": p.mount_kube,
+        "ssh": p.mount_ssh,
+        "gitconfig": p.mount_gitconfig,
+        "gcloud": p.mount_gcloud,
+        "terraform": p.mount_terraform,
     }
-
-    # Credential mounts default to read-only to prevent containers
-    # from modifying host credentials.  Gitconfig stays rw so git can
-    # write commit metadata.
-    _RW_MOUNTS = {"gitconfig"}
-
+    mount_reflex = p.mount_reflex
+    env_source = env_override if env_override is not None else os.environ
     mounts: dict[str, dict[str, str]] = {}
 
-    for enabled, name, mount_env_vars, fallback, use_parent in mount_specs:
-        if not enabled:
+    for name, spec_env_vars, base, suffix, use_parent in _MOUNT_SPECS:
+        if not enabled[name]:
             continue
+        mount_env_vars = spec_env_vars if use_env_vars else ()
+        if name == "ssh":
+            ws_ssh = ws_path / suffix
+            fallback = ws_ssh if _is_dir(ws_ssh) else real_home / suffix
+        else:
+            fallback = (ws_path if base == "ws" else home) / suffix
         mode = "rw" if name in _RW_MOUNTS else "ro"
         # gitconfig is a file mount, not a directory
         if name == "gitconfig":
             found = None
-            env_source = env_override if env_override is not None else os.environ
             for var in mount_env_vars:
                 val = env_source.get(var)
-                if val and Path(val).is_file():
+                if val and _is_file(val):
                     found = Path(val)
                     break
-            if found is None and fallback.is_file():
+            if found is None and _is_file(fallback):
                 found = fallback
             if found is not None:
-                mounts[str(found)] = {"bind": container_targets[name], "mode": mode}
+                mounts[str(found)] = {"bind": _CONTAINER_TARGETS[name], "mode": mode}
         else:
             host_dir = _resolve_dir(
                 mount_env_vars, fallback, use_parent=use_parent, env_override=env_override
             )
             if host_dir is not None:
-                mounts[str(host_dir)] = {"bind": container_targets[name], "mode": mode}
+                mounts[str(host_dir)] = {"bind": _CONTAINER_TARGETS[name], "mode": mode}
 
     # Claude config is delivered via config bundle at provision time (not bind mount)
     # so we do NOT add a staging mount here.
 
     # Reflex share dir: mount so hooks/skills inside the container can invoke
     # the same reflex runtime that the host uses.
-    if p.mount_reflex:
+    if mount_reflex:
         reflex_path = Path(p.reflex_share_path)
-        if reflex_path.is_dir():
+        if _is_dir(reflex_path):
             mounts[str(reflex_path)] = {"bind": str(reflex_path), "mode": "ro"}
 
     # When workspace_home differs from the real home, AWS SSO tokens live in
     # the real $HOME/.aws/sso/cache/ (aws sso login always writes there).
     # Add a nested bind mount so the container sees live tokens.
-    if workspace_home and p.mount_aws:
-        real_sso_cache = Path.home() / ".aws" / "sso" / "cache"
-        if real_sso_cache.is_dir():
+    if workspace_home and enabled["aws"]:
+        real_sso_cache = real_home / ".aws" / "sso" / "cache"
+        if _is_dir(real_sso_cache):
             mounts[str(real_sso_cache)] = {
                 "bind": "/home/developer/.aws/sso/cache",
                 "mode": "rw",
@@ -316,8 +431,90 @@ def _resolve_profile_mounts(
 
     Returns a dict of host_path → {"bind": container_path, "mode": "rw"}.
     """
-    env_vars = _compute_mount_context(workspace_profile, workspace_home)
-    return _build_volume_map(env_vars)
+    # One home lookup (a passwd read when $HOME is unset) and one env snapshot
+    # serve both the cache key and the resolution itself
+    real_home = Path.home()
+    environ = _mount_environ()
+    key = _profile_mounts_key(workspace_profile, workspace_home, real_home, environ)
+    now = time.monotonic()
+    cached = _mount_cache.get(key)
+    if cached is None or (now - cached[0]) >= _MOUNT_CACHE_TTL:
+        env_vars = _compute_mount_context(
+            workspace_profile, workspace_home, real_home=real_home, environ=environ
+        )
+        cached = (now, _build_volume_map(env_vars))
+        _mount_cache[key] = cached
+    # Callers merge these into their own volume dicts — hand out copies
+    return {host: dict(spec) for host, spec in cached[1].items()}
+
+
+# Memoized _resolve_profile_mounts results.  Keys cover everything resolution
+# reads (profile cache mtime, home, relevant env vars, mount settings); the TTL
+# bounds how long a newly created credential directory can go unnoticed.
+_MOUNT_CACHE_TTL = 30.0  # seconds
+_mount_cache: dict[tuple, tuple[float, dict[str, dict[str, str]]]] = {}
+
+# Env vars consulted while resolving mounts
+_MOUNT_ENV_KEYS = (
+    "WORKSPACE_HOME",
+    "TMPDIR",
+    "AWS_CONFIG_FILE",
+    "AWS_SHARED_CREDENTIALS_FILE",
+    "AZURE_CONFIG_DIR",
+    "KUBECONFIG",
+    "GIT_CONFIG_GLOBAL",
+    "CLOUDSDK_CONFIG",
+    "TF_CLI_CONFIG_FILE",
+)
+
+# ProfileSettings fields _build_volume_map reads
+_MOUNT_SETTING_FIELDS = (
+    "mount_aws",
+    "mount_azure",
+    "mount_kube",
+    "mount_ssh",
+    "mount_gitconfig",
+    "mount_gcloud",
+    "mount_terraform",
+    "mount_reflex",
+    "reflex_share_path",
+)
+
+
+def _mount_environ() -> dict[str, str]:
+    """Snapshot the process env vars that mount resolution reads."""
+    environ = os.environ
+    return {var: environ[var] for var in _MOUNT_ENV_KEYS if var in environ}
+
+
+def _profile_mounts_key(
+    workspace_profile: str | None,
+    workspace_home: str | None,
+    real_home: Path,
+    environ: dict[str, str],
+) -> tuple:
+    """Cache key for _resolve_profile_mounts; changes whenever its inputs do."""
+    profile = settings.profile
+    cache_mtime: int | None = None
+    if workspace_profile and workspace_home:
+        try:
+            cache_mtime = _profile_cache_env(workspace_profile).stat().st_mtime_ns
+        except OSError:
+            pass
+    return (
+        workspace_profile,
+        workspace_home,
+        cache_mtime,
+        str(real_home),
+        tuple(environ.get(var) for var in _MOUNT_ENV_KEYS),
+        tuple(getattr(profile, field) for field in _MOUNT_SETTING_FIELDS),
+    )
+
+
+def _invalidate_profile_cache() -> None:
+    """Drop memoized profile mount resolutions and parsed profile .env files."""
+    _mount_cache.clear()
+    _env_parse_cache.clear()
 
 
 # Vars that are host-specific and should not be forwarded into containers
@@ -343,6 +540,7 @@ _HOST_ONLY_VARS = frozenset(
         "GEMINI_CONFIG_DIR",
     }
 )
+_HOST_ONLY_VARS_BYTES = frozenset(v.encode() for v in _HOST_ONLY_VARS)
 
 
 def _resolve_profile_env(
@@ -365,87 +563,74 @@ def _resolve_profile_env(
         return None
 
     # Try tmpdir cache (works when API runs on host)
-    tmpdir = os.environ.get("TMPDIR", "/tmp")
-    cache_env = Path(tmpdir) / "sp-profiles" / profile / ".env"
+    cache_env = _profile_cache_env(profile)
 
     # When running in Docker, the host TMPDIR is mounted at /host-sp-profiles
-    if not cache_env.is_file():
+    if not _is_file(cache_env):
         cache_env = Path("/host-sp-profiles") / profile / ".env"
 
     # Last resort: workspace_home/.env (unrendered but better than nothing)
-    if not cache_env.is_file() and workspace_home:
+    if not _is_file(cache_env) and workspace_home:
         cache_env = Path(workspace_home) / ".env"
 
-    if not cache_env.is_file():
+    parsed = _parse_profile_cache(cache_env)
+    if parsed is None:
         return None
 
-    # Warn if cache file is world-readable and enforce 0o600 permissions
-    try:
-        mode = cache_env.stat().st_mode
-        if mode & stat.S_IROTH:
-            slog = get_logger()
-            slog.warning(
-                "lifecycle.profile_cache_world_readable",
-                metadata={"path": str(cache_env), "mode": oct(mode)},
-            )
-            cache_env.chmod(0o600)
-    except OSError:
-        pass
-
-    lines: list[str] = []
     # Prepend workspace identity
-    lines.append(f"WORKSPACE_PROFILE={profile}")
-    lines.append("WORKSPACE_HOME=/home/developer")
+    header = f"WORKSPACE_PROFILE={profile}\nWORKSPACE_HOME=/home/developer"
+    body = parsed[1]
+    return f"{header}\n{body}" if body else header
 
-    try:
-        for raw_line in _load_cache_env_text(cache_env).splitlines():
-            stripped = raw_line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            # Extract var name (handle KEY=VALUE and export KEY=VALUE)
-            assignment = stripped
-            if assignment.startswith("export "):
-                assignment = assignment[7:]
-            var_name = assignment.split("=", 1)[0].strip()
-            if var_name in _HOST_ONLY_VARS:
-                continue
-            # Rewrite $WORKSPACE_HOME references (already handled by sourcing)
-            lines.append(stripped)
-    except OSError:
-        return None
 
-    return "\n".join(lines)
+# (path, mtime_ns, size) -> oauthAccount, so .claude.json is only re-parsed
+# when Claude Code rewrites it
+_oauth_cache: tuple[tuple[str, int, int], dict[str, str] | None] | None = None
 
 
 def _resolve_oauth_account() -> dict[str, str] | None:
     """Read oauthAccount from the host's .claude.json for container auth."""
+    global _oauth_cache
     config_dir = os.environ.get("CLAUDE_CONFIG_DIR", str(Path.home() / ".claude"))
     claude_json = Path(config_dir) / ".claude.json"
-    if not claude_json.is_file():
+    try:
+        st = claude_json.stat()
+    except OSError:
         return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    key = (str(claude_json), st.st_mtime_ns, st.st_size)
+    cached = _oauth_cache
+    if cached is not None and cached[0] == key:
+        return dict(cached[1]) if cached[1] is not None else None
+
+    acct: dict[str, str] | None = None
     try:
-        data = json.loads(claude_json.read_text())
-        acct = data.get("oauthAccount")
-        if isinstance(acct, dict) and "accountUuid" in acct:
-            return acct
+        data = _json_loads(claude_json.read_bytes())
+        candidate = data.get("oauthAccount")
+        if isinstance(candidate, dict) and "accountUuid" in candidate:
+            acct = candidate
     except (OSError, json.JSONDecodeError):
         pass
-    return None
+    _oauth_cache = (key, acct)
+    return dict(acct) if acct is not None else None
 
 
 def _find_available_port(start: int = 7681) -> int:
-    """Scan running containers to find a free host port."""
+    """Scan running containers to find a free host port.
+
+    Uses the low-level list endpoint, which reports published ports inline,
+    instead of ``containers.list()`` which inspects every container.
+    """
     client = _docker()
     try:
-        containers = client.containers.list()
-        used: set[int] = set()
-        for c in containers:
-            ports = c.attrs.get("NetworkSettings", {}).get("Ports") or {}
-            for bindings in ports.values():
-                if bindings:
-                    for b in bindings:
-                        if b.get("HostPort"):
-                            used.add(int(b["HostPort"]))
+        used = {
+            p["PublicPort"]
+            for c in client.api.containers()
+            for p in c.get("Ports") or ()
+            if p.get("PublicPort")
+        }
         port = start
         while port in used:
             port += 1
@@ -470,6 +655,14 @@ def _docker_is_local(docker_host: str | None = None) -> bool:
 # ---------------------------------------------------------------------------
 
 
+# Successful verifications keyed by (image, digests, method, key/identity).
+# Repo digests are content-addressed, so a verified digest stays verified; the
+# TTL only bounds how long a revoked signature or rotated key goes unnoticed.
+# Failures are never cached.
+_COSIGN_CACHE_TTL = 600.0  # seconds
+_cosign_cache: dict[tuple, tuple[float, CosignResult]] = {}
+
+
 async def _verify_cosign(image: Any, image_name: str, slog: Any) -> None:
     """Run cosign signature verification according to configured mode.
 
@@ -527,13 +720,26 @@ async def _verify_cosign(image: Any, image_name: str, slog: Any) -> None:
         )
         return
 
-    # Run cosign verify
+    # Run cosign verify (unless this exact digest set was verified recently)
     if use_keyless:
-        result = await _run(
-            verify_image_keyless, image_name, cert_identity, oidc_issuer, repo_digests
-        )
+        cache_key = (image_name, tuple(sorted(repo_digests)), "keyless", cert_identity, oidc_issuer)
+    else:
+        # Include the key file's mtime so replacing the key forces a re-verify
+        key_mtime = _stat_mtime_ns(key_path)
+        cache_key = (image_name, tuple(sorted(repo_digests)), "key", key_path, key_mtime)
+    now = time.monotonic()
+    cached = _cosign_cache.get(cache_key)
+    if cached is not None and (now - cached[0]) < _COSIGN_CACHE_TTL:
+        result = cached[1]
     else:
-        result = await _run(verify_image, image_name, key_path, repo_digests)
+        if use_keyless:
+            result = await _run_docker(
+                verify_image_keyless, image_name, cert_identity, oidc_issuer, repo_digests
+            )
+        else:
+            result = await _run_docker(verify_image, image_name, key_path, repo_digests)
+        if result.verified:
+            _cosign_cache[cache_key] = (now, result)
 
     if result.verified:
         slog.info(
@@ -585,7 +791,10 @@ async def provision(
     resolved_ttl = ttl if ttl is not None else settings.ttl
     resolved_workspace_profile = workspace_profile or os.environ.get("WORKSPACE_PROFILE")
 
+    slog = get_logger(session_name=session_name, container_name=container_name)
+
     # Determine image/template based on backend
+    image = None
     if backend == "utm":
         image_or_template = vm_template or settings.utm.default_template
         # UTM uses SSH port, not web terminal port
@@ -593,7 +802,22 @@ async def provision(
     else:
         # Single unified image — role is injected as BRAINBOX_ROLE env var
         image_or_template = settings.image or "ghcr.io/neverprepared/brainbox:latest"
-        resolved_port = port or _find_available_port()
+        if backend == "docker":
+            # The image inspect (needed for cosign) and the free-port scan are
+            # independent daemon round trips — issue them together.
+            client = _docker()
+            lookups = [_run_docker(client.images.get, image_or_template)]
+            if not port:
+                lookups.append(_run_docker(_find_available_port))
+            try:
+                found = await asyncio.gather(*lookups)
+            except Exception as exc:
+                slog.error("container.provision_failed", metadata={"reason": str(exc)})
+                raise
+            image = found[0]
+            resolved_port = port or found[1]
+        else:
+            resolved_port = port or await _run_docker(_find_available_port)
 
     # Resolve role prompt and teams configuration
     from .registry import get_agent
@@ -630,64 +854,65 @@ async def provision(
         docker_host=docker_host,
     )
 
-    slog = get_logger(session_name=session_name, container_name=container_name)
-
-    # Docker-only: cosign verification
-    if backend == "docker":
-        client = _docker()
-        try:
-            image = await _run(client.images.get, image_or_template)
-        except Exception as exc:
-            slog.error("container.provision_failed", metadata={"reason": str(exc)})
-            raise
-
-        # Cosign image signature verification
-        await _verify_cosign(image, image_or_template, slog)
-
-    # Session data volume (Docker and UTM)
-    session_data_dir = settings.sessions_dir / session_name
-    session_data_dir.mkdir(parents=True, exist_ok=True)
-    volumes = {str(session_data_dir): {"bind": "/home/developer/.claude/projects", "mode": "rw"}}
-
-    # User-specified volume mounts
-    for vol in ctx.volume_mounts:
-        parts = vol.split(":")
-        if len(parts) >= 2:
-            host_path = parts[0]
-            container_path = parts[1]
-            mode = parts[2] if len(parts) > 2 else "rw"
-            volumes[host_path] = {"bind": container_path, "mode": mode}
-
-    # Profile credential / config mounts (Docker only for now)
-    if backend == "docker":
-        profile_mounts = _resolve_profile_mounts(
-            workspace_profile=resolved_workspace_profile,
-            workspace_home=workspace_home,
-        )
-        volumes.update(profile_mounts)
-        # Track which mounts were actually resolved
-        _bind_to_name = {
-            "/home/developer/.aws": "aws",
-            "/home/developer/.azure": "azure",
-            "/home/developer/.kube": "kube",
-            "/home/developer/.ssh": "ssh",
-            "/home/developer/.gitconfig": "gitconfig",
-            "/home/developer/.gcloud": "gcloud",
-            "/home/developer/.terraform.d": "terraform",
+    # Docker-only: cosign image signature verification.  It is dominated by
+    # the Rekor/Fulcio round trip, so let it run while volumes and hardening
+    # are prepared; it must succeed before the backend creates anything.
+    cosign_task = (
+        asyncio.create_task(_verify_cosign(image, image_or_template, slog))
+        if backend == "docker"
+        else None
+    )
+    try:
+        # Session data volume (Docker and UTM)
+        session_data_dir = settings.sessions_dir / session_name
+        session_data_dir.mkdir(parents=True, exist_ok=True)
+        volumes = {
+            str(session_data_dir): {"bind": "/home/developer/.claude/projects", "mode": "rw"}
         }
-        for mount in profile_mounts.values():
-            name = _bind_to_name.get(mount["bind"])
-            if name:
-                ctx.profile_mounts.add(name)
 
-    # Hardening kwargs (Docker only)
-    if backend == "docker":
-        if hardened:
-            hardening_kwargs = get_hardening_kwargs()
+        # User-specified volume mounts
+        for vol in ctx.volume_mounts:
+            parts = vol.split(":")
+            if len(parts) >= 2:
+                host_path = parts[0]
+                container_path = parts[1]
+                mode = parts[2] if len(parts) > 2 else "rw"
+                volumes[host_path] = {"bind": container_path, "mode": mode}
+
+        # Profile credential / config mounts (Docker only for now)
+        if backend == "docker":
+            # File reads + directory probes — keep them off the event loop
+            profile_mounts = await _run_io(
+                _resolve_profile_mounts,
+                workspace_profile=resolved_workspace_profile,
+                workspace_home=workspace_home,
+            )
+            volumes.update(profile_mounts)
+            # Track which mounts were actually resolved
+            for mount in profile_mounts.values():
+                name = _BIND_TO_NAME.get(mount["bind"])
+                if name:
+                    ctx.profile_mounts.add(name)
+
+        # Hardening kwargs (Docker only)
+        if backend == "docker":
+            if hardened:
+                hardening_kwargs = get_hardening_kwargs()
+            else:
+                hardening_kwargs = get_legacy_kwargs()
         else:
-            hardening_kwargs = get_legacy_kwargs()
-    else:
-        hardening_kwargs = {}
+            hardening_kwargs = {}
+
+        if cosign_task is not None:
+            await cosign_task
+    except BaseException:
+        if cosign_task is not None:
+            # Cancel it if still running, then retrieve its outcome either way
+            # so a failure isn't reported as "Task exception was never retrieved"
+            if not cosign_task.done():
+                cosign_task.cancel()
+            await asyncio.gather(cosign_task, return_exceptions=True)
+        raise
 
     # Create backend and provision
     backend_impl = create_backend(backend)
@@ -698,7 +923,7 @@ async def provision(
         hardening_kwargs=hardening_kwargs,
     )
 
-    _sessions[session_name] = ctx
+    _register_session(ctx)
     return ctx
 
 
@@ -706,6 +931,22 @@ async def provision(
 # Phase 2: Configure
 # ---------------------------------------------------------------------------
 
+# "export NAME=" prefixes per ordered secret-name tuple.  The set of resolved
+# secret names is stable across sessions, so only the values vary per call.
+_ENV_PREFIX_CACHE_MAX = 64
+_env_prefix_cache: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _render_env_exports(values: dict[str, str]) -> str:
+    """Render *values* as ``export K=V`` lines (legacy, non-hardened mode)."""
+    names = tuple(values)
+    prefixes = _env_prefix_cache.get(names)
+    if prefixes is None:
+        if len(_env_prefix_cache) >= _ENV_PREFIX_CACHE_MAX:
+            _env_prefix_cache.clear()
+        prefixes = _env_prefix_cache[names] = tuple(f"export {k}=" for k in names)
+    return "\n".join(map(operator.add, prefixes, map(str, values.values())))
+
 
 async def configure(ctx_or_name: SessionContext | str) -> SessionContext:
     from .backends import create_backend
@@ -738,7 +979,7 @@ async def configure(ctx_or_name: SessionContext | str) -> SessionContext:
 
     ctx.secrets.update(resolved)
     if not ctx.hardened:
-        ctx.env_content = "\n".join(f"export {k}={v}" for k, v in resolved.items())
+        ctx.env_content = _render_env_exports(resolved)
 
     # Agent token — store only the UUID so `Authorization: Bearer <content>` works
     if ctx.token:
@@ -834,7 +1075,7 @@ async def recycle(ctx_or_name: SessionContext | str, reason: str = "manual") ->
     await backend_impl.remove(ctx)
 
     ctx.state = SessionState.RECYCLED
-    _sessions.pop(ctx.session_name, None)
+    _unregister_session(ctx.session_name)
     slog.info("container.recycled", metadata={"reason": reason, "backend": ctx.backend})
 
     # Clean up host worktree if one was created for this session
@@ -883,7 +1124,7 @@ async def _inject_repo_clone(container: Any, repo: Any) -> None:
     parent_dir = clone_dest.rsplit("/", 1)[0] if "/" in clone_dest else "/home/developer"
 
     # Ensure parent directory exists
-    await _run(
+    await _run_docker(
         container.exec_run,
         ["sh", "-c", f"mkdir -p {parent_dir}"],
         user="developer",
@@ -907,7 +1148,7 @@ async def _inject_repo_clone(container: Any, repo: Any) -> None:
         else:
             clone_cmd = f"git clone {clone_url} {clone_dest}"
 
-        result = await _run(
+        result = await _run_docker(
             container.exec_run,
             ["sh", "-c", clone_cmd],
             user="developer",
@@ -917,7 +1158,7 @@ async def _inject_repo_clone(container: Any, repo: Any) -> None:
             raise RuntimeError(f"git clone failed (exit {result.exit_code}): {output}")
 
         # Create the work branch locally
-        result = await _run(
+        result = await _run_docker(
             container.exec_run,
             ["git", "-C", clone_dest, "checkout", "-b", repo.branch],
             user="developer",
@@ -928,7 +1169,7 @@ async def _inject_repo_clone(container: Any, repo: Any) -> None:
         return
 
     # Clone into the container (clone / clone-worktree)
-    result = await _run(
+    result = await _run_docker(
         container.exec_run,
         ["git", "clone", "--branch", repo.branch, "--single-branch", repo.url, clone_dest],
         user="developer",
@@ -939,7 +1180,7 @@ async def _inject_repo_clone(container: Any, repo: Any) -> None:
 
     if repo.mode == "clone-worktree":
         wt_path = clone_dest + "-wt"
-        result = await _run(
+        result = await _run_docker(
             container.exec_run,
             ["git", "-C", clone_dest, "worktree", "add", "-B", repo.branch, wt_path],
             user="developer",
@@ -1048,7 +1289,7 @@ async def run_pipeline(
 
         try:
             client = _docker(docker_host)
-            container = await _run(client.containers.get, ctx.container_name)
+            container = await _run_docker(client.containers.get, ctx.container_name)
             await _inject_repo_clone(container, repo)
             log.info("repo.cloned", metadata={"mode": repo.mode, "branch": repo.branch})
         except Exception as exc:
@@ -1084,19 +1325,52 @@ async def run_pipeline(
 
 def _resolve(ctx_or_name: SessionContext | str) -> SessionContext:
     if isinstance(ctx_or_name, str):
-        ctx = _sessions.get(ctx_or_name)
-        if not ctx:
-            raise ValueError(f"Session '{ctx_or_name}' not found")
-        return ctx
+        return _resolve_by_name(ctx_or_name)
     return ctx_or_name
 
 
+def _resolve_by_name(session_name: str) -> SessionContext:
+    """Look up a registered session (one dict probe), raising ValueError if absent."""
+    try:
+        return _sessions[session_name]
+    except KeyError:
+        raise ValueError(f"Session '{session_name}' not found") from None
+
+
 def get_session(session_name: str) -> SessionContext | None:
     return _sessions.get(session_name)
 
 
-def list_sessions() -> list[SessionContext]:
-    return list(_sessions.values())
+def list_sessions() -> tuple[SessionContext, ...]:
+    """All registered sessions, as a snapshot reused until membership changes."""
+    global _sessions_snapshot
+    snapshot = _sessions_snapshot
+    if snapshot is None:
+        with _sessions_lock:
+            snapshot = _sessions_snapshot = tuple(_sessions.values())
+    return snapshot
+
+
+def _register_session(ctx: SessionContext) -> None:
+    global _sessions_snapshot
+    with _sessions_lock:
+        _sessions[ctx.session_name] = ctx
+        _sessions_snapshot = None
+
+
+def _unregister_session(session_name: str) -> None:
+    global _sessions_snapshot
+    with _sessions_lock:
+        if _sessions.pop(session_name, None) is not None:
+            _sessions_snapshot = None
+
+
+def _clear_sessions() -> None:
+    """Drop every registered session along with the list_sessions() snapshot."""
+    global _sessions_snapshot
+    with _sessions_lock:
+        _sessions.clear()
+        _sessions_snapshot = None
 
 
 # ---------------------------------------------------------------------------
@@ -1105,12 +1379,8 @@ def list_sessions() -> list[SessionContext]:
 
 
 def _now_ms() -> int:
-    import time
-
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def _iso_now() -> str:
-    from datetime import datetime, timezone
-
     return datetime.now(timezone.utc).isoformat()
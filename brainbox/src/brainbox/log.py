@@ -2,46 +2,96 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import logging
 import sys
 from typing import Any
 
 import structlog
 
+from .config import settings
 
-def _rename_warning_to_warn(
-    logger: Any, method_name: str, event_dict: dict[str, Any]
-) -> dict[str, Any]:
-    """Rename 'warning' level to 'warn' for Node.js log compatibility."""
-    if event_dict.get("level") == "warning":
-        event_dict["level"] = "warn"
+try:
+    import orjson
+except ImportError:  # optional speedup: brainbox[fast]
+    orjson = None
+
+
+# Method name -> emitted level; "warn" rather than "warning" for Node.js log
+# compatibility, and exception() logs at error level as in structlog
+_LEVEL_NAMES = {"warning": "warn", "exception": "error"}
+
+# settings.log_level -> minimum stdlib level the bound loggers emit
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
+def _add_log_level(logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Add the level under ``level`` in a single step, spelled the Node.js way."""
+    event_dict["level"] = _LEVEL_NAMES.get(method_name, method_name)
     return event_dict
 
 
+def _json_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer writing what orjson (and Node.js) would.
+
+    Compact separators and raw UTF-8, so log lines look the same with or
+    without the ``fast`` extra.  The one difference left: NaN and infinities
+    are written as ``NaN``/``Infinity`` here but as ``null`` by orjson.
+    """
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, **kwargs)
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer backed by orjson, keeping structlog's fallback."""
+    try:
+        return orjson.dumps(
+            obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        # e.g. ints beyond 64 bits, which the stdlib encoder handles
+        return _json_dumps(obj, **kwargs)
+
+
 def setup_logging() -> None:
     """Configure structlog with JSON output matching the Node.js format."""
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            _rename_warning_to_warn,
+            _add_log_level,
             structlog.processors.TimeStamper(fmt="iso", utc=True),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(
+                serializer=_orjson_dumps if orjson is not None else _json_dumps
+            ),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(0),
+        wrapper_class=structlog.make_filtering_bound_logger(_LEVELS[settings.log_level]),
         context_class=dict,
         logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
         cache_logger_on_first_use=True,
     )
+    # Loggers bound before now carry the old configuration
+    get_logger.cache_clear()
 
 
+@functools.lru_cache(maxsize=256)
 def get_logger(
     session_name: str | None = None,
     container_name: str | None = None,
 ) -> structlog.stdlib.BoundLogger:
-    """Return a logger optionally bound with session context."""
+    """Return a logger optionally bound with session context.
+
+    Bound loggers are immutable, so one is cached per (session, container)
+    pair rather than rebuilt on every call.
+    """
     logger = structlog.get_logger()
+    context = {}
     if session_name:
-        logger = logger.bind(session_name=session_name)
+        context["session_name"] = session_name
     if container_name:
-        logger = logger.bind(container_name=container_name)
-    return logger
+        context["container_name"] = container_name
+    return logger.bind(**context) if context else logger
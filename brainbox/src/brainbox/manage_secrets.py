@@ -15,13 +15,17 @@ from .config import settings
 
 console = Console()
 
+_SECRET_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
 
 def _get_keys() -> list[str]:
     """List existing secret key names."""
     secrets_dir = settings.secrets_dir
     if not secrets_dir.is_dir():
         return []
-    return sorted(f.name for f in secrets_dir.iterdir() if f.is_file())
+    # DirEntry.is_file() uses the type from the directory read, saving a stat per entry
+    with os.scandir(secrets_dir) as it:
+        return sorted(e.name for e in it if e.is_file())
 
 
 def _show_status() -> None:
@@ -163,7 +167,7 @@ def _add_key() -> None:
         "Name:",
         validate=lambda val: (
             True
-            if val and re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", val)
+            if val and _SECRET_NAME_RE.fullmatch(val)
             else "Use letters, numbers, and underscores only"
         ),
     ).ask()
@@ -182,8 +186,7 @@ def _add_key() -> None:
     secrets_dir.chmod(0o700)
 
     file_path = secrets_dir / name
-    file_path.write_text(value)
-    file_path.chmod(0o600)
+    write_secure_file(file_path, value)
 
     console.print(f"\n[green]Saved to {file_path}[/green]")
     console.print("[dim]Restart session to use: ./scripts/run.sh[/dim]\n")
@@ -10,27 +10,129 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-import urllib.error
-import urllib.request
+import random
+import threading
+import time
+from collections.abc import Callable, Coroutine
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from mcp.server.fastmcp import FastMCP
+import httpx
 
-mcp = FastMCP("brainbox")
+try:
+    import orjson
+except ImportError:  # optional speedup: brainbox[fast]
+    orjson = None
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
+# ---------------------------------------------------------------------------
+# HTTP transport — one asyncio loop on a daemon thread owns a pooled
+# AsyncClient.  Tools stay synchronous and block on their request's future;
+# batch() multiplexes many requests on the same loop with no extra threads.
+# ---------------------------------------------------------------------------
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+_httpx_client: httpx.AsyncClient | None = None
+
+# Parse response bodies straight from bytes: orjson needs no decode step, and
+# stdlib json.loads sniffs the UTF encoding of bytes itself
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a request body; orjson produces bytes directly."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+_BATCH_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
+# Transient-failure retries (e.g. while the API restarts): exponential backoff
+# with full jitter.  Connection failures are retried for any method since the
+# request never reached the server; gateway errors and read timeouts only for
+# idempotent methods, so a slow POST is never submitted twice.
+_RETRIES = int(os.environ.get("BRAINBOX_RETRIES", "3"))
+_BACKOFF_BASE = 0.25  # seconds
+_BACKOFF_CAP = float(os.environ.get("BRAINBOX_BACKOFF_CAP", "2.0"))
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Read-mostly endpoints that agents poll: a response is reused for a short TTL
+# so bursts of identical calls cost one round trip, then revalidated with
+# If-None-Match when the API sent an ETag.  Any non-GET request drops the
+# cache, so a mutation is always visible to the next read.  Only touched from
+# the transport loop, so no lock is needed.
+_CACHED_PATHS = frozenset({"/api/sessions", "/api/hub/agents", "/api/hub/tokens", "/api/info"})
+_CACHE_TTL = float(os.environ.get("BRAINBOX_CACHE_TTL", "1.0"))
+_response_cache: dict[str, tuple[str | None, Any, float]] = {}  # path -> (etag, body, expires)
+# Bumped when a mutation is sent and again when it returns; a GET only stores
+# its body if no mutation overlapped it, so a pre-mutation read is never cached
+_cache_generation = 0
+
+# Single-flight: concurrent GETs for the same path and key share one request
+_inflight: dict[tuple[str, str | None], asyncio.Task] = {}
+
+
+def _io_loop() -> asyncio.AbstractEventLoop:
+    """Get the transport event loop, starting its thread on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="mcp-http", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def _client() -> httpx.AsyncClient:
+    """Get the pooled client; only called from coroutines on the transport loop."""
+    global _httpx_client
+    if _httpx_client is None:
+        _httpx_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            follow_redirects=True,
+        )
+    return _httpx_client
+
+
+def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run *coro* on the transport loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _io_loop()).result()
 
 
 def _api_url() -> str:
     return os.environ.get("BRAINBOX_URL", "http://127.0.0.1:9999")
 
 
+# Key resolved from disk/loopback, reused for the life of the process
+# (BRAINBOX_DISABLE_KEY_CACHE=1 re-resolves on every call).  Empty results are
+# not cached, so a key that appears later is still picked up.
+_cached_key: str | None = None
+
+
 def _api_key() -> str:
     """Load API key from CL_API_KEY env, key file on disk, or loopback /api/auth/key."""
+    global _cached_key
     key = os.environ.get("CL_API_KEY", "")
     if key:
         return key
+    if _cached_key is not None and os.environ.get("BRAINBOX_DISABLE_KEY_CACHE") != "1":
+        return _cached_key
+    key = _resolve_api_key()
+    if key:
+        _cached_key = key
+    return key
+
+
+def _resolve_api_key() -> str:
     # Try common key file locations (XDG, WORKSPACE_HOME, home)
     for candidate in [
         os.environ.get("XDG_CONFIG_HOME", ""),
@@ -44,73 +146,176 @@ def _api_key() -> str:
             return key_file.read_text().strip()
     # Fall back to loopback endpoint (works regardless of which profile started brainbox)
     try:
-        req = urllib.request.Request(f"{_api_url()}/api/auth/key")
-        with urllib.request.urlopen(req, timeout=3) as resp:
-            data = json.loads(resp.read().decode())
-            return data.get("key", "")
+        return _run(_fetch_loopback_key())
     except Exception:
         return ""
 
 
-def _request_raw(
-    method: str, path: str, data: bytes, content_type: str = "text/plain", timeout: int = 30
+async def _fetch_loopback_key() -> str:
+    resp = await _client().get(f"{_api_url()}/api/auth/key", timeout=3)
+    resp.raise_for_status()
+    return resp.json().get("key", "")
+
+
+# Header templates per (api key, content type); callers get a copy
+_header_templates: dict[tuple[str, str | None], dict[str, str]] = {}
+
+
+def _headers(content_type: str | None) -> dict[str, str]:
+    key = _api_key()
+    template = _header_templates.get((key, content_type))
+    if template is None:
+        template = {"Content-Type": content_type} if content_type else {}
+        if key:
+            template["X-API-Key"] = key
+        if len(_header_templates) >= 16:
+            _header_templates.clear()
+        _header_templates[(key, content_type)] = template
+    return dict(template)
+
+
+async def _backoff(attempt: int) -> None:
+    await asyncio.sleep(random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt)))
+
+
+async def _arequest(
+    method: str, path: str, content: bytes | None, headers: dict[str, str], timeout: float
 ) -> Any:
-    """Make an HTTP request with raw bytes body."""
+    """Send a request, joining an identical GET that is already in flight."""
+    if method != "GET":
+        return await _asend(method, path, content, headers, timeout)
+    key = (path, headers.get("X-API-Key"))
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_asend(method, path, content, headers, timeout))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _asend(
+    method: str, path: str, content: bytes | None, headers: dict[str, str], timeout: float
+) -> Any:
+    """Send a request over the shared client and decode the JSON response.
+
+    HTTP errors and unreachable-API failures are returned as ``{"error": ...}``
+    dicts rather than raised, so tools can hand them straight back to the client.
+    """
+    global _cache_generation, _cached_key
     url = f"{_api_url()}{path}"
-    headers = {"Content-Type": content_type}
-    key = _api_key()
-    if key:
-        headers["X-API-Key"] = key
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
+    idempotent = method in _IDEMPOTENT_METHODS
+    mutating = method != "GET"
+    cacheable = method == "GET" and path in _CACHED_PATHS
+    cached = None
+    if cacheable:
+        cached = _response_cache.get(path)
+        if cached is not None:
+            if time.monotonic() < cached[2]:
+                return cached[1]
+            if cached[0]:
+                headers = {**headers, "If-None-Match": cached[0]}
+    elif mutating:
+        _response_cache.clear()
+        _cache_generation += 1
+    generation = _cache_generation
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode() if exc.fp else str(exc)
+        resp = await _send_with_retries(method, url, content, headers, timeout, idempotent)
+    finally:
+        if mutating:
+            # Drop anything a concurrent GET stored while this was in flight
+            _response_cache.clear()
+            _cache_generation += 1
+    if isinstance(resp, dict):
+        return resp
+    if cached is not None and resp.status_code == 304:
+        if generation == _cache_generation:
+            _response_cache[path] = (cached[0], cached[1], time.monotonic() + _CACHE_TTL)
+        return cached[1]
+    if resp.status_code == 401:
+        # Key may have been rotated — re-resolve it on the next call
+        _cached_key = None
+    if resp.status_code >= 400:
+        detail = resp.text or f"HTTP Error {resp.status_code}: {resp.reason_phrase}"
         try:
-            detail = json.loads(detail).get("detail", detail)
-        except (json.JSONDecodeError, AttributeError):
+            detail = _json_loads(resp.content).get("detail", detail)
+        except (ValueError, AttributeError):
             pass
-        return {"error": detail, "status": exc.code}
-    except urllib.error.URLError as exc:
-        return {"error": f"Cannot reach API at {url}: {exc.reason}"}
+        return {"error": detail, "status": resp.status_code}
+    body = _json_loads(resp.content)
+    if cacheable and resp.status_code == 200 and generation == _cache_generation:
+        _response_cache[path] = (resp.headers.get("ETag"), body, time.monotonic() + _CACHE_TTL)
+    return body
+
+
+async def _send_with_retries(
+    method: str,
+    url: str,
+    content: bytes | None,
+    headers: dict[str, str],
+    timeout: float,
+    idempotent: bool,
+) -> httpx.Response | dict[str, str]:
+    """Send with jittered-backoff retries; an unreachable API yields an error dict."""
+    attempt = 0
+    while True:
+        try:
+            resp = await _client().request(
+                method,
+                url,
+                content=content,
+                headers=headers,
+                timeout=httpx.Timeout(timeout, connect=5.0),
+            )
+        except httpx.TransportError as exc:
+            retryable = idempotent or isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+            if retryable and attempt < _RETRIES:
+                await _backoff(attempt)
+                attempt += 1
+                continue
+            return {"error": f"Cannot reach API at {url}: {exc}"}
+        if idempotent and resp.status_code in _RETRY_STATUSES and attempt < _RETRIES:
+            await _backoff(attempt)
+            attempt += 1
+            continue
+        return resp
+
+
+def _request_raw(
+    method: str, path: str, data: bytes, content_type: str = "text/plain", timeout: int = 30
+) -> Any:
+    """Make an HTTP request with raw bytes body."""
+    return _run(_arequest(method, path, data, _headers(content_type), timeout))
 
 
 def _request(method: str, path: str, body: dict[str, Any] | None = None, timeout: int = 30) -> Any:
     """Make an HTTP request to the brainbox API."""
-    url = f"{_api_url()}{path}"
-    data = json.dumps(body).encode() if body else None
-    headers = {"Content-Type": "application/json"} if data else {}
-    key = _api_key()
-    if key:
-        headers["X-API-Key"] = key
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode() if exc.fp else str(exc)
-        try:
-            detail = json.loads(detail).get("detail", detail)
-        except (json.JSONDecodeError, AttributeError):
-            pass
-        return {"error": detail, "status": exc.code}
-    except urllib.error.URLError as exc:
-        return {"error": f"Cannot reach API at {url}: {exc.reason}"}
+    data = _json_dumps(body) if body else None
+    headers = _headers("application/json" if data else None)
+    return _run(_arequest(method, path, data, headers, timeout))
 
 
 # ---------------------------------------------------------------------------
 # Tools
 # ---------------------------------------------------------------------------
 
+# Tool functions are collected at import and only registered on a FastMCP
+# server in run(), so importing this module for its transport helpers does
+# not pull in mcp or inspect every tool signature.
+_tools: list[Callable[..., Any]] = []
 
-@mcp.tool()
+
+def _tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    _tools.append(fn)
+    return fn
+
+
+@_tool
 def list_sessions() -> list[dict[str, Any]]:
     """List all container sessions with their ports, volumes, and status."""
     return _request("GET", "/api/sessions")
 
 
-@mcp.tool()
+@_tool
 def create_session(
     name: str = "default",
     volume: str | None = None,
@@ -140,7 +345,7 @@ def create_session(
     return _request("POST", "/api/create", body)
 
 
-@mcp.tool()
+@_tool
 def start_session(name: str) -> dict[str, Any]:
     """Start an existing stopped container session.
 
@@ -150,7 +355,7 @@ def start_session(name: str) -> dict[str, Any]:
     return _request("POST", "/api/start", {"name": name})
 
 
-@mcp.tool()
+@_tool
 def stop_session(name: str) -> dict[str, Any]:
     """Stop a running container session.
 
@@ -160,7 +365,7 @@ def stop_session(name: str) -> dict[str, Any]:
     return _request("POST", "/api/stop", {"name": name})
 
 
-@mcp.tool()
+@_tool
 def delete_session(name: str) -> dict[str, Any]:
     """Delete a container session (stops and removes the container).
 
@@ -170,7 +375,7 @@ def delete_session(name: str) -> dict[str, Any]:
     return _request("POST", "/api/delete", {"name": name})
 
 
-@mcp.tool()
+@_tool
 def push_config(name: str) -> dict[str, Any]:
     """Re-inject translated ~/.claude config bundle into a running container.
 
@@ -183,13 +388,13 @@ def push_config(name: str) -> dict[str, Any]:
     return _request("POST", f"/api/sessions/{name}/push-config")
 
 
-@mcp.tool()
+@_tool
 def get_metrics() -> list[dict[str, Any]]:
     """Get per-container CPU %, memory usage, and uptime for all running sessions."""
     return _request("GET", "/api/metrics/containers")
 
 
-@mcp.tool()
+@_tool
 def submit_task(
     description: str, agent_name: str = "worker", repo_url: str | None = None
 ) -> dict[str, Any]:
@@ -221,7 +426,7 @@ def submit_task(
     return _request("POST", "/api/hub/tasks", body)
 
 
-@mcp.tool()
+@_tool
 def get_task(task_id: str) -> dict[str, Any]:
     """Get the status and result of a submitted task.
 
@@ -231,7 +436,7 @@ def get_task(task_id: str) -> dict[str, Any]:
     return _request("GET", f"/api/hub/tasks/{task_id}")
 
 
-@mcp.tool()
+@_tool
 def list_tasks(status: str | None = None) -> list[dict[str, Any]]:
     """List hub tasks, optionally filtered by status.
 
@@ -244,13 +449,13 @@ def list_tasks(status: str | None = None) -> list[dict[str, Any]]:
     return _request("GET", path)
 
 
-@mcp.tool()
+@_tool
 def get_hub_state() -> dict[str, Any]:
     """Get full hub state: agents, tasks, tokens, and message log."""
     return _request("GET", "/api/hub/state")
 
 
-@mcp.tool()
+@_tool
 def get_session(name: str) -> dict[str, Any]:
     """Get info for a single session by name.
 
@@ -260,7 +465,7 @@ def get_session(name: str) -> dict[str, Any]:
     return _request("GET", f"/api/sessions/{name}")
 
 
-@mcp.tool()
+@_tool
 def exec_session(name: str, command: str) -> dict[str, Any]:
     """Execute a shell command inside a running container session.
 
@@ -271,7 +476,7 @@ def exec_session(name: str, command: str) -> dict[str, Any]:
     return _request("POST", f"/api/sessions/{name}/exec", {"command": command})
 
 
-@mcp.tool()
+@_tool
 def query_session(
     name: str,
     prompt: str,
@@ -288,7 +493,7 @@ def query_session(
     return _request("POST", f"/api/sessions/{name}/query", body, timeout=timeout + 10)
 
 
-@mcp.tool()
+@_tool
 def cancel_task(task_id: str) -> dict[str, Any]:
     """Cancel a pending or running task.
 
@@ -298,25 +503,25 @@ def cancel_task(task_id: str) -> dict[str, Any]:
     return _request("DELETE", f"/api/hub/tasks/{task_id}")
 
 
-@mcp.tool()
+@_tool
 def get_langfuse_health() -> dict[str, Any]:
     """Check LangFuse observability service health and connectivity."""
     return _request("GET", "/api/langfuse/health")
 
 
-@mcp.tool()
+@_tool
 def get_qdrant_health() -> dict[str, Any]:
     """Check Qdrant vector database health and connectivity."""
     return _request("GET", "/api/qdrant/health")
 
 
-@mcp.tool()
+@_tool
 def list_agents() -> list[dict[str, Any]]:
     """List all registered agents in the hub."""
     return _request("GET", "/api/hub/agents")
 
 
-@mcp.tool()
+@_tool
 def get_agent(name: str) -> dict[str, Any]:
     """Get info for a single registered hub agent.
 
@@ -326,13 +531,13 @@ def get_agent(name: str) -> dict[str, Any]:
     return _request("GET", f"/api/hub/agents/{name}")
 
 
-@mcp.tool()
+@_tool
 def list_tokens() -> list[dict[str, Any]]:
     """List all registered hub tokens (agent identities)."""
     return _request("GET", "/api/hub/tokens")
 
 
-@mcp.tool()
+@_tool
 def refresh_secrets(name: str) -> dict[str, Any]:
     """Re-inject secrets into a running container session from the host environment.
 
@@ -342,7 +547,7 @@ def refresh_secrets(name: str) -> dict[str, Any]:
     return _request("POST", f"/api/sessions/{name}/refresh-secrets")
 
 
-@mcp.tool()
+@_tool
 def api_info() -> dict[str, Any]:
     """Get API version and basic health status."""
     return _request("GET", "/api/info")
@@ -353,13 +558,13 @@ def api_info() -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-@mcp.tool()
+@_tool
 def artifact_health() -> dict[str, Any]:
     """Check artifact storage (MinIO) health and connectivity."""
     return _request("GET", "/api/artifacts/health")
 
 
-@mcp.tool()
+@_tool
 def list_artifacts(prefix: str = "") -> list[dict[str, Any]]:
     """List stored artifacts, optionally filtered by key prefix.
 
@@ -372,7 +577,7 @@ def list_artifacts(prefix: str = "") -> list[dict[str, Any]]:
     return _request("GET", path)
 
 
-@mcp.tool()
+@_tool
 def upload_artifact(key: str, content: str) -> dict[str, Any]:
     """Upload a text artifact to storage.
 
@@ -385,7 +590,7 @@ def upload_artifact(key: str, content: str) -> dict[str, Any]:
     )
 
 
-@mcp.tool()
+@_tool
 def download_artifact(key: str) -> dict[str, Any]:
     """Download an artifact from storage.
 
@@ -395,7 +600,7 @@ def download_artifact(key: str) -> dict[str, Any]:
     return _request("GET", f"/api/artifacts/{key}")
 
 
-@mcp.tool()
+@_tool
 def delete_artifact(key: str) -> dict[str, Any]:
     """Delete an artifact from storage.
 
@@ -410,7 +615,7 @@ def delete_artifact(key: str) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-@mcp.tool()
+@_tool
 def get_langfuse_session_traces(session_name: str, limit: int = 50) -> list[dict[str, Any]]:
     """List LangFuse traces for a container session.
 
@@ -421,7 +626,7 @@ def get_langfuse_session_traces(session_name: str, limit: int = 50) -> list[dict
     return _request("GET", f"/api/langfuse/sessions/{session_name}/traces?limit={limit}")
 
 
-@mcp.tool()
+@_tool
 def get_langfuse_session_summary(session_name: str) -> dict[str, Any]:
     """Get trace count, error count, and tool breakdown for a session.
 
@@ -431,7 +636,7 @@ def get_langfuse_session_summary(session_name: str) -> dict[str, Any]:
     return _request("GET", f"/api/langfuse/sessions/{session_name}/summary")
 
 
-@mcp.tool()
+@_tool
 def get_langfuse_trace_detail(trace_id: str) -> dict[str, Any]:
     """Get full detail for a single LangFuse trace including observations.
 
@@ -446,13 +651,13 @@ def get_langfuse_trace_detail(trace_id: str) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-@mcp.tool()
+@_tool
 def list_repos() -> list[dict[str, Any]]:
     """List all tracked repositories with their agent containers and settings."""
     return _request("GET", "/api/hub/repos")
 
 
-@mcp.tool()
+@_tool
 def add_repo(
     url: str,
     name: str | None = None,
@@ -489,7 +694,7 @@ def add_repo(
     return _request("POST", "/api/hub/repos", body)
 
 
-@mcp.tool()
+@_tool
 def get_repo(name: str) -> dict[str, Any]:
     """Get details for a tracked repository.
 
@@ -499,7 +704,7 @@ def get_repo(name: str) -> dict[str, Any]:
     return _request("GET", f"/api/hub/repos/{name}")
 
 
-@mcp.tool()
+@_tool
 def update_repo(
     name: str,
     merge_queue_enabled: bool | None = None,
@@ -524,7 +729,7 @@ def update_repo(
     return _request("PATCH", f"/api/hub/repos/{name}", body)
 
 
-@mcp.tool()
+@_tool
 def delete_repo(name: str) -> dict[str, Any]:
     """Remove a tracked repository and stop its persistent agents.
 
@@ -534,7 +739,7 @@ def delete_repo(name: str) -> dict[str, Any]:
     return _request("DELETE", f"/api/hub/repos/{name}")
 
 
-@mcp.tool()
+@_tool
 def get_message_log(limit: int = 50) -> list[dict[str, Any]]:
     """Return the hub inter-agent message audit log.
 
@@ -551,7 +756,7 @@ def get_message_log(limit: int = 50) -> list[dict[str, Any]]:
     return log
 
 
-@mcp.tool()
+@_tool
 def multiclaude_status() -> dict[str, Any]:
     """Summarise the current multiclaude workflow state in one call.
 
@@ -603,6 +808,69 @@ def multiclaude_status() -> dict[str, Any]:
     }
 
 
+# ---------------------------------------------------------------------------
+# Batch
+# ---------------------------------------------------------------------------
+
+
+@_tool
+def batch(calls: list[dict[str, Any]]) -> list[Any]:
+    """Run several brainbox API calls concurrently and return their results in order.
+
+    Use this instead of calling several read tools back to back, e.g. to build a
+    dashboard view from sessions, metrics, tasks and agents in one round trip:
+
+        batch([
+            {"method": "GET", "path": "/api/sessions"},
+            {"method": "GET", "path": "/api/metrics/containers"},
+            {"method": "GET", "path": "/api/hub/tasks"},
+            {"method": "GET", "path": "/api/hub/agents"},
+        ])
+
+    A failed call yields an ``{"error": ...}`` entry at its position; the other
+    calls are unaffected.
+
+    Args:
+        calls: List of ``{"method": ..., "path": "/api/...", "body": {...}}`` dicts
+               (``body`` is optional)
+    """
+    # Resolve the API key once, here: _api_key may itself block on the loop
+    return _run(_abatch(calls, _headers(None)))
+
+
+async def _abatch(calls: list[dict[str, Any]], key_headers: dict[str, str]) -> list[Any]:
+    invalid = {"error": "invalid call: need method and /api/ path"}
+
+    async def one(call: dict[str, Any]) -> Any:
+        method = str(call.get("method", "GET")).upper()
+        path = call.get("path")
+        if (
+            method not in _BATCH_METHODS
+            or not isinstance(path, str)
+            or not path.startswith("/api/")
+        ):
+            return dict(invalid)
+        body = call.get("body")
+        try:
+            data = _json_dumps(body) if body else None
+            headers = {**key_headers, "Content-Type": "application/json"} if data else key_headers
+            return await _arequest(method, path, data, dict(headers), 30)
+        except Exception as exc:
+            # e.g. a 2xx with an empty or non-JSON body; keep it to this slot
+            return {"error": str(exc) or type(exc).__name__}
+
+    return await asyncio.gather(*(one(call) for call in calls))
+
+
+def _build_server() -> FastMCP:
+    from mcp.server.fastmcp import FastMCP
+
+    server = FastMCP("brainbox")
+    for fn in _tools:
+        server.tool()(fn)
+    return server
+
+
 def run() -> None:
     """Run the MCP server on stdio transport."""
-    mcp.run(transport="stdio")
+    _build_server().run(transport="stdio")
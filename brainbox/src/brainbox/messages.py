@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 import time
 import uuid
-from collections import deque
+from collections import defaultdict, deque
 from typing import Any
 
 from .config import settings
 from .log import get_logger
 from .policy import evaluate_message
-from .registry import list_tokens, validate_token
+from .registry import tokens_for_agent, validate_token
 
 log = get_logger()
 
@@ -20,15 +22,63 @@ log = get_logger()
 # ---------------------------------------------------------------------------
 
 # Pending messages keyed by token_id
-_pending: dict[str, list[dict[str, Any]]] = {}
+_pending: defaultdict[str, deque[dict[str, Any]]] = defaultdict(deque)
 
 # Audit log (capped ring buffer — in-memory)
 _message_log: deque[dict[str, Any]] = deque(maxlen=settings.hub.message_retention)
 
+# Secondary indexes over _message_log: field -> value -> entries, oldest first.
+# They share the entry dicts with the log and are trimmed in step with it, so a
+# filtered query only walks the entries that can match.
+_LOG_INDEX_FIELDS = ("sender", "recipient", "status")
+_log_indexes: dict[str, defaultdict[Any, deque[dict[str, Any]]]] = {
+    field: defaultdict(deque) for field in _LOG_INDEX_FIELDS
+}
+
 # Persistent audit log file (append-only JSONL)
 _audit_log_path = settings.config_dir / "message-audit.jsonl"
 
 
+# Message IDs keep the UUID4 shape clients see, but the random bytes come
+# from one os.urandom call per 256 IDs rather than one per message
+_ID_BATCH = 256
+_id_lock = threading.Lock()
+_id_buf = b""
+_id_off = 0
+
+
+def _new_id() -> str:
+    global _id_buf, _id_off
+    with _id_lock:
+        if _id_off >= len(_id_buf):
+            _id_buf = os.urandom(16 * _ID_BATCH)
+            _id_off = 0
+        raw = _id_buf[_id_off : _id_off + 16]
+        _id_off += 16
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+def _append_log(entry: dict[str, Any]) -> None:
+    """Append to the in-memory audit log, keeping the indexes in step."""
+    if _message_log.maxlen == 0:
+        return
+    if _message_log and len(_message_log) == _message_log.maxlen:
+        # The deque is about to drop its oldest entry — which is also the
+        # oldest entry in each of that entry's index buckets
+        evicted = _message_log[0]
+        for field in _LOG_INDEX_FIELDS:
+            index = _log_indexes[field]
+            key = evicted.get(field)
+            bucket = index.get(key)
+            if bucket and bucket[0] is evicted:
+                bucket.popleft()
+                if not bucket:
+                    del index[key]
+    _message_log.append(entry)
+    for field in _LOG_INDEX_FIELDS:
+        _log_indexes[field][entry.get(field)].append(entry)
+
+
 def _persist_log_entry(entry: dict[str, Any]) -> None:
     """Append an audit log entry to the persistent JSONL file."""
     try:
@@ -44,44 +94,45 @@ def _persist_log_entry(entry: dict[str, Any]) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Message fields copied into its audit log entry
+_LOG_KEYS = ("id", "timestamp", "sender", "recipient", "type")
+
+
+def _reject(envelope: dict[str, Any], reason: str | None, sender: dict[str, Any]) -> None:
+    """Record a rejected envelope in the audit log (the caller raises)."""
+    entry = {
+        "id": _new_id(),
+        "timestamp": _now_ms(),
+        **sender,
+        "recipient": envelope.get("recipient"),
+        "type": envelope.get("type"),
+        "status": "rejected",
+        "reason": reason,
+    }
+    _append_log(entry)
+    _persist_log_entry(entry)
+    log.warning("messages.rejected", metadata=entry)
+
+
 def route(envelope: dict[str, Any]) -> dict[str, Any]:
     """Route a message envelope. Returns {delivered, message_id, message} or raises."""
     sender_token_id = envelope.get("sender_token_id")
     token = validate_token(sender_token_id) if sender_token_id else None
 
     if not token:
-        entry = {
-            "id": str(uuid.uuid4()),
-            "timestamp": _now_ms(),
-            "sender_token_id": sender_token_id,
-            "recipient": envelope.get("recipient"),
-            "type": envelope.get("type"),
-            "status": "rejected",
-            "reason": "invalid_token",
-        }
-        _message_log.append(entry)
-        _persist_log_entry(entry)
-        log.warning("messages.rejected", metadata=entry)
+        _reject(envelope, "invalid_token", {"sender_token_id": sender_token_id})
         raise ValueError("Invalid or expired token")
 
     check = evaluate_message(token, envelope.get("recipient", "hub"), envelope)
     if not check.allowed:
-        entry = {
-            "id": str(uuid.uuid4()),
-            "timestamp": _now_ms(),
-            "sender": token.agent_name,
-            "sender_token_id": token.token_id,
-            "recipient": envelope.get("recipient"),
-            "type": envelope.get("type"),
-            "status": "rejected",
-            "reason": check.reason,
-        }
-        _message_log.append(entry)
-        _persist_log_entry(entry)
-        log.warning("messages.rejected", metadata=entry)
+        _reject(
+            envelope,
+            check.reason,
+            {"sender": token.agent_name, "sender_token_id": token.token_id},
+        )
         raise ValueError(check.reason)
 
-    message_id = str(uuid.uuid4())
+    message_id = _new_id()
     message = {
         "id": message_id,
         "timestamp": _now_ms(),
@@ -96,19 +147,16 @@ def route(envelope: dict[str, Any]) -> dict[str, Any]:
     # Enqueue for recipient agent's tokens
     recipient = envelope.get("recipient")
     if recipient and recipient != "hub":
-        recipient_tokens = [t for t in list_tokens() if t.agent_name == recipient]
-        for rt in recipient_tokens:
-            _pending.setdefault(rt.token_id, []).append(message)
-
-    log_entry = {
-        "id": message_id,
-        "timestamp": message["timestamp"],
-        "sender": token.agent_name,
-        "recipient": message["recipient"],
-        "type": envelope.get("type"),
-        "status": "delivered",
-    }
-    _message_log.append(log_entry)
+        pending = _pending
+        for rt in tokens_for_agent(recipient):
+            queue = pending.get(rt.token_id)
+            if queue is None:
+                pending[rt.token_id] = queue = deque()
+            queue.append(message)
+
+    log_entry = {key: message[key] for key in _LOG_KEYS}
+    log_entry["status"] = "delivered"
+    _append_log(log_entry)
     _persist_log_entry(log_entry)
     log.info("messages.routed", metadata=log_entry)
 
@@ -122,8 +170,22 @@ def route(envelope: dict[str, Any]) -> dict[str, Any]:
 
 def get_messages(token_id: str) -> list[dict[str, Any]]:
     """Get and drain pending messages for a token."""
-    msgs = _pending.pop(token_id, [])
-    return msgs
+    queue = _pending.pop(token_id, None)
+    return list(queue) if queue else []
+
+
+def get_messages_batch(token_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """Get and drain pending messages for several tokens in one call.
+
+    Tokens with nothing pending are omitted from the result.
+    """
+    drained: dict[str, list[dict[str, Any]]] = {}
+    pop = _pending.pop
+    for token_id in token_ids:
+        queue = pop(token_id, None)
+        if queue:
+            drained[token_id] = list(queue)
+    return drained
 
 
 def get_message_log(
@@ -134,15 +196,35 @@ def get_message_log(
     since: int | None = None,
 ) -> list[dict[str, Any]]:
     """Get audit log, optionally filtered."""
-    result = list(_message_log)
-    if sender:
-        result = [m for m in result if m.get("sender") == sender]
-    if recipient:
-        result = [m for m in result if m.get("recipient") == recipient]
-    if status:
-        result = [m for m in result if m.get("status") == status]
-    if since:
-        result = [m for m in result if m.get("timestamp", 0) >= since]
+    # Start from the smallest matching index bucket (or the whole log)
+    wanted = {
+        field: value
+        for field, value in (("sender", sender), ("recipient", recipient), ("status", status))
+        if value
+    }
+    candidates: deque[dict[str, Any]] = _message_log
+    for field, value in wanted.items():
+        bucket = _log_indexes[field].get(value)
+        if not bucket:
+            return []
+        if len(bucket) < len(candidates):
+            candidates = bucket
+
+    def matches(m: dict[str, Any]) -> bool:
+        return all(m.get(field) == value for field, value in wanted.items())
+
+    if not since:
+        return [m for m in candidates if matches(m)]
+
+    # Entries are appended in timestamp order: walk back from the newest and
+    # stop at the first one older than ``since``
+    result = []
+    for m in reversed(candidates):
+        if m.get("timestamp", 0) < since:
+            break
+        if matches(m):
+            result.append(m)
+    result.reverse()
     return result
 
 
@@ -153,7 +235,7 @@ def get_message_log(
 
 def get_state() -> dict:
     return {
-        "pending": list(_pending.items()),
+        "pending": [(tid, list(q)) for tid, q in _pending.items()],
         "log": list(_message_log),
     }
 
@@ -165,10 +247,23 @@ def restore_state(state: dict | None) -> None:
     if state.get("pending"):
         for token_id, msgs in state["pending"]:
             if validate_token(token_id):
-                _pending[token_id] = msgs
+                _pending[token_id] = deque(msgs)
     # Drop stale audit log — messages from previous sessions are not actionable
     # The log will rebuild naturally as new messages are routed
 
 
+_last_ms = 0
+
+
 def _now_ms() -> int:
-    return int(time.time() * 1000)
+    """Wall-clock milliseconds, clamped so they never go backwards.
+
+    get_message_log's ``since`` scan relies on log timestamps being
+    non-decreasing, which an NTP step back would otherwise break.
+    """
+    global _last_ms
+    now = time.time_ns() // 1_000_000
+    if now < _last_ms:
+        now = _last_ms
+    _last_ms = now
+    return now
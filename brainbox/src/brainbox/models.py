@@ -5,7 +5,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ---------------------------------------------------------------------------
@@ -32,7 +32,8 @@ class AgentDefinition(BaseModel):
     name: str
     image: str
     description: str = ""
-    capabilities: list[str] = Field(default_factory=list)
+    # Immutable so every token issued for the agent can share it
+    capabilities: tuple[str, ...] = ()
     hardened: bool = False
     role_prompt: str | None = None  # Path to role prompt markdown (relative to agents dir)
     persistent: bool = False  # Persistent roles auto-restart; transient roles clean up
@@ -45,10 +46,13 @@ class AgentDefinition(BaseModel):
 
 
 class Token(BaseModel):
+    # Immutable once issued; the registry memoizes each token's serialized form
+    model_config = ConfigDict(frozen=True)
+
     token_id: str
     agent_name: str
     task_id: str
-    capabilities: list[str] = Field(default_factory=list)
+    capabilities: tuple[str, ...] = ()
     issued: int  # epoch ms
     expiry: int  # epoch ms
 
@@ -6,18 +6,37 @@ Tracks running containers and periodically checks health via Docker SDK.
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
 
+from .backends import create_backend
+from .config import settings
 from .log import get_logger
-from .models import SessionContext
+from .models import SessionContext, SessionState
+
+if TYPE_CHECKING:
+    from .backends import BackendProtocol
 
 # Tracked sessions keyed by session_name
 _tracked: dict[str, SessionContext] = {}
 _task: asyncio.Task[None] | None = None
+# Set to cut the loop's wait short; created by the loop on its own event loop
+_wakeup: asyncio.Event | None = None
+
+# Per-session poll schedule: name -> (next check at, current delay, last healthy).
+# A session that keeps coming back healthy is polled half as often each time,
+# up to health_check_max_interval; any failure resets it to the base interval.
+_schedule: dict[str, tuple[float, float, bool]] = {}
+
+# Backend instances reused across checks and cycles, keyed by backend type
+_backends: dict[str, BackendProtocol] = {}
 
 
 def start_monitoring(ctx: SessionContext) -> None:
     """Register a session for periodic health checks."""
     _tracked[ctx.session_name] = ctx
+    _schedule.pop(ctx.session_name, None)
     slog = get_logger(session_name=ctx.session_name, container_name=ctx.container_name)
     slog.info("monitor.started")
 
@@ -29,98 +48,181 @@ def start_monitoring(ctx: SessionContext) -> None:
             _task = loop.create_task(_monitor_loop())
         except RuntimeError:
             pass  # No running loop (CLI mode) — monitor won't run
+    elif _wakeup is not None:
+        # Check the new session now rather than at the end of the interval
+        _wakeup.set()
 
 
 def stop_monitoring(session_name: str) -> None:
     """Unregister a session from health checks."""
     _tracked.pop(session_name, None)
+    _schedule.pop(session_name, None)
+    if not _tracked and _wakeup is not None:
+        _wakeup.set()  # let the idle loop exit now
 
 
 async def _monitor_loop() -> None:
-    """Periodically check health of all tracked sessions (Docker + UTM)."""
-    from .backends import create_backend
-    from .config import settings
-    from .models import SessionState
-    import time
-
+    """Periodically check health of all tracked sessions (Docker + UTM).
+
+    Sessions are checked concurrently, so one cycle takes as long as the
+    slowest check rather than the sum of all of them.  A semaphore caps the
+    number of checks in flight so many sessions don't swamp the Docker daemon.
+    Each cycle only checks the sessions that are due per ``_schedule``.
+    Between cycles the loop waits on ``_wakeup`` until the next session is due,
+    so a newly started session is checked straight away and the loop exits as
+    soon as the last session is stopped.
+    """
     interval = settings.health_check_interval
+    max_interval = max(interval, settings.health_check_max_interval)
     timeout = settings.health_check_timeout
-
-    while _tracked:
-        for name, ctx in list(_tracked.items()):
-            slog = get_logger(session_name=name, container_name=ctx.container_name)
-
-            try:
-                # Delegate health check to backend with timeout
-                backend = create_backend(ctx.backend)
-                health = await asyncio.wait_for(backend.health_check(ctx), timeout=timeout)
-
-                if not health.get("healthy", False):
-                    ctx.health_failures += 1
-                    slog.warning(
-                        "monitor.unhealthy",
-                        metadata={
-                            "backend": ctx.backend,
-                            "failures": ctx.health_failures,
-                            "reason": health.get("reason", "unknown"),
-                        },
-                    )
-                    # Remove from tracking if it's gone
-                    if "not found" in health.get("reason", "").lower():
-                        _tracked.pop(name, None)
-                    continue
-
-                # Log health metrics (backend-specific)
-                if ctx.backend == "docker":
-                    cpu_pct = health.get("cpu_percent", 0)
-                    mem_usage_human = health.get("memory_usage_human", "0B")
-                    mem_limit_human = health.get("memory_limit_human", "0B")
-                    slog.debug(
-                        "monitor.health_check",
-                        metadata={
-                            "backend": "docker",
-                            "stats": {
-                                "cpu": f"{cpu_pct:.2f}%",
-                                "mem": f"{mem_usage_human} / {mem_limit_human}",
-                            },
-                        },
-                    )
-                elif ctx.backend == "utm":
-                    vm_state = health.get("vm_state", "unknown")
-                    ssh_reachable = health.get("ssh_reachable", False)
-                    slog.debug(
-                        "monitor.health_check",
-                        metadata={
-                            "backend": "utm",
-                            "vm_state": vm_state,
-                            "ssh_reachable": ssh_reachable,
-                            "ssh_port": ctx.ssh_port,
-                        },
+    limit = asyncio.Semaphore(settings.health_check_concurrency)
+    global _wakeup
+    wakeup = _wakeup = asyncio.Event()
+
+    try:
+        while _tracked:
+            now = time.monotonic()
+            # Built without awaiting, so _tracked can't change underneath it;
+            # checks that find a session gone drop it only after this point
+            schedule = _schedule
+            due = [
+                (name, ctx)
+                for name, ctx in _tracked.items()
+                if (entry := schedule.get(name)) is None or entry[0] <= now
+            ]
+            results = await asyncio.gather(
+                *(_check_one(name, ctx, timeout, limit) for name, ctx in due),
+                return_exceptions=True,
+            )
+
+            now = time.monotonic()
+            for (name, ctx), healthy in zip(due, results):
+                if name in _tracked:
+                    _schedule[name] = _reschedule(
+                        name, ctx, healthy is True, now, interval, max_interval
                     )
 
-                # Check TTL (same for all backends)
-                elapsed = (time.time() * 1000 - ctx.created_at) / 1000
-                if ctx.ttl > 0 and elapsed > ctx.ttl:
-                    slog.warning(
-                        "monitor.ttl_expired",
-                        metadata={"elapsed": elapsed, "ttl": ctx.ttl, "backend": ctx.backend},
-                    )
-                    ctx.state = SessionState.RECYCLING
-
+            next_due = min(
+                (_schedule[name][0] if name in _schedule else now for name in _tracked),
+                default=now,
+            )
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=max(0.0, next_due - now))
             except asyncio.TimeoutError:
-                ctx.health_failures += 1
-                slog.warning(
-                    "monitor.health_check_timeout",
-                    metadata={
-                        "backend": ctx.backend,
-                        "timeout": timeout,
-                        "failures": ctx.health_failures,
+                pass
+            wakeup.clear()
+    finally:
+        if _wakeup is wakeup:
+            _wakeup = None
+
+
+def _reschedule(
+    name: str, ctx: SessionContext, healthy: bool, now: float, base: float, cap: float
+) -> tuple[float, float, bool]:
+    """Work out when *name* is next due, backing off while it stays healthy."""
+    prev = _schedule.get(name)
+    delay = min(prev[1] * 2, cap) if healthy and prev is not None and prev[2] else base
+    if ctx.ttl > 0:
+        # Never sleep past TTL expiry by more than the base interval
+        remaining = ctx.ttl - (time.time_ns() // 1_000_000 - ctx.created_at) / 1000
+        delay = min(delay, max(remaining, base))
+    return now + delay, delay, healthy
+
+
+def _backend(backend_type: str) -> BackendProtocol:
+    """Get the shared backend instance for *backend_type*."""
+    backend = _backends.get(backend_type)
+    if backend is None:
+        backend = _backends[backend_type] = create_backend(backend_type)
+    return backend
+
+
+async def _check_one(
+    name: str, ctx: SessionContext, timeout: float, limit: asyncio.Semaphore
+) -> bool:
+    """Run one health check for a tracked session and record the outcome on *ctx*.
+
+    Returns True when the session is healthy and within its TTL.
+    """
+    slog = get_logger(session_name=name, container_name=ctx.container_name)
+
+    try:
+        # Delegate health check to backend with timeout
+        backend = _backend(ctx.backend)
+        async with limit:
+            # Metrics only feed the debug log below; skip them when it is filtered
+            include_stats = slog.is_enabled_for(logging.DEBUG)
+            health = await asyncio.wait_for(
+                backend.health_check(ctx, include_stats=include_stats), timeout=timeout
+            )
+
+        if not health.get("healthy", False):
+            ctx.health_failures += 1
+            slog.warning(
+                "monitor.unhealthy",
+                metadata={
+                    "backend": ctx.backend,
+                    "failures": ctx.health_failures,
+                    "reason": health.get("reason", "unknown"),
+                },
+            )
+            # Remove from tracking if it's gone
+            if "not found" in health.get("reason", "").lower():
+                _tracked.pop(name, None)
+            return False
+
+        # Log health metrics (backend-specific)
+        if ctx.backend == "docker":
+            cpu_pct = health.get("cpu_percent", 0)
+            mem_usage_human = health.get("memory_usage_human", "0B")
+            mem_limit_human = health.get("memory_limit_human", "0B")
+            slog.debug(
+                "monitor.health_check",
+                metadata={
+                    "backend": "docker",
+                    "stats": {
+                        "cpu": f"{cpu_pct:.2f}%",
+                        "mem": f"{mem_usage_human} / {mem_limit_human}",
                     },
-                )
-            except Exception as exc:
-                slog.warning(
-                    "monitor.check_failed",
-                    metadata={"reason": str(exc), "backend": ctx.backend},
-                )
-
-        await asyncio.sleep(interval)
+                },
+            )
+        elif ctx.backend == "utm":
+            vm_state = health.get("vm_state", "unknown")
+            ssh_reachable = health.get("ssh_reachable", False)
+            slog.debug(
+                "monitor.health_check",
+                metadata={
+                    "backend": "utm",
+                    "vm_state": vm_state,
+                    "ssh_reachable": ssh_reachable,
+                    "ssh_port": ctx.ssh_port,
+                },
+            )
+
+        # Check TTL (same for all backends)
+        elapsed = (time.time_ns() // 1_000_000 - ctx.created_at) / 1000
+        if ctx.ttl > 0 and elapsed > ctx.ttl:
+            slog.warning(
+                "monitor.ttl_expired",
+                metadata={"elapsed": elapsed, "ttl": ctx.ttl, "backend": ctx.backend},
+            )
+            ctx.state = SessionState.RECYCLING
+            return False
+        return True
+
+    except asyncio.TimeoutError:
+        ctx.health_failures += 1
+        slog.warning(
+            "monitor.health_check_timeout",
+            metadata={
+                "backend": ctx.backend,
+                "timeout": timeout,
+                "failures": ctx.health_failures,
+            },
+        )
+    except Exception as exc:
+        slog.warning(
+            "monitor.check_failed",
+            metadata={"reason": str(exc), "backend": ctx.backend},
+        )
+    return False
@@ -8,6 +8,14 @@ from .registry import get_agent, validate_token
 
 log = get_logger()
 
+# Shared results for the common outcomes; callers only read them
+_ALLOWED = PolicyResult(allowed=True)
+_NO_SENDER_TOKEN = PolicyResult(allowed=False, reason="No sender token provided")
+_SENDER_TOKEN_INVALID = PolicyResult(allowed=False, reason="Sender token is invalid or expired")
+_NO_PAYLOAD_TYPE = PolicyResult(allowed=False, reason="Payload must have a type field")
+_NO_TOKEN = PolicyResult(allowed=False, reason="No token provided")
+_TOKEN_INVALID = PolicyResult(allowed=False, reason="Token is invalid or expired")
+
 
 def evaluate_task_assignment(agent_def: AgentDefinition | None, task: Task) -> PolicyResult:
     """Check whether a task can be assigned to a given agent."""
@@ -21,7 +29,7 @@ def evaluate_task_assignment(agent_def: AgentDefinition | None, task: Task) -> P
         return PolicyResult(allowed=False, reason="Task must have a description")
 
     log.info("policy.task_allowed", metadata={"agent": agent_def.name, "task_id": task.id})
-    return PolicyResult(allowed=True)
+    return _ALLOWED
 
 
 def evaluate_message(
@@ -29,10 +37,10 @@ def evaluate_message(
 ) -> PolicyResult:
     """Check whether a message from sender to recipient is allowed."""
     if not sender_token:
-        return PolicyResult(allowed=False, reason="No sender token provided")
+        return _NO_SENDER_TOKEN
 
     if not validate_token(sender_token.token_id):
-        return PolicyResult(allowed=False, reason="Sender token is invalid or expired")
+        return _SENDER_TOKEN_INVALID
 
     if recipient_name and recipient_name != "hub":
         if not get_agent(recipient_name):
@@ -47,22 +55,22 @@ def evaluate_message(
             )
 
     if not payload or "type" not in payload:
-        return PolicyResult(allowed=False, reason="Payload must have a type field")
+        return _NO_PAYLOAD_TYPE
 
-    return PolicyResult(allowed=True)
+    return _ALLOWED
 
 
 def evaluate_capability(token: Token | None, required_cap: str) -> PolicyResult:
     """Check whether a token has a specific capability."""
     if not token:
-        return PolicyResult(allowed=False, reason="No token provided")
+        return _NO_TOKEN
 
     if not validate_token(token.token_id):
-        return PolicyResult(allowed=False, reason="Token is invalid or expired")
+        return _TOKEN_INVALID
 
     if required_cap not in token.capabilities:
         return PolicyResult(
             allowed=False, reason=f"Token lacks required capability '{required_cap}'"
         )
 
-    return PolicyResult(allowed=True)
+    return _ALLOWED
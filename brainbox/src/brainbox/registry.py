@@ -6,10 +6,16 @@ Extended to support markdown role prompts absorbed from multiclaude
 
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import stat
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import ValidationError
 
 from .config import settings
 from .log import get_logger
@@ -23,9 +29,19 @@ log = get_logger()
 
 _agents: dict[str, AgentDefinition] = {}
 _tokens: dict[str, Token] = {}
-_last_token_sweep: float = 0.0
+# agent_name -> token_ids, kept in step with _tokens so message routing can
+# find an agent's tokens without scanning every token
+_tokens_by_agent: dict[str, set[str]] = {}
+# (expiry ms, token_id) min-heap so sweeps only visit expired tokens.  Revoked
+# tokens leave stale entries behind; they are skipped when popped.
+_expiry_heap: list[tuple[int, str]] = []
+# token_id -> model_dump() of the token, filled on first flush.  Tokens are
+# never mutated after issue, so each one is serialized at most once.
+_token_dumps: dict[str, dict] = {}
 # Loaded role prompt content keyed by agent name
 _role_prompts: dict[str, str] = {}
+# Parsed agent files keyed by path, reused while (mtime_ns, size) is unchanged
+_agent_file_cache: dict[Path, tuple[tuple[int, int], AgentDefinition]] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -42,12 +58,36 @@ def load_agents() -> dict[str, AgentDefinition]:
         log.warning("registry.no_agents_dir", metadata={"dir": str(agents_dir)})
         return _agents
 
-    for f in sorted(agents_dir.iterdir()):
-        if not f.suffix == ".json":
+    with os.scandir(agents_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".json") and e.is_file()), key=lambda e: e.name
+        )
+    files = [Path(e.path) for e in entries]
+    stats: dict[Path, os.stat_result | Exception] = {}
+    for f, entry in zip(files, entries):
+        try:
+            stats[f] = entry.stat()
+        except Exception as exc:
+            stats[f] = exc
+
+    # Read every new or edited file up front so their I/O overlaps
+    stale: list[Path] = []
+    for f, st in stats.items():
+        if isinstance(st, Exception):
             continue
+        cached = _agent_file_cache.get(f)
+        if cached is None or cached[0] != (st.st_mtime_ns, st.st_size):
+            stale.append(f)
+    contents = _read_files(stale)
+
+    for f in files:
         try:
+            st = stats[f]
+            if isinstance(st, Exception):
+                raise st
+
             # Check file permissions — warn if world-writable
-            mode = f.stat().st_mode
+            mode = st.st_mode
             if mode & stat.S_IWOTH:
                 log.warning(
                     "registry.agent_world_writable",
@@ -56,21 +96,38 @@ def load_agents() -> dict[str, AgentDefinition]:
                 # Enforce safe permissions — strip world-write bit
                 f.chmod(mode & ~stat.S_IWOTH)
 
-            raw = json.loads(f.read_text())
-
-            # Validate required fields
-            if not raw.get("name") or not raw.get("image"):
-                log.warning(
-                    "registry.agent_missing_fields",
-                    metadata={
-                        "file": f.name,
-                        "has_name": bool(raw.get("name")),
-                        "has_image": bool(raw.get("image")),
-                    },
-                )
-                continue
-
-            agent = AgentDefinition(**raw)
+            fingerprint = (st.st_mtime_ns, st.st_size)
+            cached = _agent_file_cache.get(f)
+            if cached is not None and cached[0] == fingerprint:
+                agent = cached[1]
+            else:
+                data = contents[f]
+                if isinstance(data, Exception):
+                    raise data
+                # Parse straight into the model; no intermediate dict
+                try:
+                    agent = AgentDefinition.model_validate_json(data)
+                    name, image = agent.name, agent.image
+                except ValidationError:
+                    # Re-parse only to tell missing fields apart from other errors
+                    raw = json.loads(data)
+                    name, image = raw.get("name"), raw.get("image")
+                    if name and image:
+                        raise
+
+                # Validate required fields
+                if not name or not image:
+                    log.warning(
+                        "registry.agent_missing_fields",
+                        metadata={
+                            "file": f.name,
+                            "has_name": bool(name),
+                            "has_image": bool(image),
+                        },
+                    )
+                    continue
+
+                _agent_file_cache[f] = (fingerprint, agent)
             _agents[agent.name] = agent
 
             # Load role prompt if specified
@@ -89,9 +146,28 @@ def load_agents() -> dict[str, AgentDefinition]:
         except Exception as exc:
             log.warning("registry.agent_load_failed", metadata={"file": f.name, "reason": str(exc)})
 
+    # Forget files that have been removed since the last load
+    for gone in _agent_file_cache.keys() - stats.keys():
+        del _agent_file_cache[gone]
+
     return _agents
 
 
+def _read_files(paths: list[Path]) -> dict[Path, bytes | Exception]:
+    """Read *paths* on a small thread pool, capturing per-file errors."""
+
+    def read(path: Path) -> bytes | Exception:
+        try:
+            return path.read_bytes()
+        except Exception as exc:
+            return exc
+
+    if len(paths) < 2:
+        return {p: read(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as pool:
+        return dict(zip(paths, pool.map(read, paths)))
+
+
 def _load_role_prompt(agent: AgentDefinition) -> None:
     """Load the markdown role prompt for an agent definition."""
     if not agent.role_prompt:
@@ -135,17 +211,19 @@ def issue_token(agent_name: str, task_id: str, ttl: int = 3600) -> Token:
     if not agent:
         raise ValueError(f"Agent '{agent_name}' not registered")
 
-    now = int(time.time() * 1000)
-    token = Token(
+    now = _now_ms()
+    # Every field is already valid, so skip validation; that also lets the
+    # token share the agent's name and capabilities rather than copying them
+    token = Token.model_construct(
         token_id=str(uuid.uuid4()),
-        agent_name=agent_name,
+        agent_name=agent.name,
         task_id=task_id,
-        capabilities=list(agent.capabilities),
+        capabilities=agent.capabilities,
         issued=now,
         expiry=now + ttl * 1000,
     )
 
-    _tokens[token.token_id] = token
+    _add_token(token)
     log.info(
         "registry.token_issued",
         metadata={
@@ -159,49 +237,99 @@ def issue_token(agent_name: str, task_id: str, ttl: int = 3600) -> Token:
 
 
 def validate_token(token_id: str) -> Token | None:
-    token = _tokens.get(token_id)
-    if not token:
-        return None
-    now = int(time.time() * 1000)
-    if now > token.expiry:
-        _tokens.pop(token_id, None)
-        return None
-    return token
+    # Sweeping here too keeps _tokens bounded when nothing calls list_tokens()
+    _sweep_expired(_now_ms())
+    return _tokens.get(token_id)
 
 
 def revoke_token(token_id: str) -> bool:
-    existed = token_id in _tokens
-    _tokens.pop(token_id, None)
+    existed = _drop_token(token_id) is not None
     if existed:
         log.info("registry.token_revoked", metadata={"token_id": token_id})
+        # Revoked tokens leave their heap entries behind; once those outnumber
+        # live tokens, one rebuild beats popping them one at a time later
+        if len(_expiry_heap) > 2 * len(_tokens) + 32:
+            _expiry_heap[:] = [(t.expiry, tid) for tid, t in _tokens.items()]
+            heapq.heapify(_expiry_heap)
     return existed
 
 
 def list_tokens() -> list[Token]:
-    global _last_token_sweep
-    if time.monotonic() - _last_token_sweep > 60 or len(_tokens) > 100:
-        now = int(time.time() * 1000)
-        expired = [tid for tid, t in _tokens.items() if now > t.expiry]
-        for tid in expired:
-            _tokens.pop(tid, None)
-        _last_token_sweep = time.monotonic()
+    _sweep_expired(_now_ms())
     return list(_tokens.values())
 
 
+def _sweep_expired(now: int) -> None:
+    """Drop every token whose expiry is before *now*."""
+    heap = _expiry_heap
+    while heap and heap[0][0] < now:
+        expiry, tid = heapq.heappop(heap)
+        token = _tokens.get(tid)
+        if token is not None and token.expiry == expiry:
+            _drop_token(tid)
+
+
+def tokens_for_agent(agent_name: str) -> list[Token]:
+    """Unexpired tokens issued to *agent_name*, via the per-agent index."""
+    token_ids = _tokens_by_agent.get(agent_name)
+    if not token_ids:
+        return []
+    now = _now_ms()
+    result: list[Token] = []
+    for tid in list(token_ids):
+        token = _tokens.get(tid)
+        if token is None or now > token.expiry:
+            _drop_token(tid)
+        else:
+            result.append(token)
+    return result
+
+
+def _now_ms() -> int:
+    """Wall-clock epoch ms; token expiry must survive restarts, so not monotonic."""
+    return time.time_ns() // 1_000_000
+
+
+def _add_token(token: Token) -> None:
+    _tokens[token.token_id] = token
+    _token_dumps.pop(token.token_id, None)
+    heapq.heappush(_expiry_heap, (token.expiry, token.token_id))
+    _tokens_by_agent.setdefault(token.agent_name, set()).add(token.token_id)
+
+
+def _drop_token(token_id: str) -> Token | None:
+    token = _tokens.pop(token_id, None)
+    _token_dumps.pop(token_id, None)
+    if token is not None:
+        ids = _tokens_by_agent.get(token.agent_name)
+        if ids is not None:
+            ids.discard(token_id)
+            if not ids:
+                del _tokens_by_agent[token.agent_name]
+    return token
+
+
 # ---------------------------------------------------------------------------
 # State serialization
 # ---------------------------------------------------------------------------
 
 
 def get_state() -> dict:
-    return {"tokens": [(tid, t.model_dump()) for tid, t in _tokens.items()]}
+    dumps = _token_dumps
+    tokens = []
+    for tid, t in _tokens.items():
+        data = dumps.get(tid)
+        if data is None:
+            data = dumps[tid] = t.model_dump()
+        tokens.append((tid, data))
+    return {"tokens": tokens}
 
 
 def restore_state(state: dict | None) -> None:
     if not state or "tokens" not in state:
         return
-    now = int(time.time() * 1000)
+    now = _now_ms()
     for tid, data in state["tokens"]:
         token = Token(**data)
         if now <= token.expiry:
-            _tokens[tid] = token
+            _add_token(token)
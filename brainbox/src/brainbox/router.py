@@ -6,13 +6,15 @@ from multiclaude (Dan Lorenc, github.com/dlorenc/multiclaude).
 
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
 from typing import Any, Callable
 
+from . import lifecycle
 from .config import settings
 from .log import get_logger
-from .models import Repository, Task, TaskStatus
+from .models import Repository, SessionContext, SessionState, Task, TaskStatus
 from .policy import evaluate_task_assignment
 from .registry import get_agent, issue_token, revoke_token
 
@@ -23,9 +25,17 @@ log = get_logger()
 # ---------------------------------------------------------------------------
 
 _tasks: dict[str, Task] = {}
+# Secondary indexes over _tasks (status value / agent name -> {task id: task}),
+# kept in step by _add_task() and _set_status() so list_tasks() only touches
+# the tasks it returns
+_tasks_by_status: dict[str, dict[str, Task]] = {}
+_tasks_by_agent: dict[str, dict[str, Task]] = {}
 _listeners: list[Callable[[str, Task], None]] = []
 _repos: dict[str, Repository] = {}  # name -> Repository
 
+# Upper bound on task recoveries (recycle / restart) run at once
+_RECOVERY_CONCURRENCY = 8
+
 
 def _emit(event: str, task: Task) -> None:
     for fn in _listeners:
@@ -35,6 +45,24 @@ def _emit(event: str, task: Task) -> None:
             pass
 
 
+def _add_task(task: Task) -> None:
+    _tasks[task.id] = task
+    _tasks_by_status.setdefault(task.status.value, {})[task.id] = task
+    _tasks_by_agent.setdefault(task.agent_name, {})[task.id] = task
+
+
+def _set_status(task: Task, status: TaskStatus) -> None:
+    """Change a tracked task's status, moving it between status buckets."""
+    old = _tasks_by_status.get(task.status.value)
+    if old is not None:
+        old.pop(task.id, None)
+        if not old:
+            del _tasks_by_status[task.status.value]
+    task.status = status
+    if task.id in _tasks:
+        _tasks_by_status.setdefault(status.value, {})[task.id] = task
+
+
 def on_event(fn: Callable[[str, Task], None]) -> None:
     """Register an event listener (for SSE bridge)."""
     _listeners.append(fn)
@@ -56,8 +84,6 @@ async def submit_task(
     When *repo_url* is provided the task is associated with a tracked repo
     and the container receives the repo's volume mount + role prompt.
     """
-    from . import lifecycle
-
     if not description:
         raise ValueError("Task description is required")
     if not agent_name:
@@ -94,7 +120,7 @@ async def submit_task(
     task.session_name = session_name
     task.status = TaskStatus.RUNNING
     task.updated_at = _now_ms()
-    _tasks[task_id] = task
+    _add_task(task)
 
     # Resolve workspace context from registered repo (for credential mounts)
     repo_workspace_home = None
@@ -118,7 +144,7 @@ async def submit_task(
             workspace_profile=repo_workspace_profile,
         )
     except Exception as exc:
-        task.status = TaskStatus.FAILED
+        _set_status(task, TaskStatus.FAILED)
         task.error = str(exc)
         task.updated_at = _now_ms()
         revoke_token(token.token_id)
@@ -171,7 +197,7 @@ def register_ci_ratchet_task(
         token_id=token.token_id,
         session_name=session_name,
     )
-    _tasks[task_id] = task
+    _add_task(task)
     log.info(
         "router.ci_ratchet_task_registered",
         metadata={"task_id": task_id, "session": session_name, "repo": repo_url},
@@ -188,26 +214,32 @@ def list_tasks(
     status: str | None = None,
     agent_name: str | None = None,
 ) -> list[Task]:
-    result = list(_tasks.values())
-    if status:
-        result = [t for t in result if t.status == status]
-    if agent_name:
-        result = [t for t in result if t.agent_name == agent_name]
+    if status and agent_name:
+        by_status = _tasks_by_status.get(status, {})
+        by_agent = _tasks_by_agent.get(agent_name, {})
+        if len(by_agent) < len(by_status):
+            result = [t for tid, t in by_agent.items() if tid in by_status]
+        else:
+            result = [t for tid, t in by_status.items() if tid in by_agent]
+    elif status:
+        result = list(_tasks_by_status.get(status, {}).values())
+    elif agent_name:
+        result = list(_tasks_by_agent.get(agent_name, {}).values())
+    else:
+        result = list(_tasks.values())
     result.sort(key=lambda t: t.created_at, reverse=True)
     return result
 
 
 async def complete_task(task_id: str, result: Any = None) -> Task:
     """Mark a task as completed and recycle its container."""
-    from . import lifecycle
-
     task = _tasks.get(task_id)
     if not task:
         raise ValueError(f"Task '{task_id}' not found")
     if task.status != TaskStatus.RUNNING:
         raise ValueError(f"Task '{task_id}' is not running (status: {task.status})")
 
-    task.status = TaskStatus.COMPLETED
+    _set_status(task, TaskStatus.COMPLETED)
     task.result = result
     task.updated_at = _now_ms()
 
@@ -228,13 +260,11 @@ async def complete_task(task_id: str, result: Any = None) -> Task:
 
 
 async def fail_task(task_id: str, error: str | None = None) -> Task:
-    from . import lifecycle
-
     task = _tasks.get(task_id)
     if not task:
         raise ValueError(f"Task '{task_id}' not found")
 
-    task.status = TaskStatus.FAILED
+    _set_status(task, TaskStatus.FAILED)
     task.error = error or "Unknown error"
     task.updated_at = _now_ms()
 
@@ -253,15 +283,13 @@ async def fail_task(task_id: str, error: str | None = None) -> Task:
 
 
 async def cancel_task(task_id: str) -> Task:
-    from . import lifecycle
-
     task = _tasks.get(task_id)
     if not task:
         raise ValueError(f"Task '{task_id}' not found")
     if task.status not in (TaskStatus.RUNNING, TaskStatus.PENDING):
         raise ValueError(f"Task '{task_id}' cannot be cancelled (status: {task.status})")
 
-    task.status = TaskStatus.CANCELLED
+    _set_status(task, TaskStatus.CANCELLED)
     task.updated_at = _now_ms()
 
     if task.session_name:
@@ -283,44 +311,60 @@ async def check_running_tasks() -> None:
 
     Implements role-aware recovery: persistent agents (merge-queue, PR shepherd,
     supervisor) auto-restart on failure; transient agents (worker, reviewer)
-    clean up.
+    clean up.  Affected tasks are recovered concurrently, at most
+    ``_RECOVERY_CONCURRENCY`` at a time.
     """
-    from . import lifecycle
+    to_recover: list[tuple[Task, SessionContext | None]] = []
+    for task in list(_tasks_by_status.get(TaskStatus.RUNNING.value, {}).values()):
+        session = lifecycle.get_session(task.session_name)
+        if not session or session.state == SessionState.RECYCLED:
+            to_recover.append((task, session))
+    if not to_recover:
+        return
 
-    for task in list(_tasks.values()):
-        if task.status != TaskStatus.RUNNING:
-            continue
+    limit = asyncio.Semaphore(_RECOVERY_CONCURRENCY)
 
-        session = lifecycle.get_session(task.session_name)
-        if not session:
-            agent_def = get_agent(task.agent_name)
-            if agent_def and agent_def.persistent:
-                log.info(
-                    "router.persistent_agent_restart",
-                    metadata={"task_id": task.id, "agent": task.agent_name},
-                )
-                try:
-                    await _restart_persistent_task(task)
-                except Exception as exc:
-                    log.error(
-                        "router.restart_failed",
-                        metadata={"task_id": task.id, "reason": str(exc)},
-                    )
-                    await fail_task(task.id, f"Restart failed: {exc}")
-            else:
-                await fail_task(task.id, "Container no longer exists")
-            continue
-
-        from .models import SessionState
-
-        if session.state == SessionState.RECYCLED:
-            await fail_task(task.id, "Container was recycled externally")
+    async def recover(task: Task, session: SessionContext | None) -> None:
+        async with limit:
+            await _recover_task(task, session)
+
+    results = await asyncio.gather(
+        *(recover(task, session) for task, session in to_recover), return_exceptions=True
+    )
+    for (task, _), result in zip(to_recover, results):
+        if isinstance(result, Exception):
+            log.error(
+                "router.recovery_failed",
+                metadata={"task_id": task.id, "reason": str(result)},
+            )
+
+
+async def _recover_task(task: Task, session: SessionContext | None) -> None:
+    """Restart or fail a running task whose container is gone or recycled."""
+    if session:
+        await fail_task(task.id, "Container was recycled externally")
+        return
+
+    agent_def = get_agent(task.agent_name)
+    if agent_def and agent_def.persistent:
+        log.info(
+            "router.persistent_agent_restart",
+            metadata={"task_id": task.id, "agent": task.agent_name},
+        )
+        try:
+            await _restart_persistent_task(task)
+        except Exception as exc:
+            log.error(
+                "router.restart_failed",
+                metadata={"task_id": task.id, "reason": str(exc)},
+            )
+            await fail_task(task.id, f"Restart failed: {exc}")
+    else:
+        await fail_task(task.id, "Container no longer exists")
 
 
 async def _restart_persistent_task(task: Task) -> None:
     """Restart a persistent agent's container after failure."""
-    from . import lifecycle
-
     agent_def = get_agent(task.agent_name)
     if not agent_def:
         raise ValueError(f"Agent '{task.agent_name}' not found for restart")
@@ -486,7 +530,7 @@ def restore_state(state: dict | None) -> None:
             task = Task(**data)
             if task.status in _terminal:
                 continue
-            _tasks[tid] = task
+            _add_task(task)
     # Restore repos
     if "repos" in state:
         for name, data in state["repos"]:
@@ -494,4 +538,4 @@ def restore_state(state: dict | None) -> None:
 
 
 def _now_ms() -> int:
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
@@ -367,7 +367,6 @@ class TestArtifactAPI:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_upload(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         result = ArtifactResult(key="test/f.txt", size=5, etag="abc", timestamp=100)
@@ -382,7 +381,6 @@ class TestArtifactAPI:
         assert body["stored"] is True
         assert body["key"] == "test/f.txt"
 
-    @pytest.mark.asyncio
     async def test_download(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         with patch(
@@ -393,7 +391,6 @@ class TestArtifactAPI:
         assert resp.status_code == 200
         assert resp.content == b"content"
 
-    @pytest.mark.asyncio
     async def test_list(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         items = [
@@ -407,7 +404,6 @@ class TestArtifactAPI:
         assert len(data) == 2
         assert data[0]["key"] == "a.txt"
 
-    @pytest.mark.asyncio
     async def test_delete(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         with patch("brainbox.api.delete_artifact"):
@@ -415,7 +411,6 @@ class TestArtifactAPI:
         assert resp.status_code == 200
         assert resp.json()["deleted"] is True
 
-    @pytest.mark.asyncio
     async def test_health(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         with patch("brainbox.api.artifact_health_check", return_value=True):
@@ -433,7 +428,6 @@ class TestArtifactModes:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_off_returns_503(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "off")
         resp = await client.post(
@@ -442,7 +436,6 @@ class TestArtifactModes:
         )
         assert resp.status_code == 503
 
-    @pytest.mark.asyncio
     async def test_warn_swallows_errors(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         with patch(
@@ -453,7 +446,6 @@ class TestArtifactModes:
         assert resp.status_code == 201
         assert resp.json()["stored"] is False
 
-    @pytest.mark.asyncio
     async def test_enforce_returns_502(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "enforce")
         with patch(
@@ -463,7 +455,6 @@ class TestArtifactModes:
             resp = await client.post("/api/artifacts/test/f.txt", content=b"hello")
         assert resp.status_code == 502
 
-    @pytest.mark.asyncio
     async def test_health_off(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "off")
         resp = await client.get("/api/artifacts/health")
@@ -472,7 +463,6 @@ class TestArtifactModes:
         assert data["healthy"] is False
         assert data["mode"] == "off"
 
-    @pytest.mark.asyncio
     async def test_download_warn_not_found_returns_404(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         with patch(
@@ -482,7 +472,6 @@ class TestArtifactModes:
             resp = await client.get("/api/artifacts/test/f.txt")
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_download_enforce_not_found_returns_404(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "enforce")
         with patch(
@@ -492,7 +481,6 @@ class TestArtifactModes:
             resp = await client.get("/api/artifacts/test/f.txt")
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_warn_swallows_connection_errors(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "warn")
         with patch(
@@ -503,7 +491,6 @@ class TestArtifactModes:
         assert resp.status_code == 201
         assert resp.json()["stored"] is False
 
-    @pytest.mark.asyncio
     async def test_enforce_connection_error_returns_502(self, client, monkeypatch):
         monkeypatch.setattr(settings.artifact, "mode", "enforce")
         with patch(
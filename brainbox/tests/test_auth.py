@@ -2,27 +2,30 @@
 
 from __future__ import annotations
 
+import secrets
 import stat
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from fastapi import HTTPException
 
 import brainbox.auth as auth_module
-from brainbox.auth import generate_api_key, load_or_create_key, require_api_key
+from brainbox.auth import (
+    generate_api_key,
+    get_api_key,
+    load_or_create_key,
+    require_api_key,
+)
 
 
 class TestGenerateApiKey:
-    def test_length(self):
-        key = generate_api_key()
-        assert len(key) == 64
-
-    def test_hex(self):
-        key = generate_api_key()
-        int(key, 16)  # Should not raise
-
-    def test_unique(self):
-        keys = {generate_api_key() for _ in range(10)}
-        assert len(keys) == 10
+    def test_keys_are_unique_64_char_hex(self):
+        n = 10
+        keys = [generate_api_key() for _ in range(n)]
+        for key in keys:
+            assert len(key) == 64
+            int(key, 16)  # Should not raise
+        assert len(set(keys)) == n
 
 
 class TestLoadOrCreateKey:
@@ -69,14 +72,31 @@ class TestLoadOrCreateKey:
         monkeypatch.delenv("CL_API_KEY")
 
 
+class _FakeHeaders:
+    __slots__ = ("d",)
+
+    def __init__(self, d: dict[str, str]) -> None:
+        self.d = d
+
+    def get(self, key: str, default: str = "") -> str:
+        return self.d.get(key, default)
+
+
+class _FakeRequest:
+    """Minimal stand-in for a Starlette request; only ``headers.get`` is used."""
+
+    __slots__ = ("headers",)
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = _FakeHeaders(headers)
+
+
 class TestRequireApiKey:
-    def _make_request(self, api_key_header: str | None = None) -> MagicMock:
-        request = MagicMock()
+    def _make_request(self, api_key_header: str | None = None) -> _FakeRequest:
         headers = {}
         if api_key_header is not None:
             headers["x-api-key"] = api_key_header
-        request.headers.get = lambda key, default="": headers.get(key, default)
-        return request
+        return _FakeRequest(headers)
 
     def test_valid_key(self, monkeypatch):
         monkeypatch.setattr(auth_module, "_api_key", "valid-test-key")
@@ -85,8 +105,6 @@ class TestRequireApiKey:
         require_api_key(request)
 
     def test_missing_key(self, monkeypatch):
-        from fastapi import HTTPException
-
         monkeypatch.setattr(auth_module, "_api_key", "valid-test-key")
         request = self._make_request()
         with pytest.raises(HTTPException) as exc_info:
@@ -95,8 +113,6 @@ class TestRequireApiKey:
         assert "API key" in exc_info.value.detail
 
     def test_invalid_key(self, monkeypatch):
-        from fastapi import HTTPException
-
         monkeypatch.setattr(auth_module, "_api_key", "valid-test-key")
         request = self._make_request("wrong-key")
         with pytest.raises(HTTPException) as exc_info:
@@ -105,8 +121,6 @@ class TestRequireApiKey:
 
     def test_no_server_key_configured(self, monkeypatch):
         """When server has no key loaded, all requests should be rejected."""
-        from fastapi import HTTPException
-
         monkeypatch.setattr(auth_module, "_api_key", "")
         request = self._make_request("any-key")
         with pytest.raises(HTTPException) as exc_info:
@@ -115,8 +129,6 @@ class TestRequireApiKey:
 
     def test_constant_time_comparison(self, monkeypatch):
         """Verify we use constant-time comparison (secrets.compare_digest)."""
-        import secrets
-
         monkeypatch.setattr(auth_module, "_api_key", "valid-key")
         request = self._make_request("valid-key")
         with patch.object(secrets, "compare_digest", return_value=True) as mock_compare:
@@ -126,13 +138,9 @@ class TestRequireApiKey:
 
 class TestGetApiKey:
     def test_returns_loaded_key(self, monkeypatch):
-        from brainbox.auth import get_api_key
-
         monkeypatch.setattr(auth_module, "_api_key", "my-key")
         assert get_api_key() == "my-key"
 
     def test_returns_empty_before_load(self, monkeypatch):
-        from brainbox.auth import get_api_key
-
         monkeypatch.setattr(auth_module, "_api_key", "")
         assert get_api_key() == ""
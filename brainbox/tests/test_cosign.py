@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
-from docker.errors import NotFound
 
+import brainbox.lifecycle as lc
 from brainbox.config import CosignSettings, settings
 from brainbox.cosign import (
     CosignResult,
@@ -16,6 +18,42 @@ from brainbox.cosign import (
     verify_image,
     verify_image_keyless,
 )
+from brainbox.lifecycle import provision
+
+
+def _stub(value=None):
+    """Return a callable that records ``(args, kwargs)`` in ``.calls`` and returns *value*."""
+    calls = []
+
+    def stub(*args, **kwargs):
+        calls.append((args, kwargs))
+        return value
+
+    stub.calls = calls
+    return stub
+
+
+def _fast_setattrs(obj, **values):
+    """Assign *values* on a settings object without pydantic validation.
+
+    Returns the previous values so the caller can restore them the same way.
+    """
+    saved = {name: getattr(obj, name) for name in values}
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
+    return saved
+
+
+_IDENTITY = "https://github.com/owner/repo/.*"
+_ISSUER = "https://token.actions.githubusercontent.com"
+
+_CP_OK = subprocess.CompletedProcess(args=["cosign"], returncode=0, stdout="ok", stderr="")
+_CP_OK_VERIFIED = subprocess.CompletedProcess(
+    args=["cosign"], returncode=0, stdout="Verification OK", stderr=""
+)
+_CP_FAIL_NOSIG = subprocess.CompletedProcess(
+    args=["cosign"], returncode=1, stdout="", stderr="no matching sig"
+)
 
 
 # ---------------------------------------------------------------------------
@@ -65,26 +103,25 @@ class TestCosignVerificationError:
 
 
 class TestCosignRun:
-    def test_success(self):
-        fake = subprocess.CompletedProcess(args=["cosign"], returncode=0, stdout="ok", stderr="")
-        with patch("brainbox.cosign.subprocess.run", return_value=fake) as mock_run:
-            result = _cosign_run(["verify", "--key", "k.pub", "img"])
+    def test_success(self, monkeypatch):
+        run = _stub(_CP_OK)
+        monkeypatch.setattr("brainbox.cosign.subprocess.run", run)
+        result = _cosign_run(["verify", "--key", "k.pub", "img"])
 
         assert result.returncode == 0
-        mock_run.assert_called_once_with(
-            ["cosign", "verify", "--key", "k.pub", "img"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        assert run.calls == [
+            (
+                (["cosign", "verify", "--key", "k.pub", "img"],),
+                {"capture_output": True, "text": True, "timeout": 30},
+            )
+        ]
 
-    def test_failure_returns_result(self):
-        fake = subprocess.CompletedProcess(args=["cosign"], returncode=1, stdout="", stderr="error")
-        with patch("brainbox.cosign.subprocess.run", return_value=fake):
-            result = _cosign_run(["verify", "--key", "k.pub", "img"])
+    def test_failure_returns_result(self, monkeypatch):
+        monkeypatch.setattr("brainbox.cosign.subprocess.run", _stub(_CP_FAIL_NOSIG))
+        result = _cosign_run(["verify", "--key", "k.pub", "img"])
 
         assert result.returncode == 1
-        assert result.stderr == "error"
+        assert result.stderr == "no matching sig"
 
     def test_binary_not_found(self):
         with patch("brainbox.cosign.subprocess.run", side_effect=FileNotFoundError):
@@ -100,112 +137,50 @@ class TestCosignRun:
 
 
 # ---------------------------------------------------------------------------
-# verify_image
+# verify_image / verify_image_keyless
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.parametrize(
+    ("verify", "extra", "flags"),
+    [
+        pytest.param(verify_image, ("/k.pub",), ["--key", "/k.pub"], id="key"),
+        pytest.param(
+            verify_image_keyless,
+            (_IDENTITY, _ISSUER),
+            ["--certificate-identity-regexp", _IDENTITY, "--certificate-oidc-issuer", _ISSUER],
+            id="keyless",
+        ),
+    ],
+)
 class TestVerifyImage:
-    def test_success(self):
-        fake = subprocess.CompletedProcess(
-            args=["cosign"], returncode=0, stdout="Verification OK", stderr=""
-        )
-        with patch("brainbox.cosign._cosign_run", return_value=fake) as mock_run:
-            result = verify_image("myimg:latest", "/tmp/k.pub", ["myimg@sha256:abc123"])
-
-        assert result.verified is True
-        assert result.image_ref == "myimg@sha256:abc123"
-        mock_run.assert_called_once_with(["verify", "--key", "/tmp/k.pub", "myimg@sha256:abc123"])
-
-    def test_failure(self):
-        fake = subprocess.CompletedProcess(
-            args=["cosign"], returncode=1, stdout="", stderr="no matching sig"
-        )
-        with patch("brainbox.cosign._cosign_run", return_value=fake):
-            result = verify_image("myimg:latest", "/tmp/k.pub", ["myimg@sha256:abc123"])
-
-        assert result.verified is False
-        assert result.stderr == "no matching sig"
-
-    def test_uses_first_digest(self):
-        fake = subprocess.CompletedProcess(args=["cosign"], returncode=0, stdout="ok", stderr="")
-        with patch("brainbox.cosign._cosign_run", return_value=fake) as mock_run:
-            verify_image("myimg:latest", "/k.pub", ["first@sha256:aaa", "second@sha256:bbb"])
-
-        args = mock_run.call_args[0][0]
-        assert args[-1] == "first@sha256:aaa"
-
-    def test_empty_repo_digests_raises(self):
-        with pytest.raises(ValueError, match="no repo digests"):
-            verify_image("myimg:latest", "/k.pub", [])
-
-
-# ---------------------------------------------------------------------------
-# verify_image_keyless
-# ---------------------------------------------------------------------------
-
-
-class TestVerifyImageKeyless:
-    def test_success(self):
-        fake = subprocess.CompletedProcess(
-            args=["cosign"], returncode=0, stdout="Verification OK", stderr=""
-        )
-        with patch("brainbox.cosign._cosign_run", return_value=fake) as mock_run:
-            result = verify_image_keyless(
-                "myimg:latest",
-                "https://github.com/owner/repo/.*",
-                "https://token.actions.githubusercontent.com",
-                ["myimg@sha256:abc123"],
-            )
+    def test_success(self, monkeypatch, verify, extra, flags):
+        run = _stub(_CP_OK_VERIFIED)
+        monkeypatch.setattr("brainbox.cosign._cosign_run", run)
+        result = verify("myimg:latest", *extra, ["myimg@sha256:abc123"])
 
         assert result.verified is True
         assert result.image_ref == "myimg@sha256:abc123"
-        mock_run.assert_called_once_with(
-            [
-                "verify",
-                "--certificate-identity-regexp",
-                "https://github.com/owner/repo/.*",
-                "--certificate-oidc-issuer",
-                "https://token.actions.githubusercontent.com",
-                "myimg@sha256:abc123",
-            ]
-        )
+        assert run.calls == [((["verify", *flags, "myimg@sha256:abc123"],), {})]
 
-    def test_failure(self):
-        fake = subprocess.CompletedProcess(
-            args=["cosign"], returncode=1, stdout="", stderr="no matching sig"
-        )
-        with patch("brainbox.cosign._cosign_run", return_value=fake):
-            result = verify_image_keyless(
-                "myimg:latest",
-                "https://github.com/owner/repo/.*",
-                "https://token.actions.githubusercontent.com",
-                ["myimg@sha256:abc123"],
-            )
+    def test_failure(self, monkeypatch, verify, extra, flags):
+        monkeypatch.setattr("brainbox.cosign._cosign_run", _stub(_CP_FAIL_NOSIG))
+        result = verify("myimg:latest", *extra, ["myimg@sha256:abc123"])
 
         assert result.verified is False
         assert result.stderr == "no matching sig"
 
-    def test_uses_first_digest(self):
-        fake = subprocess.CompletedProcess(args=["cosign"], returncode=0, stdout="ok", stderr="")
-        with patch("brainbox.cosign._cosign_run", return_value=fake) as mock_run:
-            verify_image_keyless(
-                "myimg:latest",
-                "https://github.com/owner/repo/.*",
-                "https://token.actions.githubusercontent.com",
-                ["first@sha256:aaa", "second@sha256:bbb"],
-            )
+    def test_uses_first_digest(self, monkeypatch, verify, extra, flags):
+        run = _stub(_CP_OK)
+        monkeypatch.setattr("brainbox.cosign._cosign_run", run)
+        verify("myimg:latest", *extra, ["first@sha256:aaa", "second@sha256:bbb"])
 
-        args = mock_run.call_args[0][0]
+        args = run.calls[0][0][0]
         assert args[-1] == "first@sha256:aaa"
 
-    def test_empty_repo_digests_raises(self):
+    def test_empty_repo_digests_raises(self, verify, extra, flags):
         with pytest.raises(ValueError, match="no repo digests"):
-            verify_image_keyless(
-                "myimg:latest",
-                "https://github.com/owner/repo/.*",
-                "https://token.actions.githubusercontent.com",
-                [],
-            )
+            verify("myimg:latest", *extra, [])
 
 
 # ---------------------------------------------------------------------------
@@ -214,24 +189,32 @@ class TestVerifyImageKeyless:
 
 
 class TestCosignSettings:
-    def test_defaults(self):
-        s = CosignSettings()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def cs(cls):
+        """Build each settings variant once for the class."""
+        return {
+            "default": CosignSettings(),
+            "enforce_key": CosignSettings(mode="enforce", key="/path/to/key.pub"),
+            "keyless": CosignSettings(
+                mode="enforce", certificate_identity=_IDENTITY, oidc_issuer=_ISSUER
+            ),
+        }
+
+    def test_defaults(self, cs):
+        s = cs["default"]
         assert s.mode == "warn"
         assert s.key == ""
         assert s.certificate_identity == ""
         assert s.oidc_issuer == ""
 
-    def test_explicit_values(self):
-        s = CosignSettings(mode="enforce", key="/path/to/key.pub")
+    def test_explicit_values(self, cs):
+        s = cs["enforce_key"]
         assert s.mode == "enforce"
         assert s.key == "/path/to/key.pub"
 
-    def test_keyless_values(self):
-        s = CosignSettings(
-            mode="enforce",
-            certificate_identity="https://github.com/owner/repo/.*",
-            oidc_issuer="https://token.actions.githubusercontent.com",
-        )
+    def test_keyless_values(self, cs):
+        s = cs["keyless"]
         assert s.certificate_identity == "https://github.com/owner/repo/.*"
         assert s.oidc_issuer == "https://token.actions.githubusercontent.com"
 
@@ -244,235 +227,245 @@ class TestCosignSettings:
 # Provision integration (async)
 # ---------------------------------------------------------------------------
 
+# CosignResult is frozen, so these can be shared across tests
+_OK = CosignResult(verified=True, image_ref="test-image@sha256:abc123", stdout="ok", stderr="")
+_FAIL = CosignResult(
+    verified=False, image_ref="test-image@sha256:abc123", stdout="", stderr="no sig"
+)
+
 
 class TestProvisionCosignIntegration:
     """Integration tests that exercise _verify_cosign via the provision path."""
 
-    @pytest.fixture()
-    def mock_docker(self, monkeypatch, tmp_path):
-        """Stub out Docker client and settings for provision tests."""
-        config_dir = tmp_path / "developer"
-        config_dir.mkdir()
-        (config_dir / "sessions").mkdir()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_docker(cls, tmp_path_factory):
+        """Stub out Docker client and settings once for the whole class."""
+        from docker.errors import NotFound
 
-        monkeypatch.setattr(settings, "config_dir", config_dir)
-        monkeypatch.setattr(settings, "image", "test-image")
+        config_dir = tmp_path_factory.mktemp("developer")
+        (config_dir / "sessions").mkdir()
 
-        # Mock Docker client
         mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": ["test-image@sha256:abc123"]}
-
         mock_container = MagicMock()
         mock_client = MagicMock()
+
+        saved = _fast_setattrs(settings, config_dir=config_dir, image="test-image")
+        try:
+            with pytest.MonkeyPatch.context() as mp:
+                # Patch docker client at lifecycle level (used for cosign checks and backend)
+                mp.setattr("brainbox.lifecycle._client", mock_client)
+                mp.setattr("brainbox.backends.docker._client", mock_client)
+
+                yield mock_client, mock_image, mock_container, NotFound
+        finally:
+            _fast_setattrs(settings, **saved)
+
+    @pytest.fixture(autouse=True)
+    def _reset_docker_state(self, mock_docker):
+        """Restore the shared Docker mocks and session state before each test."""
+        mock_client, mock_image, mock_container, not_found = mock_docker
+        mock_client.reset_mock(return_value=True, side_effect=True)
+        mock_image.attrs = {"RepoDigests": ["test-image@sha256:abc123"]}
         mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = [
-            # First call: check existing → not found
-            type("NotFound", (Exception,), {})(),
-        ]
+        # No existing container for any session
+        mock_client.containers.get.side_effect = not_found("not found")
         mock_client.containers.create.return_value = mock_container
 
-        # Patch docker client at lifecycle level (used for cosign checks and backend)
-        monkeypatch.setattr("brainbox.lifecycle._client", mock_client)
-        monkeypatch.setattr("brainbox.backends.docker._client", mock_client)
-
-        # Clear session state
-        import brainbox.lifecycle as lc
-
-        lc._sessions.clear()
-
-        return mock_client, mock_image
-
-    @pytest.mark.asyncio
-    async def test_mode_off_skips(self, mock_docker, monkeypatch):
-        monkeypatch.setattr(settings.cosign, "mode", "off")
-        monkeypatch.setattr(settings.cosign, "key", "")
-
-        from brainbox.lifecycle import provision
+        lc._clear_sessions()
+        if lc._cosign_cache:
+            lc._cosign_cache.clear()
 
-        with patch("brainbox.lifecycle.verify_image") as mock_verify:
-            # Backend flow: images.get, containers.get (for old), containers.create
-            mock_docker[0].images.get.return_value = mock_docker[1]
-            mock_docker[0].containers.get.side_effect = NotFound("not found")
-
-            ctx = await provision(session_name="test-off")
-            mock_verify.assert_not_called()
-            assert ctx.state.value == "configuring"
-
-    @pytest.mark.asyncio
-    async def test_mode_warn_no_key_continues(self, mock_docker, monkeypatch):
-        monkeypatch.setattr(settings.cosign, "mode", "warn")
-        monkeypatch.setattr(settings.cosign, "key", "")
-
-        from brainbox.lifecycle import provision
-
-        mock_docker[0].images.get.return_value = mock_docker[1]
-        mock_docker[0].containers.get.side_effect = NotFound("not found")
-
-        with patch("brainbox.lifecycle.verify_image") as mock_verify:
-            ctx = await provision(session_name="test-warn-nokey")
-            mock_verify.assert_not_called()
-            assert ctx.state.value == "configuring"
-
-    @pytest.mark.asyncio
-    async def test_mode_enforce_no_key_raises(self, mock_docker, monkeypatch):
-        monkeypatch.setattr(settings.cosign, "mode", "enforce")
-        monkeypatch.setattr(settings.cosign, "key", "")
-        monkeypatch.setattr(settings.cosign, "certificate_identity", "")
-        monkeypatch.setattr(settings.cosign, "oidc_issuer", "")
-
-        from brainbox.lifecycle import provision
-
-        mock_docker[0].images.get.return_value = mock_docker[1]
+    @pytest.fixture()
+    def cosign_cfg(self):
+        """Set the cosign fields in one go and restore the originals on teardown."""
+        cfg = settings.cosign
+        saved = {
+            "mode": cfg.mode,
+            "key": cfg.key,
+            "certificate_identity": cfg.certificate_identity,
+            "oidc_issuer": cfg.oidc_issuer,
+        }
+
+        def configure(mode, key="", certificate_identity="", oidc_issuer=""):
+            _fast_setattrs(
+                cfg,
+                mode=mode,
+                key=key,
+                certificate_identity=certificate_identity,
+                oidc_issuer=oidc_issuer,
+            )
 
-        with pytest.raises(ValueError, match="requires either keyless config"):
-            await provision(session_name="test-enforce-nokey")
+        try:
+            yield configure
+        finally:
+            _fast_setattrs(cfg, **saved)
 
-    @pytest.mark.asyncio
-    async def test_mode_warn_verification_failure_continues(
-        self, mock_docker, monkeypatch, tmp_path
-    ):
+    @staticmethod
+    def _key_file(tmp_path) -> str:
         key_file = tmp_path / "cosign.pub"
         key_file.write_text("fake-key")
-        monkeypatch.setattr(settings.cosign, "mode", "warn")
-        monkeypatch.setattr(settings.cosign, "key", str(key_file))
-
-        mock_docker[0].images.get.return_value = mock_docker[1]
-        mock_docker[0].containers.get.side_effect = NotFound("not found")
-
-        failed_result = CosignResult(
-            verified=False, image_ref="test-image@sha256:abc123", stdout="", stderr="no sig"
-        )
-
-        from brainbox.lifecycle import provision
-
-        with patch("brainbox.lifecycle.verify_image", return_value=failed_result):
-            ctx = await provision(session_name="test-warn-fail")
-            assert ctx.state.value == "configuring"
-
-    @pytest.mark.asyncio
-    async def test_mode_enforce_verification_failure_raises(
-        self, mock_docker, monkeypatch, tmp_path
+        return str(key_file)
+
+    @pytest.mark.parametrize(
+        ("mode", "key_kind", "result", "expected"),
+        [
+            ("off", None, None, None),
+            ("warn", None, None, None),
+            ("enforce", None, None, (ValueError, "requires either keyless config")),
+            ("warn", "key", _FAIL, None),
+            ("enforce", "key", _FAIL, (CosignVerificationError, "test-image@sha256:abc123")),
+            ("warn", "keyless", _OK, None),
+            ("enforce", "keyless", _FAIL, (CosignVerificationError, "test-image@sha256:abc123")),
+        ],
+    )
+    async def test_mode_outcome(
+        self, mock_docker, cosign_cfg, monkeypatch, tmp_path, mode, key_kind, result, expected
     ):
-        key_file = tmp_path / "cosign.pub"
-        key_file.write_text("fake-key")
-        monkeypatch.setattr(settings.cosign, "mode", "enforce")
-        monkeypatch.setattr(settings.cosign, "key", str(key_file))
-
-        mock_docker[0].images.get.return_value = mock_docker[1]
-
-        failed_result = CosignResult(
-            verified=False, image_ref="test-image@sha256:abc123", stdout="", stderr="no sig"
-        )
-
-        from brainbox.lifecycle import provision
+        if key_kind == "key":
+            cosign_cfg(mode, key=self._key_file(tmp_path))
+        elif key_kind == "keyless":
+            cosign_cfg(mode, certificate_identity=_IDENTITY, oidc_issuer=_ISSUER)
+        else:
+            cosign_cfg(mode)
+
+        verify_key = _stub(result)
+        verify_keyless = _stub(result)
+        monkeypatch.setattr("brainbox.lifecycle.verify_image", verify_key)
+        monkeypatch.setattr("brainbox.lifecycle.verify_image_keyless", verify_keyless)
+
+        if expected is not None:
+            exc, match = expected
+            with pytest.raises(exc, match=match):
+                await provision(session_name=f"test-{mode}-{key_kind}")
+        else:
+            ctx = await provision(session_name=f"test-{mode}-{key_kind}")
+            assert ctx.state.value == "configuring"
 
-        with patch("brainbox.lifecycle.verify_image", return_value=failed_result):
-            with pytest.raises(CosignVerificationError, match="test-image@sha256:abc123"):
-                await provision(session_name="test-enforce-fail")
+        assert len(verify_key.calls) == (key_kind == "key")
+        assert len(verify_keyless.calls) == (key_kind == "keyless")
 
-    @pytest.mark.asyncio
-    async def test_mode_enforce_missing_key_file_raises(self, mock_docker, monkeypatch):
-        monkeypatch.setattr(settings.cosign, "mode", "enforce")
-        monkeypatch.setattr(settings.cosign, "key", "/nonexistent/cosign.pub")
+    async def test_mode_enforce_missing_key_file_raises(self, mock_docker, cosign_cfg):
+        cosign_cfg("enforce", key="/nonexistent/cosign.pub")
 
         mock_docker[0].images.get.return_value = mock_docker[1]
 
-        from brainbox.lifecycle import provision
-
         with pytest.raises(FileNotFoundError, match="cosign.pub"):
             await provision(session_name="test-enforce-nofile")
 
-    @pytest.mark.asyncio
-    async def test_mode_enforce_local_image_raises(self, mock_docker, monkeypatch, tmp_path):
-        key_file = tmp_path / "cosign.pub"
-        key_file.write_text("fake-key")
-        monkeypatch.setattr(settings.cosign, "mode", "enforce")
-        monkeypatch.setattr(settings.cosign, "key", str(key_file))
+    async def test_mode_enforce_local_image_raises(self, mock_docker, cosign_cfg, tmp_path):
+        cosign_cfg("enforce", key=self._key_file(tmp_path))
 
         # Image with no repo digests (local-only)
         mock_docker[1].attrs = {"RepoDigests": []}
         mock_docker[0].images.get.return_value = mock_docker[1]
 
-        from brainbox.lifecycle import provision
-
         with pytest.raises(ValueError, match="no repo digests"):
             await provision(session_name="test-enforce-local")
 
-    @pytest.mark.asyncio
-    async def test_keyless_mode_warn_success(self, mock_docker, monkeypatch):
-        monkeypatch.setattr(settings.cosign, "mode", "warn")
-        monkeypatch.setattr(settings.cosign, "key", "")
-        monkeypatch.setattr(
-            settings.cosign, "certificate_identity", "https://github.com/owner/repo/.*"
-        )
-        monkeypatch.setattr(
-            settings.cosign, "oidc_issuer", "https://token.actions.githubusercontent.com"
+    async def test_keyless_preferred_over_key(self, mock_docker, cosign_cfg, monkeypatch, tmp_path):
+        cosign_cfg(
+            "warn",
+            key=self._key_file(tmp_path),
+            certificate_identity=_IDENTITY,
+            oidc_issuer=_ISSUER,
         )
 
         mock_docker[0].images.get.return_value = mock_docker[1]
-        mock_docker[0].containers.get.side_effect = NotFound("not found")
 
-        ok_result = CosignResult(
-            verified=True, image_ref="test-image@sha256:abc123", stdout="ok", stderr=""
-        )
+        verify_keyless = _stub(_OK)
+        verify_key = _stub()
+        monkeypatch.setattr("brainbox.lifecycle.verify_image_keyless", verify_keyless)
+        monkeypatch.setattr("brainbox.lifecycle.verify_image", verify_key)
 
-        from brainbox.lifecycle import provision
+        ctx = await provision(session_name="test-keyless-preferred")
+        assert len(verify_keyless.calls) == 1
+        assert verify_key.calls == []
+        assert ctx.state.value == "configuring"
 
-        with patch("brainbox.lifecycle.verify_image_keyless", return_value=ok_result) as mock_kl:
-            ctx = await provision(session_name="test-keyless-warn-ok")
-            mock_kl.assert_called_once()
-            assert ctx.state.value == "configuring"
-
-    @pytest.mark.asyncio
-    async def test_keyless_mode_enforce_failure_raises(self, mock_docker, monkeypatch):
-        monkeypatch.setattr(settings.cosign, "mode", "enforce")
-        monkeypatch.setattr(settings.cosign, "key", "")
-        monkeypatch.setattr(
-            settings.cosign, "certificate_identity", "https://github.com/owner/repo/.*"
-        )
-        monkeypatch.setattr(
-            settings.cosign, "oidc_issuer", "https://token.actions.githubusercontent.com"
-        )
+    async def test_successful_verification_is_memoized(self, mock_docker, cosign_cfg, monkeypatch):
+        cosign_cfg("enforce", certificate_identity=_IDENTITY, oidc_issuer=_ISSUER)
 
         mock_docker[0].images.get.return_value = mock_docker[1]
 
-        failed_result = CosignResult(
-            verified=False, image_ref="test-image@sha256:abc123", stdout="", stderr="no sig"
-        )
+        verify_keyless = _stub(_OK)
+        monkeypatch.setattr("brainbox.lifecycle.verify_image_keyless", verify_keyless)
 
-        from brainbox.lifecycle import provision
+        await provision(session_name="test-memo-1")
+        await provision(session_name="test-memo-2")
+        assert len(verify_keyless.calls) == 1
 
-        with patch("brainbox.lifecycle.verify_image_keyless", return_value=failed_result):
-            with pytest.raises(CosignVerificationError, match="test-image@sha256:abc123"):
-                await provision(session_name="test-keyless-enforce-fail")
+        # A new digest is verified again
+        mock_docker[1].attrs = {"RepoDigests": ["test-image@sha256:def456"]}
+        await provision(session_name="test-memo-3")
+        assert len(verify_keyless.calls) == 2
 
-    @pytest.mark.asyncio
-    async def test_keyless_preferred_over_key(self, mock_docker, monkeypatch, tmp_path):
-        key_file = tmp_path / "cosign.pub"
-        key_file.write_text("fake-key")
-        monkeypatch.setattr(settings.cosign, "mode", "warn")
-        monkeypatch.setattr(settings.cosign, "key", str(key_file))
-        monkeypatch.setattr(
-            settings.cosign, "certificate_identity", "https://github.com/owner/repo/.*"
-        )
-        monkeypatch.setattr(
-            settings.cosign, "oidc_issuer", "https://token.actions.githubusercontent.com"
-        )
+    async def test_failed_verification_is_not_memoized(
+        self, mock_docker, cosign_cfg, monkeypatch, tmp_path
+    ):
+        cosign_cfg("warn", key=self._key_file(tmp_path))
 
         mock_docker[0].images.get.return_value = mock_docker[1]
-        mock_docker[0].containers.get.side_effect = NotFound("not found")
 
-        ok_result = CosignResult(
-            verified=True, image_ref="test-image@sha256:abc123", stdout="ok", stderr=""
-        )
+        verify_key = _stub(_FAIL)
+        monkeypatch.setattr("brainbox.lifecycle.verify_image", verify_key)
 
-        from brainbox.lifecycle import provision
+        await provision(session_name="test-nomemo-1")
+        await provision(session_name="test-nomemo-2")
+        assert len(verify_key.calls) == 2
 
-        with (
-            patch("brainbox.lifecycle.verify_image_keyless", return_value=ok_result) as mock_kl,
-            patch("brainbox.lifecycle.verify_image") as mock_key,
-        ):
-            ctx = await provision(session_name="test-keyless-preferred")
-            mock_kl.assert_called_once()
-            mock_key.assert_not_called()
-            assert ctx.state.value == "configuring"
+    async def test_pending_verification_is_cancelled_when_setup_fails(
+        self, mock_docker, monkeypatch
+    ):
+        mock_docker[0].images.get.return_value = mock_docker[1]
+        tasks = []
+
+        async def verify_forever(*args):
+            tasks.append(asyncio.current_task())
+            await asyncio.Event().wait()
+
+        def broken_mounts(**kwargs):
+            raise OSError("unreadable profile")
+
+        monkeypatch.setattr(lc, "_verify_cosign", verify_forever)
+        monkeypatch.setattr(lc, "_resolve_profile_mounts", broken_mounts)
+
+        with pytest.raises(OSError, match="unreadable profile"):
+            await provision(session_name="test-cancel-cosign")
+
+        [task] = tasks
+        assert task.cancelled()
+
+    async def test_failed_verification_is_retrieved_when_setup_fails(
+        self, mock_docker, monkeypatch
+    ):
+        mock_docker[0].images.get.return_value = mock_docker[1]
+        cosign_failed = asyncio.Event()
+        unretrieved = []
+
+        async def verify_fails(*args):
+            cosign_failed.set()
+            raise CosignVerificationError("no sig")
+
+        def broken_mounts(**kwargs):
+            raise OSError("unreadable profile")
+
+        async def mounts_after_cosign(fn, **kwargs):
+            await cosign_failed.wait()
+            await asyncio.sleep(0)  # let the cosign task finish failing
+            return fn(**kwargs)
+
+        monkeypatch.setattr(lc, "_verify_cosign", verify_fails)
+        monkeypatch.setattr(lc, "_resolve_profile_mounts", broken_mounts)
+        monkeypatch.setattr(lc, "_run_io", mounts_after_cosign)
+        loop = asyncio.get_running_loop()
+        previous_handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda loop, context: unretrieved.append(context))
+        try:
+            with pytest.raises(OSError, match="unreadable profile"):
+                await provision(session_name="test-retrieve-cosign")
+            gc.collect()
+        finally:
+            loop.set_exception_handler(previous_handler)
+
+        assert unretrieved == []
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
+import shutil
 import signal
 import subprocess
 import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -21,12 +24,58 @@ from brainbox.daemon import (
 )
 
 
+@pytest.fixture(scope="module")
+def _module_config_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("config")
+
+
+@pytest.fixture
+def temp_config_dir(_module_config_dir: Path) -> Iterator[Path]:
+    """Provide an empty config directory, shared across the module and emptied after each test."""
+    yield _module_config_dir
+    for path in _module_config_dir.iterdir():
+        if path.is_dir():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+
+
+# Fixed past timestamp so uptime is positive and failures are reproducible
+_FIXED_STARTED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc).isoformat()
+
+
+def _write_pid(manager: DaemonManager, pid: int, started_at: str, port: int = 9999) -> None:
+    manager.pid_file.write_text(
+        json.dumps({"pid": pid, "port": port, "host": "127.0.0.1", "started_at": started_at}),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def fake_pidfd():
+    """Patch os.pidfd_open with a pipe that turns readable once ``exited()`` is called."""
+    read_fd, write_fd = os.pipe()
+    open_fds = [read_fd, write_fd]
+
+    def exited() -> None:
+        os.close(write_fd)
+        open_fds.remove(write_fd)
+
+    # stop() closes the fd it gets, so hand out a fresh dup each time
+    with patch("os.pidfd_open", create=True, side_effect=lambda pid: os.dup(read_fd)):
+        yield exited
+    for fd in open_fds:
+        os.close(fd)
+
+
 @pytest.fixture
-def temp_config_dir(tmp_path: Path) -> Path:
-    """Create a temporary config directory."""
-    config_dir = tmp_path / "config"
-    config_dir.mkdir(parents=True)
-    return config_dir
+def popen_process() -> Iterator[MagicMock]:
+    """Patch subprocess.Popen to hand back a process that keeps running."""
+    process = MagicMock()
+    process.pid = 12345
+    process.poll.return_value = None
+    with patch("subprocess.Popen", return_value=process):
+        yield process
 
 
 @pytest.fixture
@@ -53,37 +102,31 @@ class TestDaemonManager:
         assert status.port is None
         assert status.host is None
 
-    def test_status_stale_pid_file(self, daemon_manager: DaemonManager):
-        """Test status with stale PID file (process doesn't exist)."""
-        # Write PID file with non-existent process
-        daemon_manager.pid_file.write_text(
-            "99999\n9999\n127.0.0.1\n2026-01-01T00:00:00+00:00\n",
-            encoding="utf-8",
-        )
-
-        status = daemon_manager.status()
-        assert not status.running
-        # Stale PID file should be cleaned up
-        assert not daemon_manager.pid_file.exists()
-
-    def test_status_malformed_pid_file(self, daemon_manager: DaemonManager):
-        """Test status with malformed PID file."""
-        daemon_manager.pid_file.write_text("invalid\n", encoding="utf-8")
+    @pytest.mark.parametrize(
+        "content",
+        [
+            json.dumps(
+                {"pid": 99999, "port": 9999, "host": "127.0.0.1", "started_at": _FIXED_STARTED_AT}
+            ),
+            "invalid\n",
+        ],
+        ids=["stale", "malformed"],
+    )
+    def test_status_invalid_pid_file(self, daemon_manager: DaemonManager, content: str):
+        """Test status with a stale or malformed PID file."""
+        daemon_manager.pid_file.write_text(content, encoding="utf-8")
 
         status = daemon_manager.status()
         assert not status.running
-        # Malformed PID file should be cleaned up
+        # Unusable PID file should be cleaned up
         assert not daemon_manager.pid_file.exists()
 
     def test_status_running(self, daemon_manager: DaemonManager):
         """Test status when daemon is running."""
         # Use current process as a "running" daemon
         pid = os.getpid()
-        started_at = datetime.now(timezone.utc).isoformat()
-        daemon_manager.pid_file.write_text(
-            f"{pid}\n9999\n127.0.0.1\n{started_at}\n",
-            encoding="utf-8",
-        )
+        started_at = _FIXED_STARTED_AT
+        _write_pid(daemon_manager, pid, started_at)
 
         status = daemon_manager.status()
         assert status.running
@@ -94,51 +137,75 @@ class TestDaemonManager:
         assert status.uptime_seconds is not None
         assert status.uptime_seconds >= 0
 
-    def test_start_creates_log_directory(self, daemon_manager: DaemonManager):
+    def test_status_reuses_recent_probe(self, daemon_manager: DaemonManager):
+        """Test that back-to-back status() calls probe the process only once."""
+        _write_pid(daemon_manager, 12345, _FIXED_STARTED_AT)
+
+        with patch("os.kill") as mock_kill:
+            first = daemon_manager.status()
+            second = daemon_manager.status()
+
+        assert first.running
+        assert second is first
+        mock_kill.assert_called_once_with(12345, 0)
+
+    def test_status_reprobes_after_pid_file_changes(self, daemon_manager: DaemonManager):
+        """Test that a rewritten PID file bypasses the cached status."""
+        started_at = _FIXED_STARTED_AT
+        _write_pid(daemon_manager, 12345, started_at)
+
+        with patch("os.kill"):
+            assert daemon_manager.status().pid == 12345
+            _write_pid(daemon_manager, 23456, started_at)
+            # Force a distinct mtime even on coarse-grained filesystems
+            os.utime(daemon_manager.pid_file, ns=(1, 1))
+            assert daemon_manager.status().pid == 23456
+
+    def test_status_reads_legacy_pid_file(self, daemon_manager: DaemonManager):
+        """Test that a four-line PID file from an older version is still understood."""
+        pid = os.getpid()
+        started_at = _FIXED_STARTED_AT
+        daemon_manager.pid_file.write_text(
+            f"{pid}\n9999\n127.0.0.1\n{started_at}\n",
+            encoding="utf-8",
+        )
+
+        status = daemon_manager.status()
+        assert status.running
+        assert status.pid == pid
+        assert status.port == 9999
+
+    def test_start_creates_log_directory(
+        self, daemon_manager: DaemonManager, popen_process: MagicMock
+    ):
         """Test that start creates the log directory."""
         assert not daemon_manager.log_dir.exists()
 
-        with patch("subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.pid = 12345
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
-
-            daemon_manager.start()
+        daemon_manager.start()
 
         assert daemon_manager.log_dir.exists()
 
-    def test_start_writes_pid_file(self, daemon_manager: DaemonManager):
+    def test_start_writes_pid_file(self, daemon_manager: DaemonManager, popen_process: MagicMock):
         """Test that start writes the PID file correctly."""
-        with patch("subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.pid = 12345
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
-
-            pid, msg = daemon_manager.start(host="0.0.0.0", port=8888)
+        pid, msg = daemon_manager.start(host="0.0.0.0", port=8888)
 
         assert pid == 12345
         assert daemon_manager.pid_file.exists()
 
-        content = daemon_manager.pid_file.read_text(encoding="utf-8")
-        lines = content.strip().split("\n")
-        assert len(lines) == 4
-        assert lines[0] == "12345"
-        assert lines[1] == "8888"
-        assert lines[2] == "0.0.0.0"
+        data = json.loads(daemon_manager.pid_file.read_bytes())
+        assert data["pid"] == 12345
+        assert data["port"] == 8888
+        assert data["host"] == "0.0.0.0"
         # Verify timestamp is valid ISO format
-        datetime.fromisoformat(lines[3])
+        datetime.fromisoformat(data["started_at"])
+        assert not daemon_manager.pid_file.with_suffix(".tmp").exists()
 
     def test_start_already_running(self, daemon_manager: DaemonManager):
         """Test that start raises error when daemon is already running."""
         # Use current process as a "running" daemon
         pid = os.getpid()
-        started_at = datetime.now(timezone.utc).isoformat()
-        daemon_manager.pid_file.write_text(
-            f"{pid}\n9999\n127.0.0.1\n{started_at}\n",
-            encoding="utf-8",
-        )
+        started_at = _FIXED_STARTED_AT
+        _write_pid(daemon_manager, pid, started_at)
 
         with pytest.raises(DaemonAlreadyRunningError) as exc_info:
             daemon_manager.start()
@@ -147,60 +214,68 @@ class TestDaemonManager:
         assert exc_info.value.host == "127.0.0.1"
         assert exc_info.value.port == 9999
 
-    def test_start_cleans_stale_pid_file(self, daemon_manager: DaemonManager):
+    def test_start_cleans_stale_pid_file(
+        self, daemon_manager: DaemonManager, popen_process: MagicMock
+    ):
         """Test that start cleans up stale PID file before starting."""
         # Write stale PID file
-        daemon_manager.pid_file.write_text(
-            "99999\n9999\n127.0.0.1\n2026-01-01T00:00:00+00:00\n",
-            encoding="utf-8",
-        )
-
-        with patch("subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.pid = 12345
-            mock_process.poll.return_value = None
-            mock_popen.return_value = mock_process
+        _write_pid(daemon_manager, 99999, _FIXED_STARTED_AT)
 
-            pid, msg = daemon_manager.start()
+        pid, msg = daemon_manager.start()
 
         assert pid == 12345
         # Should have new PID file
-        content = daemon_manager.pid_file.read_text(encoding="utf-8")
-        assert content.startswith("12345\n")
+        assert json.loads(daemon_manager.pid_file.read_bytes())["pid"] == 12345
 
-    def test_start_process_exits_immediately(self, daemon_manager: DaemonManager):
+    def test_start_process_exits_immediately(
+        self, daemon_manager: DaemonManager, popen_process: MagicMock
+    ):
         """Test error when started process exits immediately."""
-        with patch("subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.pid = 12345
-            mock_process.poll.return_value = 1  # Exit code 1
+        popen_process.poll.return_value = 1  # Exit code 1
 
-            mock_popen.return_value = mock_process
-
-            with pytest.raises(DaemonError) as exc_info:
-                daemon_manager.start()
+        with pytest.raises(DaemonError) as exc_info:
+            daemon_manager.start()
 
-            assert "exited immediately" in str(exc_info.value)
+        assert "exited immediately" in str(exc_info.value)
 
     def test_stop_not_running(self, daemon_manager: DaemonManager):
         """Test that stop raises error when daemon is not running."""
         with pytest.raises(DaemonNotRunningError):
             daemon_manager.stop()
 
-    def test_stop_graceful_shutdown(self, daemon_manager: DaemonManager):
-        """Test graceful shutdown sends SIGTERM and process exits."""
+    def test_stop_graceful_shutdown(self, daemon_manager: DaemonManager, fake_pidfd):
+        """Test graceful shutdown sends SIGTERM and the pidfd reports the exit."""
+        pid = 12345
+        _write_pid(daemon_manager, pid, _FIXED_STARTED_AT)
+
+        kill_calls_set: set[tuple[int, int]] = set()
+
+        def mock_kill(target_pid: int, sig: int):
+            kill_calls_set.add((target_pid, sig))
+            if sig == signal.SIGTERM:
+                fake_pidfd()
+
+        with patch("os.kill", side_effect=mock_kill):
+            msg = daemon_manager.stop(timeout=5)
+
+        assert "stopped gracefully" in msg.lower()
+        assert not daemon_manager.pid_file.exists()
+        assert (pid, signal.SIGTERM) in kill_calls_set
+        assert (pid, signal.SIGKILL) not in kill_calls_set
+
+    def test_stop_graceful_shutdown_without_pidfd(self, daemon_manager: DaemonManager):
+        """Test graceful shutdown falls back to polling when pidfds are unavailable."""
         # Mock a process that responds to SIGTERM
         pid = 12345
-        started_at = datetime.now(timezone.utc).isoformat()
-        daemon_manager.pid_file.write_text(
-            f"{pid}\n9999\n127.0.0.1\n{started_at}\n",
-            encoding="utf-8",
-        )
+        started_at = _FIXED_STARTED_AT
+        _write_pid(daemon_manager, pid, started_at)
 
-        kill_calls = []
+        kill_calls: list[tuple[int, int]] = []
+        kill_calls_set: set[tuple[int, int]] = set()
 
         def mock_kill(target_pid: int, sig: int):
             kill_calls.append((target_pid, sig))
+            kill_calls_set.add((target_pid, sig))
             # Simulate process dying on first SIGTERM
             if sig == signal.SIGTERM:
                 # First call to check if alive (sig=0) will succeed
@@ -208,34 +283,36 @@ class TestDaemonManager:
                 pass
             elif sig == 0:
                 # Check if process alive - fail after SIGTERM sent
-                if (target_pid, signal.SIGTERM) in kill_calls:
+                if (target_pid, signal.SIGTERM) in kill_calls_set:
                     raise ProcessLookupError()
 
-        with patch("os.kill", side_effect=mock_kill):
+        with (
+            patch("os.kill", side_effect=mock_kill),
+            patch("os.pidfd_open", create=True, side_effect=OSError),
+        ):
             msg = daemon_manager.stop(timeout=5)
 
         assert "stopped gracefully" in msg.lower()
         assert not daemon_manager.pid_file.exists()
 
         # Should have sent SIGTERM but not SIGKILL
-        assert (pid, signal.SIGTERM) in kill_calls
-        assert (pid, signal.SIGKILL) not in kill_calls
+        assert (pid, signal.SIGTERM) in kill_calls_set
+        assert (pid, signal.SIGKILL) not in kill_calls_set
 
-    def test_stop_force_kill(self, daemon_manager: DaemonManager):
+    def test_stop_force_kill(self, daemon_manager: DaemonManager, fake_pidfd):
         """Test force kill with SIGKILL after timeout."""
         # Create a process that ignores SIGTERM
         # We'll mock the kill to simulate this behavior
         pid = os.getpid()  # Use current process for testing
-        started_at = datetime.now(timezone.utc).isoformat()
-        daemon_manager.pid_file.write_text(
-            f"{pid}\n9999\n127.0.0.1\n{started_at}\n",
-            encoding="utf-8",
-        )
+        started_at = _FIXED_STARTED_AT
+        _write_pid(daemon_manager, pid, started_at)
 
-        kill_calls = []
+        kill_calls: list[tuple[int, int]] = []
+        kill_calls_set: set[tuple[int, int]] = set()
 
         def mock_kill(target_pid: int, sig: int):
             kill_calls.append((target_pid, sig))
+            kill_calls_set.add((target_pid, sig))
             if sig == signal.SIGKILL:
                 # Simulate process death on SIGKILL
                 raise ProcessLookupError()
@@ -249,16 +326,12 @@ class TestDaemonManager:
         assert not daemon_manager.pid_file.exists()
 
         # Verify SIGTERM was sent first, then SIGKILL
-        assert (pid, signal.SIGTERM) in kill_calls
-        assert (pid, signal.SIGKILL) in kill_calls
+        assert kill_calls.index((pid, signal.SIGTERM)) < kill_calls.index((pid, signal.SIGKILL))
 
     def test_stop_already_dead(self, daemon_manager: DaemonManager):
         """Test stop when process is already dead."""
         # Write PID file for dead process
-        daemon_manager.pid_file.write_text(
-            "99999\n9999\n127.0.0.1\n2026-01-01T00:00:00+00:00\n",
-            encoding="utf-8",
-        )
+        _write_pid(daemon_manager, 99999, _FIXED_STARTED_AT)
 
         # This should raise DaemonNotRunningError because status() will detect
         # the process is dead and return running=False
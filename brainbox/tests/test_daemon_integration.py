@@ -2,54 +2,115 @@
 
 from __future__ import annotations
 
+import io
 import json
+import os
+import socket
 import subprocess
+import sys
 import time
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import requests
 
-from brainbox.daemon import DaemonManager
+from brainbox.__main__ import main
+from brainbox.config import settings
+from brainbox.daemon import DaemonManager, DaemonNotRunningError
+
+# One keep-alive session for readiness polls and assertions alike
+_SESSION = requests.Session()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _close_session():
+    yield
+    _SESSION.close()
 
 
 @pytest.fixture
 def temp_config_dir(tmp_path: Path, monkeypatch) -> Path:
-    """Create a temporary config directory and set it in environment."""
-    config_dir = tmp_path / "config"
-    config_dir.mkdir(parents=True)
-
-    # Mock the config directory
+    """Point the config directory at tmp_path; DaemonManager creates it on demand."""
+    # Mock the config directory (env for spawned daemons, settings for in-process CLI calls)
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(settings, "config_dir", tmp_path / "developer")
     return tmp_path / "developer"
 
 
+@pytest.fixture
+def free_port() -> int:
+    """Return a port that was free a moment ago, so tests never collide."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port: int, deadline: float = 10.0) -> None:
+    """Poll the daemon until it answers without a 5xx, backing off from 20 ms to 200 ms."""
+    start = time.monotonic()
+    delay = 0.02
+    while time.monotonic() - start < deadline:
+        try:
+            response = _SESSION.get(f"http://127.0.0.1:{port}/api/sessions", timeout=0.3)
+            if response.status_code < 500:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.2)
+    raise TimeoutError(f"daemon on port {port} not ready after {deadline}s")
+
+
 def run_cli(*args: str, timeout: int = 10) -> subprocess.CompletedProcess:
     """Run brainbox CLI command.
 
+    Commands that spawn the daemon (``api --daemon``, ``restart``) go through a
+    real ``python -m brainbox`` subprocess, so the daemon is orphaned and reaped
+    by init rather than left as a zombie child of pytest that ``stop`` would
+    keep seeing as alive. Every other command runs ``main()`` in-process to
+    skip interpreter startup.
+
     Args:
         *args: CLI arguments
-        timeout: Command timeout in seconds
+        timeout: Command timeout in seconds (subprocess only)
 
     Returns:
         CompletedProcess result
     """
-    cmd = ["python", "-m", "brainbox"] + list(args)
-    return subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
+    if "--daemon" in args or args[0] == "restart":
+        cmd = ["python", "-m", "brainbox"] + list(args)
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    with (
+        patch.object(sys, "argv", ["brainbox", *args]),
+        # Keep structlog's global config (and its bound stdout) untouched
+        patch("brainbox.__main__.setup_logging"),
+        redirect_stdout(stdout),
+        redirect_stderr(stderr),
+    ):
+        try:
+            main()
+        except SystemExit as exc:
+            returncode = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+    return subprocess.CompletedProcess(list(args), returncode, stdout.getvalue(), stderr.getvalue())
 
 
 @pytest.mark.integration
 class TestDaemonCLI:
     """Integration tests for daemon CLI commands."""
 
-    def test_start_and_stop_lifecycle(self, temp_config_dir: Path):
+    def test_start_and_stop_lifecycle(self, temp_config_dir: Path, free_port: int):
         """Test complete daemon lifecycle: start -> status -> stop."""
-        port = 19999
+        port = free_port
 
         # Start daemon
         result = run_cli("api", "--daemon", "--port", str(port))
@@ -59,7 +120,7 @@ class TestDaemonCLI:
 
         try:
             # Wait for API to be ready
-            time.sleep(2)
+            wait_ready(port)
 
             # Check status
             result = run_cli("status")
@@ -70,7 +131,7 @@ class TestDaemonCLI:
             assert "Uptime:" in result.stdout
 
             # Test API is responding
-            response = requests.get(f"http://127.0.0.1:{port}/api/sessions", timeout=5)
+            response = _SESSION.get(f"http://127.0.0.1:{port}/api/sessions", timeout=5)
             assert response.status_code == 200
 
         finally:
@@ -84,16 +145,16 @@ class TestDaemonCLI:
         assert result.returncode == 0
         assert "✗ Daemon not running" in result.stdout
 
-    def test_status_json_format(self, temp_config_dir: Path):
+    def test_status_json_format(self, temp_config_dir: Path, free_port: int):
         """Test status --json output format."""
-        port = 19998
+        port = free_port
 
         # Start daemon
         result = run_cli("api", "--daemon", "--port", str(port))
         assert result.returncode == 0
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Get JSON status
             result = run_cli("status", "--json")
@@ -112,16 +173,16 @@ class TestDaemonCLI:
         finally:
             run_cli("stop")
 
-    def test_already_running_error(self, temp_config_dir: Path):
+    def test_already_running_error(self, temp_config_dir: Path, free_port: int):
         """Test error when trying to start daemon that's already running."""
-        port = 19997
+        port = free_port
 
         # Start daemon
         result = run_cli("api", "--daemon", "--port", str(port))
         assert result.returncode == 0
 
         try:
-            time.sleep(1)
+            wait_ready(port)
 
             # Try to start again
             result = run_cli("api", "--daemon", "--port", str(port))
@@ -133,20 +194,19 @@ class TestDaemonCLI:
 
     def test_stop_not_running_error(self, temp_config_dir: Path):
         """Test error when trying to stop daemon that's not running."""
-        result = run_cli("stop")
-        assert result.returncode == 1
-        assert "not running" in result.stderr.lower()
+        with pytest.raises(DaemonNotRunningError):
+            DaemonManager(config_dir=temp_config_dir).stop()
 
-    def test_restart(self, temp_config_dir: Path):
+    def test_restart(self, temp_config_dir: Path, free_port: int):
         """Test daemon restart command."""
-        port = 19996
+        port = free_port
 
         # Start daemon
         result = run_cli("api", "--daemon", "--port", str(port))
         assert result.returncode == 0
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Get initial PID
             result = run_cli("status", "--json")
@@ -159,7 +219,7 @@ class TestDaemonCLI:
             assert "stopped" in result.stdout.lower()
             assert "started" in result.stdout.lower()
 
-            time.sleep(2)
+            wait_ready(port)
 
             # Get new PID
             result = run_cli("status", "--json")
@@ -170,42 +230,51 @@ class TestDaemonCLI:
             assert new_pid != initial_pid
 
             # API should still be running
-            response = requests.get(f"http://127.0.0.1:{port}/api/sessions", timeout=5)
+            response = _SESSION.get(f"http://127.0.0.1:{port}/api/sessions", timeout=5)
             assert response.status_code == 200
 
         finally:
             run_cli("stop")
 
-    def test_restart_not_running(self, temp_config_dir: Path):
+    def test_restart_not_running(self, temp_config_dir: Path, free_port: int):
         """Test restart when daemon is not running."""
-        port = 19995
+        port = free_port
+        manager = DaemonManager(config_dir=temp_config_dir)
 
         # Restart (should start even if not running)
-        result = run_cli("restart", "--port", str(port))
-        assert result.returncode == 0
-        assert "not running" in result.stdout.lower()
-        assert "started" in result.stdout.lower()
+        pid, message = manager.restart(port=port)
+        assert "not running" in message.lower()
+        assert "started" in message.lower()
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Verify it's running
-            result = run_cli("status")
-            assert result.returncode == 0
-            assert "✓ Daemon running" in result.stdout
+            status = manager.status()
+            assert status.running
+            assert status.pid == pid
 
         finally:
-            run_cli("stop")
+            manager.stop()
+            # The daemon is our own child here, so reap it
+            os.waitpid(pid, 0)
 
-    def test_stale_pid_file_cleanup(self, temp_config_dir: Path):
+    def test_stale_pid_file_cleanup(self, temp_config_dir: Path, free_port: int):
         """Test that stale PID file is cleaned up on start."""
-        port = 19994
+        port = free_port
 
         # Create stale PID file
         manager = DaemonManager(config_dir=temp_config_dir)
         manager.pid_file.parent.mkdir(parents=True, exist_ok=True)
         manager.pid_file.write_text(
-            "99999\n19999\n127.0.0.1\n2026-01-01T00:00:00+00:00\n",
+            json.dumps(
+                {
+                    "pid": 99999,
+                    "port": port,
+                    "host": "127.0.0.1",
+                    "started_at": "2026-01-01T00:00:00+00:00",
+                }
+            ),
             encoding="utf-8",
         )
 
@@ -215,7 +284,7 @@ class TestDaemonCLI:
         assert "Daemon started successfully" in result.stdout
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Verify it's running with correct PID
             result = run_cli("status", "--json")
@@ -226,9 +295,9 @@ class TestDaemonCLI:
         finally:
             run_cli("stop")
 
-    def test_log_file_creation(self, temp_config_dir: Path):
+    def test_log_file_creation(self, temp_config_dir: Path, free_port: int):
         """Test that log file is created and contains output."""
-        port = 19993
+        port = free_port
 
         manager = DaemonManager(config_dir=temp_config_dir)
 
@@ -237,7 +306,7 @@ class TestDaemonCLI:
         assert result.returncode == 0
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Verify log file exists and has content
             assert manager.log_file.exists()
@@ -248,16 +317,16 @@ class TestDaemonCLI:
         finally:
             run_cli("stop")
 
-    def test_custom_host(self, temp_config_dir: Path):
+    def test_custom_host(self, temp_config_dir: Path, free_port: int):
         """Test daemon with custom host binding."""
-        port = 19992
+        port = free_port
 
         # Start daemon on 0.0.0.0
         result = run_cli("api", "--daemon", "--host", "0.0.0.0", "--port", str(port))
         assert result.returncode == 0
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Check status shows correct host
             result = run_cli("status", "--json")
@@ -267,16 +336,16 @@ class TestDaemonCLI:
         finally:
             run_cli("stop")
 
-    def test_graceful_shutdown(self, temp_config_dir: Path):
+    def test_graceful_shutdown(self, temp_config_dir: Path, free_port: int):
         """Test that daemon shuts down gracefully."""
-        port = 19991
+        port = free_port
 
         # Start daemon
         result = run_cli("api", "--daemon", "--port", str(port))
         assert result.returncode == 0
 
         try:
-            time.sleep(2)
+            wait_ready(port)
 
             # Stop with explicit timeout
             start_time = time.time()
@@ -0,0 +1,79 @@
+"""Tests for the Docker backend health check."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docker.errors import NotFound
+
+from brainbox.backends import docker as docker_backend
+from brainbox.models import SessionContext
+
+
+def _ctx(name: str) -> SessionContext:
+    return SessionContext(
+        session_name=name,
+        container_name=f"developer-{name}",
+        port=7681,
+        created_at=0,
+        ttl=0,
+    )
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    client.api.containers.return_value = [
+        {"Id": "id-a", "Names": ["/developer-a"], "State": "running"},
+        {"Id": "id-b", "Names": ["/developer-b"], "State": "exited"},
+        {"Id": "id-p", "Names": ["/developer-p"], "State": "paused"},
+    ]
+    client.api.stats.return_value = {"memory_stats": {"usage": 1024, "limit": 2048}}
+    client.containers.get.side_effect = NotFound("not found")
+    with (
+        patch.object(docker_backend, "_docker", return_value=client),
+        patch.object(docker_backend, "_listings", {}),
+        patch.object(docker_backend, "_cpu_samples", {}),
+    ):
+        yield client
+
+
+class TestHealthCheck:
+    async def test_concurrent_checks_share_one_listing(self, client):
+        backend = docker_backend.DockerBackend()
+        a, b, c = await asyncio.gather(
+            *(backend.health_check(_ctx(name)) for name in ("a", "b", "c"))
+        )
+
+        assert a["healthy"] is True
+        assert a["memory_usage_human"] == "1.0KiB"
+        assert b == {"backend": "docker", "healthy": False, "reason": "container not running"}
+        assert c["reason"] == "container not found"
+        client.api.containers.assert_called_once()
+        # Only the unlisted container falls back to a direct inspect
+        client.containers.get.assert_called_once_with("developer-c")
+
+    async def test_skips_stats_when_not_requested(self, client):
+        backend = docker_backend.DockerBackend()
+        health = await backend.health_check(_ctx("a"), include_stats=False)
+
+        assert health == {"backend": "docker", "healthy": True}
+        client.api.stats.assert_not_called()
+
+    async def test_paused_container_counts_as_running(self, client):
+        backend = docker_backend.DockerBackend()
+        health = await backend.health_check(_ctx("p"), include_stats=False)
+
+        # Matches inspect, where State.Running stays true while paused
+        assert health == {"backend": "docker", "healthy": True}
+
+    def test_listing_is_not_shared_across_event_loops(self, client):
+        backend = docker_backend.DockerBackend()
+        for _ in range(2):
+            # Each asyncio.run() gets a fresh loop within the listing TTL
+            health = asyncio.run(backend.health_check(_ctx("a"), include_stats=False))
+            assert health["healthy"] is True
+
+        assert client.api.containers.call_count == 2
@@ -2,36 +2,42 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import docker.errors
 import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
 from brainbox.api import app
 from brainbox.config import settings
 
 
 class TestExecEndpoint:
-    @pytest.fixture()
-    def client(self):
-        from httpx import ASGITransport, AsyncClient
-
-        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    @pytest_asyncio.fixture(scope="class")
+    @classmethod
+    async def client(cls):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+
+    @pytest.fixture(autouse=True)
+    def docker_client(self, monkeypatch):
+        """Route brainbox.api._docker() to a single MagicMock for every test."""
+        mock_docker_client = MagicMock()
+        monkeypatch.setattr("brainbox.api._docker", lambda: mock_docker_client)
+        return mock_docker_client
 
-    @pytest.mark.asyncio
-    async def test_success(self, client):
-        mock_container = MagicMock()
-        mock_container.exec_run.return_value = (0, b"hello world\n")
+    @pytest.fixture()
+    def container(self, docker_client):
+        return docker_client.containers.get.return_value
 
-        mock_docker_client = MagicMock()
-        mock_docker_client.containers.get.return_value = mock_container
+    async def test_success(self, client, container):
+        container.exec_run.return_value = (0, b"hello world\n")
 
-        with patch("brainbox.api._docker") as mock_docker_fn:
-            mock_docker_fn.return_value = mock_docker_client
-            resp = await client.post(
-                "/api/sessions/test-1/exec",
-                json={"command": "echo hello world"},
-            )
+        resp = await client.post(
+            "/api/sessions/test-1/exec",
+            json={"command": "echo hello world"},
+        )
 
         assert resp.status_code == 200
         data = resp.json()
@@ -39,43 +45,31 @@ class TestExecEndpoint:
         assert data["exit_code"] == 0
         assert data["output"] == "hello world\n"
 
-        mock_container.exec_run.assert_called_once_with(["sh", "-c", "echo hello world"])
+        container.exec_run.assert_called_once_with(("sh", "-c", "echo hello world"))
 
-    @pytest.mark.asyncio
-    async def test_nonzero_exit_code(self, client):
-        mock_container = MagicMock()
-        mock_container.exec_run.return_value = (1, b"not found\n")
-
-        mock_docker_client = MagicMock()
-        mock_docker_client.containers.get.return_value = mock_container
+    async def test_nonzero_exit_code(self, client, container):
+        container.exec_run.return_value = (1, b"not found\n")
 
-        with patch("brainbox.api._docker") as mock_docker_fn:
-            mock_docker_fn.return_value = mock_docker_client
-            resp = await client.post(
-                "/api/sessions/test-1/exec",
-                json={"command": "ls /nonexistent"},
-            )
+        resp = await client.post(
+            "/api/sessions/test-1/exec",
+            json={"command": "ls /nonexistent"},
+        )
 
         assert resp.status_code == 200
         data = resp.json()
         assert data["success"] is False
         assert data["exit_code"] == 1
 
-    @pytest.mark.asyncio
-    async def test_container_not_found(self, client):
-        mock_docker_client = MagicMock()
-        mock_docker_client.containers.get.side_effect = docker.errors.NotFound("not found")
+    async def test_container_not_found(self, client, docker_client):
+        docker_client.containers.get.side_effect = docker.errors.NotFound("not found")
 
-        with patch("brainbox.api._docker") as mock_docker_fn:
-            mock_docker_fn.return_value = mock_docker_client
-            resp = await client.post(
-                "/api/sessions/nope/exec",
-                json={"command": "echo hi"},
-            )
+        resp = await client.post(
+            "/api/sessions/nope/exec",
+            json={"command": "echo hi"},
+        )
 
         assert resp.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_missing_command(self, client):
         resp = await client.post(
             "/api/sessions/test-1/exec",
@@ -83,7 +77,6 @@ class TestExecEndpoint:
         )
         assert resp.status_code == 422  # Pydantic validation error
 
-    @pytest.mark.asyncio
     async def test_empty_command(self, client):
         resp = await client.post(
             "/api/sessions/test-1/exec",
@@ -91,20 +84,13 @@ class TestExecEndpoint:
         )
         assert resp.status_code == 422  # Pydantic validation error
 
-    @pytest.mark.asyncio
-    async def test_container_name_uses_prefix(self, client):
-        mock_container = MagicMock()
-        mock_container.exec_run.return_value = (0, b"ok\n")
-
-        mock_docker_client = MagicMock()
-        mock_docker_client.containers.get.return_value = mock_container
+    async def test_container_name_uses_prefix(self, client, docker_client, container):
+        container.exec_run.return_value = (0, b"ok\n")
 
-        with patch("brainbox.api._docker") as mock_docker_fn:
-            mock_docker_fn.return_value = mock_docker_client
-            await client.post(
-                "/api/sessions/mybox/exec",
-                json={"command": "echo ok"},
-            )
+        await client.post(
+            "/api/sessions/mybox/exec",
+            json={"command": "echo ok"},
+        )
 
         expected_name = f"{settings.resolved_prefix}mybox"
-        mock_docker_client.containers.get.assert_called_once_with(expected_name)
+        docker_client.containers.get.assert_called_once_with(expected_name)
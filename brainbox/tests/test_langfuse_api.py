@@ -24,7 +24,6 @@ class TestLangfuseHealthEndpoint:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_healthy(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         with patch("brainbox.api.langfuse_health_check", return_value=True):
@@ -34,7 +33,6 @@ class TestLangfuseHealthEndpoint:
         assert data["healthy"] is True
         assert data["mode"] == "warn"
 
-    @pytest.mark.asyncio
     async def test_unhealthy(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         with patch("brainbox.api.langfuse_health_check", return_value=False):
@@ -42,7 +40,6 @@ class TestLangfuseHealthEndpoint:
         assert resp.status_code == 200
         assert resp.json()["healthy"] is False
 
-    @pytest.mark.asyncio
     async def test_off_mode(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "off")
         resp = await client.get("/api/langfuse/health")
@@ -61,7 +58,6 @@ class TestLangfuseSessionTraces:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_returns_traces(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         traces = [
@@ -80,13 +76,11 @@ class TestLangfuseSessionTraces:
         assert len(data) == 1
         assert data[0]["id"] == "t1"
 
-    @pytest.mark.asyncio
     async def test_off_returns_503(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "off")
         resp = await client.get("/api/langfuse/sessions/test-session/traces")
         assert resp.status_code == 503
 
-    @pytest.mark.asyncio
     async def test_warn_swallows_errors(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         with patch(
@@ -97,7 +91,6 @@ class TestLangfuseSessionTraces:
         assert resp.status_code == 200
         assert resp.json() == []
 
-    @pytest.mark.asyncio
     async def test_enforce_returns_502(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "enforce")
         with patch(
@@ -117,7 +110,6 @@ class TestLangfuseSessionSummary:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_returns_summary(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         summary = SessionSummary(
@@ -135,13 +127,11 @@ class TestLangfuseSessionSummary:
         assert data["error_count"] == 2
         assert data["tool_counts"]["Read"] == 15
 
-    @pytest.mark.asyncio
     async def test_off_returns_503(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "off")
         resp = await client.get("/api/langfuse/sessions/test-session/summary")
         assert resp.status_code == 503
 
-    @pytest.mark.asyncio
     async def test_warn_returns_empty_on_error(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         with patch(
@@ -164,7 +154,6 @@ class TestLangfuseTraceDetail:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_returns_detail(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         trace = TraceResult(
@@ -192,13 +181,11 @@ class TestLangfuseTraceDetail:
         assert len(data["observations"]) == 1
         assert data["observations"][0]["name"] == "Read"
 
-    @pytest.mark.asyncio
     async def test_off_returns_503(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "off")
         resp = await client.get("/api/langfuse/traces/t1")
         assert resp.status_code == 503
 
-    @pytest.mark.asyncio
     async def test_warn_not_available_returns_404(self, client, monkeypatch):
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
         with patch(
@@ -218,7 +205,6 @@ class TestMetricsTraceCountMerge:
 
         return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
-    @pytest.mark.asyncio
     async def test_metrics_include_trace_counts(self, client, monkeypatch):
         """When LangFuse is available, metrics include trace_count and error_count."""
         monkeypatch.setattr(settings.langfuse, "mode", "warn")
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import httpx
 import pytest
 
+import brainbox.langfuse_client as lf
 from brainbox.config import LangfuseSettings, settings
 from brainbox.langfuse_client import (
     LangfuseError,
@@ -15,6 +16,7 @@ from brainbox.langfuse_client import (
     SessionSummary,
     TraceResult,
     _auth_header,
+    _preview,
     _truncate,
     get_session_traces_summary,
     get_trace,
@@ -23,6 +25,14 @@ from brainbox.langfuse_client import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_caches(monkeypatch):
+    """Reset the module-level TTL caches between tests."""
+    monkeypatch.setattr(lf, "_health_cache", None)
+    monkeypatch.setattr(lf, "_traces_cache", {})
+    monkeypatch.setattr(lf, "_etag_cache", {})
+
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
@@ -138,6 +148,16 @@ class TestAuthHeader:
         decoded = base64.b64decode(header[6:]).decode()
         assert decoded == "pk-test:sk-test"
 
+    def test_tracks_key_changes(self, monkeypatch):
+        monkeypatch.setattr(settings.langfuse, "public_key", "pk-a")
+        monkeypatch.setattr(settings.langfuse, "secret_key", "sk-a")
+        first = _auth_header()
+        assert _auth_header() is first
+
+        monkeypatch.setattr(settings.langfuse, "public_key", "pk-b")
+        decoded = base64.b64decode(_auth_header()[6:]).decode()
+        assert decoded == "pk-b:sk-a"
+
 
 # ---------------------------------------------------------------------------
 # health_check
@@ -169,6 +189,27 @@ class TestHealthCheck:
 
         assert health_check() is False
 
+    @patch("brainbox.langfuse_client._client")
+    def test_result_cached(self, mock_client_fn):
+        mock_client = MagicMock()
+        mock_client.get.return_value = MagicMock(status_code=200)
+        mock_client_fn.return_value = mock_client
+
+        assert health_check() is True
+        assert health_check() is True
+        mock_client.get.assert_called_once()
+
+    @patch("brainbox.langfuse_client._client")
+    def test_cache_expires(self, mock_client_fn, monkeypatch):
+        mock_client = MagicMock()
+        mock_client.get.return_value = MagicMock(status_code=200)
+        mock_client_fn.return_value = mock_client
+
+        health_check()
+        monkeypatch.setattr(lf, "_HEALTH_CACHE_TTL", 0.0)
+        health_check()
+        assert mock_client.get.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # list_traces
@@ -179,7 +220,7 @@ class TestListTraces:
     @patch("brainbox.langfuse_client._client")
     def test_success(self, mock_client_fn):
         mock_client = MagicMock()
-        mock_resp = MagicMock()
+        mock_resp = MagicMock(status_code=200)
         mock_resp.json.return_value = {
             "data": [
                 {
@@ -200,7 +241,6 @@ class TestListTraces:
                 },
             ]
         }
-        mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
         mock_client_fn.return_value = mock_client
 
@@ -215,9 +255,8 @@ class TestListTraces:
     @patch("brainbox.langfuse_client._client")
     def test_empty(self, mock_client_fn):
         mock_client = MagicMock()
-        mock_resp = MagicMock()
+        mock_resp = MagicMock(status_code=200)
         mock_resp.json.return_value = {"data": []}
-        mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
         mock_client_fn.return_value = mock_client
 
@@ -233,6 +272,45 @@ class TestListTraces:
         with pytest.raises(LangfuseError, match="list_traces"):
             list_traces("s1")
 
+    @patch("brainbox.langfuse_client._client")
+    def test_http_status_error_raises(self, mock_client_fn):
+        mock_client = MagicMock()
+        mock_client.get.return_value = MagicMock(status_code=401)
+        mock_client_fn.return_value = mock_client
+
+        with pytest.raises(LangfuseError, match="HTTP 401"):
+            list_traces("s1")
+
+    @patch("brainbox.langfuse_client._client")
+    def test_cached_per_session_and_limit(self, mock_client_fn):
+        mock_client = MagicMock()
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.json.return_value = {"data": [{"id": "t1"}]}
+        mock_client.get.return_value = mock_resp
+        mock_client_fn.return_value = mock_client
+
+        first = list_traces("s1")
+        second = list_traces("s1")
+        assert first == second
+        assert first is not second
+        assert mock_client.get.call_count == 1
+
+        list_traces("s1", limit=10)
+        list_traces("s2")
+        assert mock_client.get.call_count == 3
+
+    @patch("brainbox.langfuse_client._client")
+    def test_errors_not_cached(self, mock_client_fn):
+        mock_client = MagicMock()
+        ok_resp = MagicMock(status_code=200)
+        ok_resp.json.return_value = {"data": []}
+        mock_client.get.side_effect = [httpx.ConnectError("refused"), ok_resp]
+        mock_client_fn.return_value = mock_client
+
+        with pytest.raises(LangfuseError):
+            list_traces("s1")
+        assert list_traces("s1") == []
+
 
 # ---------------------------------------------------------------------------
 # get_trace
@@ -244,7 +322,7 @@ class TestGetTrace:
     def test_success(self, mock_client_fn):
         mock_client = MagicMock()
 
-        trace_resp = MagicMock()
+        trace_resp = MagicMock(status_code=200)
         trace_resp.json.return_value = {
             "id": "t1",
             "name": "call",
@@ -254,9 +332,8 @@ class TestGetTrace:
             "input": "",
             "output": "",
         }
-        trace_resp.raise_for_status = MagicMock()
 
-        obs_resp = MagicMock()
+        obs_resp = MagicMock(status_code=200)
         obs_resp.json.return_value = {
             "data": [
                 {
@@ -267,18 +344,90 @@ class TestGetTrace:
                     "endTime": "ts2",
                     "level": "DEFAULT",
                 },
+                {"id": "o2", "name": "Bash", "level": "ERROR"},
+                {"id": "o3", "name": "Glob"},
             ]
         }
-        obs_resp.raise_for_status = MagicMock()
 
-        mock_client.get.side_effect = [trace_resp, obs_resp]
+        # Requests run concurrently, so dispatch on path rather than call order
+        mock_client.get.side_effect = lambda path, **kw: (
+            obs_resp if path == "/api/public/observations" else trace_resp
+        )
         mock_client_fn.return_value = mock_client
 
         trace, observations = get_trace("t1")
 
         assert trace.id == "t1"
-        assert len(observations) == 1
+        assert len(observations) == 3
         assert observations[0].name == "Read"
+        assert [(o.status, o.level) for o in observations] == [
+            ("ok", "DEFAULT"),
+            ("error", "ERROR"),
+            ("ok", "DEFAULT"),
+        ]
+        assert mock_client.get.call_count == 2
+
+    @patch("brainbox.langfuse_client._client")
+    def test_observations_error_raises(self, mock_client_fn):
+        mock_client = MagicMock()
+        trace_resp = MagicMock(status_code=200)
+        trace_resp.json.return_value = {"id": "t1"}
+
+        def _get(path, **kw):
+            if path == "/api/public/observations":
+                raise httpx.ConnectError("refused")
+            return trace_resp
+
+        mock_client.get.side_effect = _get
+        mock_client_fn.return_value = mock_client
+
+        with pytest.raises(LangfuseError, match="get_trace"):
+            get_trace("t1")
+
+
+# ---------------------------------------------------------------------------
+# Conditional GETs
+# ---------------------------------------------------------------------------
+
+
+class TestGetJsonETag:
+    def test_revalidates_with_etag(self):
+        first = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        first.json.return_value = {"data": [1]}
+        not_modified = MagicMock(status_code=304, headers={})
+
+        c = MagicMock()
+        c.get.side_effect = [first, not_modified]
+
+        assert lf._get_json(c, "/api/public/traces", "op", params={"limit": 1}) == {"data": [1]}
+        assert lf._get_json(c, "/api/public/traces", "op", params={"limit": 1}) == {"data": [1]}
+
+        assert c.get.call_args_list[0][1]["headers"] is None
+        assert c.get.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+        not_modified.json.assert_not_called()
+
+    def test_no_etag_not_cached(self):
+        resp = MagicMock(status_code=200, headers={})
+        resp.json.return_value = {"data": []}
+        c = MagicMock()
+        c.get.return_value = resp
+
+        lf._get_json(c, "/api/public/traces", "op")
+        lf._get_json(c, "/api/public/traces", "op")
+
+        assert c.get.call_args[1]["headers"] is None
+        assert lf._etag_cache == {}
+
+    def test_params_distinguish_entries(self):
+        resp = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        resp.json.return_value = {}
+        c = MagicMock()
+        c.get.return_value = resp
+
+        lf._get_json(c, "/api/public/observations", "op", params={"page": 1})
+        lf._get_json(c, "/api/public/observations", "op", params={"page": 2})
+
+        assert c.get.call_args[1]["headers"] is None
 
 
 # ---------------------------------------------------------------------------
@@ -297,8 +446,8 @@ class TestGetSessionTracesSummary:
 
         mock_client = MagicMock()
 
-        # Optimized code now makes a SINGLE batch call for all observations
-        batch_obs_resp = MagicMock()
+        # A single short page covers every observation in the session
+        batch_obs_resp = MagicMock(status_code=200)
         batch_obs_resp.json.return_value = {
             "data": [
                 {"traceId": "t1", "name": "Read", "level": "DEFAULT"},
@@ -306,7 +455,6 @@ class TestGetSessionTracesSummary:
                 {"traceId": "t2", "name": "Read", "level": "ERROR"},
             ]
         }
-        batch_obs_resp.raise_for_status = MagicMock()
 
         mock_client.get.return_value = batch_obs_resp
         mock_client_fn.return_value = mock_client
@@ -321,10 +469,126 @@ class TestGetSessionTracesSummary:
         assert summary.tool_counts["Read"] == 2
         assert summary.tool_counts["Write"] == 1
 
-        # Verify it made a single batch call with sessionId parameter
+        # A short first page ends pagination after a single call
         mock_client.get.assert_called_once()
         call_args = mock_client.get.call_args
         assert call_args[1]["params"]["sessionId"] == "s1"
+        assert call_args[1]["params"]["page"] == 1
+
+    @patch("brainbox.langfuse_client._client")
+    @patch("brainbox.langfuse_client.list_traces")
+    def test_counts_observations_without_trace_filter(self, mock_list, mock_client_fn):
+        # sessionId already scopes observations server-side; observations whose
+        # trace fell outside the first page of traces are still counted.
+        mock_list.return_value = [
+            TraceResult(id="t1", name="a", session_id="s1", timestamp="ts", status="ok"),
+        ]
+        obs_resp = MagicMock(status_code=200)
+        obs_resp.json.return_value = {
+            "data": [
+                {"traceId": "t1", "name": "Read"},
+                {"traceId": "t-older", "name": "Read"},
+            ]
+        }
+        mock_client = MagicMock()
+        mock_client.get.return_value = obs_resp
+        mock_client_fn.return_value = mock_client
+
+        summary = get_session_traces_summary("s1")
+
+        assert summary.total_observations == 2
+        assert summary.tool_counts == {"Read": 2}
+        assert "traceId" not in mock_client.get.call_args[1]["params"]
+
+    @patch("brainbox.langfuse_client._client")
+    @patch("brainbox.langfuse_client.list_traces")
+    def test_paginates_observations(self, mock_list, mock_client_fn):
+        mock_list.return_value = []
+
+        full_page = MagicMock(status_code=200)
+        full_page.json.return_value = {
+            "data": [{"traceId": "t1", "name": "Read", "level": "DEFAULT"}] * 100,
+            "meta": {"page": 1, "totalPages": 2},
+        }
+        last_page = MagicMock(status_code=200)
+        last_page.json.return_value = {
+            "data": [{"traceId": "t2", "name": "Bash", "level": "ERROR"}],
+            "meta": {"page": 2, "totalPages": 2},
+        }
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = [full_page, last_page]
+        mock_client_fn.return_value = mock_client
+
+        summary = get_session_traces_summary("s1")
+
+        assert summary.total_observations == 101
+        assert summary.tool_counts == {"Read": 100, "Bash": 1}
+        assert summary.error_count == 1
+        pages = [c[1]["params"]["page"] for c in mock_client.get.call_args_list]
+        assert pages == [1, 2]
+
+    @patch("brainbox.langfuse_client._client")
+    @patch("brainbox.langfuse_client.list_traces")
+    def test_stops_when_server_repeats_a_page(self, mock_list, mock_client_fn):
+        mock_list.return_value = []
+
+        # No totalPages, and every request returns the same full page
+        same_page = MagicMock(status_code=200)
+        same_page.json.return_value = {
+            "data": [{"id": f"o{i}", "name": "Read", "level": "DEFAULT"} for i in range(100)],
+        }
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = same_page
+        mock_client_fn.return_value = mock_client
+
+        summary = get_session_traces_summary("s1")
+
+        assert summary.total_observations == 100
+        assert mock_client.get.call_count == 2
+
+    @patch("brainbox.langfuse_client._client")
+    @patch("brainbox.langfuse_client.list_traces")
+    @patch("brainbox.langfuse_client._MAX_OBSERVATION_PAGES", 3)
+    def test_page_count_is_capped(self, mock_list, mock_client_fn):
+        mock_list.return_value = []
+
+        def full_page(*args, **kwargs):
+            page = kwargs["params"]["page"]
+            resp = MagicMock(status_code=200)
+            resp.json.return_value = {
+                "data": [{"id": f"p{page}-{i}", "name": "Read"} for i in range(100)],
+            }
+            return resp
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = full_page
+        mock_client_fn.return_value = mock_client
+
+        summary = get_session_traces_summary("s1")
+
+        assert summary.total_observations == 300
+        assert mock_client.get.call_count == 3
+
+    @patch("brainbox.langfuse_client._client")
+    @patch("brainbox.langfuse_client.list_traces")
+    def test_page_failure_returns_partial_counts(self, mock_list, mock_client_fn):
+        mock_list.return_value = []
+
+        full_page = MagicMock(status_code=200)
+        full_page.json.return_value = {
+            "data": [{"traceId": "t1", "name": "Read", "level": "DEFAULT"}] * 100,
+        }
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = [full_page, httpx.ConnectError("refused")]
+        mock_client_fn.return_value = mock_client
+
+        summary = get_session_traces_summary("s1")
+
+        assert summary.total_observations == 100
+        assert summary.tool_counts == {"Read": 100}
 
 
 # ---------------------------------------------------------------------------
@@ -345,3 +609,14 @@ class TestTruncate:
     def test_exact_limit(self):
         s = "x" * 200
         assert _truncate(s, max_len=200) == s
+
+
+class TestPreview:
+    def test_string_passthrough(self):
+        assert _preview("hello") == "hello"
+
+    def test_non_string_coerced(self):
+        assert _preview({"a": 1}) == "{'a': 1}"
+
+    def test_long_value_truncated(self):
+        assert _preview(["x" * 300]).endswith("...")
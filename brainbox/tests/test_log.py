@@ -0,0 +1,42 @@
+"""Tests for the structlog JSON serializers."""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+
+from brainbox import log
+
+_EVENT = {
+    "timestamp": "2026-02-21T10:30:45Z",
+    "level": "info",
+    "event": "container.started",
+    "session_name": "café ☃",
+    "metadata": {"port": 7681, "ratio": 0.5, "tags": ["a", None, True], 1: "int key"},
+}
+
+needs_orjson = pytest.mark.skipif(log.orjson is None, reason="orjson not installed")
+
+
+class TestSerializers:
+    @needs_orjson
+    def test_format_does_not_depend_on_orjson(self):
+        assert log._orjson_dumps(_EVENT, default=repr) == log._json_dumps(_EVENT, default=repr)
+
+    def test_format_is_compact_utf8(self):
+        line = log._json_dumps({"event": "x", "name": "café"})
+
+        assert line == '{"event":"x","name":"café"}'
+
+    @needs_orjson
+    def test_default_handles_unserializable_values(self):
+        value = {"at": datetime.timezone.utc}
+
+        assert log._orjson_dumps(value, default=str) == log._json_dumps(value, default=str)
+
+    @needs_orjson
+    def test_big_ints_fall_back_to_stdlib(self):
+        line = log._orjson_dumps({"size": 2**64}, default=str)
+
+        assert line == '{"size":18446744073709551616}'
@@ -0,0 +1,201 @@
+"""Tests for the MCP server's HTTP transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from brainbox import mcp_server
+
+_URL = "http://brainbox.test"
+
+
+@pytest.fixture()
+def api(monkeypatch):
+    """Route the transport through an httpx.MockTransport.
+
+    Tests assign ``api.handler`` (sync or async, taking an ``httpx.Request``);
+    every request the transport sends is recorded in ``api.requests``.
+    """
+
+    api = SimpleNamespace(handler=lambda request: httpx.Response(200, json={}), requests=[])
+
+    async def dispatch(request: httpx.Request) -> httpx.Response:
+        api.requests.append(request)
+        response = api.handler(request)
+        return await response if asyncio.iscoroutine(response) else response
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(dispatch))
+
+    async def no_backoff(attempt: int) -> None:
+        pass
+
+    monkeypatch.setenv("BRAINBOX_URL", _URL)
+    monkeypatch.setenv("CL_API_KEY", "test-key")
+    monkeypatch.setattr(mcp_server, "_client", lambda: client)
+    monkeypatch.setattr(mcp_server, "_backoff", no_backoff)
+    monkeypatch.setattr(mcp_server, "_response_cache", {})
+    monkeypatch.setattr(mcp_server, "_inflight", {})
+    monkeypatch.setattr(mcp_server, "_header_templates", {})
+    monkeypatch.setattr(mcp_server, "_cached_key", None)
+    return api
+
+
+def _get(path: str):
+    return mcp_server._arequest("GET", path, None, {}, 5)
+
+
+class TestRetries:
+    async def test_post_retries_connect_errors(self, api):
+        failures = iter([True, True, False])
+
+        def handler(request):
+            if next(failures):
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"ok": True})
+
+        api.handler = handler
+        result = await mcp_server._asend("POST", "/api/create", b"{}", {}, 5)
+
+        assert result == {"ok": True}
+        assert len(api.requests) == 3
+
+    async def test_post_is_not_retried_on_5xx(self, api):
+        api.handler = lambda request: httpx.Response(503, json={"detail": "restarting"})
+
+        result = await mcp_server._asend("POST", "/api/create", b"{}", {}, 5)
+
+        assert result == {"error": "restarting", "status": 503}
+        assert len(api.requests) == 1
+
+    async def test_get_is_retried_on_5xx(self, api):
+        statuses = iter([503, 502, 200])
+        api.handler = lambda request: httpx.Response(next(statuses), json={"n": 1})
+
+        assert await mcp_server._asend("GET", "/api/tasks", None, {}, 5) == {"n": 1}
+        assert len(api.requests) == 3
+
+
+class TestResponseCache:
+    async def test_expired_entry_is_revalidated_with_etag(self, api, monkeypatch):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=[{"name": "a"}], headers={"ETag": '"v1"'})
+
+        api.handler = handler
+        monkeypatch.setattr(mcp_server, "_CACHE_TTL", 0.0)
+
+        first = await _get("/api/sessions")
+        second = await _get("/api/sessions")
+
+        assert second == first == [{"name": "a"}]
+        assert [r.headers.get("If-None-Match") for r in api.requests] == [None, '"v1"']
+
+    async def test_fresh_entry_is_served_without_a_request(self, api):
+        api.handler = lambda request: httpx.Response(200, json=[1])
+
+        await _get("/api/sessions")
+        await _get("/api/sessions")
+
+        assert len(api.requests) == 1
+
+    async def test_mutation_invalidates_cache(self, api):
+        api.handler = lambda request: httpx.Response(200, json={"n": len(api.requests)})
+
+        assert await _get("/api/sessions") == {"n": 1}
+        await mcp_server._arequest("POST", "/api/create", b"{}", {}, 5)
+
+        assert await _get("/api/sessions") == {"n": 3}
+
+    async def test_get_overlapping_a_mutation_is_not_cached(self, api):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def handler(request):
+            if request.method == "GET":
+                started.set()
+                await release.wait()
+                return httpx.Response(200, json={"stale": True})
+            return httpx.Response(200, json={})
+
+        api.handler = handler
+        read = asyncio.ensure_future(_get("/api/sessions"))
+        await started.wait()
+        await mcp_server._arequest("POST", "/api/create", b"{}", {}, 5)
+        release.set()
+
+        assert await read == {"stale": True}
+        assert mcp_server._response_cache == {}
+
+
+class TestSingleFlight:
+    async def test_concurrent_identical_gets_share_one_request(self, api):
+        release = asyncio.Event()
+
+        async def handler(request):
+            await release.wait()
+            return httpx.Response(200, json={"tasks": []})
+
+        api.handler = handler
+        reads = asyncio.gather(*(_get("/api/hub/tasks") for _ in range(5)))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await reads == [{"tasks": []}] * 5
+        assert len(api.requests) == 1
+        assert mcp_server._inflight == {}
+
+
+class TestBatch:
+    async def test_results_keep_call_order(self, api):
+        async def handler(request):
+            if request.url.path == "/api/slow":
+                await asyncio.sleep(0.01)
+            if request.method == "DELETE":
+                return httpx.Response(204)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        api.handler = handler
+        results = await mcp_server._abatch(
+            [
+                {"method": "GET", "path": "/api/slow"},
+                {"method": "TRACE", "path": "/api/fast"},
+                {"path": "/not-api"},
+                {"method": "post", "path": "/api/fast", "body": {"a": 1}},
+                {"method": "DELETE", "path": "/api/sessions/x"},
+            ],
+            {"X-API-Key": "test-key"},
+        )
+
+        invalid = {"error": "invalid call: need method and /api/ path"}
+        assert results[:4] == [{"path": "/api/slow"}, invalid, invalid, {"path": "/api/fast"}]
+        # An empty 2xx body fails only its own slot
+        assert "error" in results[4]
+        post = next(r for r in api.requests if r.method == "POST")
+        assert json.loads(post.content) == {"a": 1}
+        assert post.headers["Content-Type"] == "application/json"
+
+
+class TestApiKey:
+    async def test_401_resets_cached_key(self, api, monkeypatch):
+        monkeypatch.delenv("CL_API_KEY")
+        monkeypatch.setattr(mcp_server, "_cached_key", "rotated-away")
+        api.handler = lambda request: httpx.Response(401, json={"detail": "bad key"})
+
+        result = await mcp_server._asend("GET", "/api/tasks", None, {}, 5)
+
+        assert result == {"error": "bad key", "status": 401}
+        assert mcp_server._cached_key is None
+
+
+class TestSyncTools:
+    def test_tool_runs_on_transport_loop_with_api_key(self, api):
+        api.handler = lambda request: httpx.Response(200, json=[{"name": "a"}])
+
+        assert mcp_server.list_sessions() == [{"name": "a"}]
+        assert api.requests[0].url == f"{_URL}/api/sessions"
+        assert api.requests[0].headers["X-API-Key"] == "test-key"
@@ -0,0 +1,160 @@
+"""Tests for the hub message router and its indexed audit log."""
+
+from __future__ import annotations
+
+import itertools
+import uuid
+from collections import defaultdict, deque
+from unittest.mock import patch
+
+import pytest
+
+from brainbox import messages, registry
+from brainbox.models import AgentDefinition
+
+_MAXLEN = 20
+
+
+@pytest.fixture()
+def message_log():
+    """A small audit log (with fresh indexes) that is cheap to overflow."""
+    with (
+        patch.object(messages, "_message_log", deque(maxlen=_MAXLEN)),
+        patch.object(
+            messages,
+            "_log_indexes",
+            {field: defaultdict(deque) for field in messages._LOG_INDEX_FIELDS},
+        ),
+        patch.object(messages, "_pending", defaultdict(deque)),
+        patch.object(messages, "_persist_log_entry"),
+    ):
+        yield messages._message_log
+
+
+def _fill(count: int) -> None:
+    """Append *count* entries cycling through senders, recipients and statuses.
+
+    Timestamps repeat in pairs so ``since`` boundaries fall inside runs of equal values.
+    """
+    senders = itertools.cycle(["a", "b", "c"])
+    recipients = itertools.cycle(["x", "y"])
+    statuses = itertools.cycle(["delivered", "delivered", "rejected"])
+    for i in range(count):
+        messages._append_log(
+            {
+                "id": str(i),
+                "timestamp": 1000 + i // 2,
+                "sender": next(senders),
+                "recipient": next(recipients),
+                "status": next(statuses),
+            }
+        )
+
+
+_FILTERS = [
+    {},
+    {"sender": "a"},
+    {"recipient": "y", "status": "rejected"},
+    {"sender": "b", "recipient": "x", "status": "delivered"},
+    {"sender": "nobody"},
+]
+
+
+class TestMessageLog:
+    @pytest.mark.parametrize("since", [None, 1000, 1025, 1031, 10_000])
+    @pytest.mark.parametrize("filters", _FILTERS)
+    def test_filtered_queries_match_brute_force(self, message_log, filters, since):
+        _fill(3 * _MAXLEN + 7)
+
+        expected = [
+            m
+            for m in message_log
+            if all(m[field] == value for field, value in filters.items())
+            and (since is None or m["timestamp"] >= since)
+        ]
+        assert messages.get_message_log(**filters, since=since) == expected
+
+    def test_index_buckets_only_hold_live_entries(self, message_log):
+        _fill(3 * _MAXLEN + 7)
+
+        assert len(message_log) == _MAXLEN
+        live = {id(m) for m in message_log}
+        for field, index in messages._log_indexes.items():
+            assert sum(len(bucket) for bucket in index.values()) == _MAXLEN
+            for value, bucket in index.items():
+                assert bucket, f"empty {field} bucket {value!r} left behind"
+                assert all(id(m) in live for m in bucket)
+                assert all(m[field] == value for m in bucket)
+
+    def test_now_ms_never_goes_backwards(self, monkeypatch):
+        monkeypatch.setattr(messages, "_last_ms", 0)
+        clock = iter([5_000_000_000, 4_000_000_000, 6_000_000_000])
+        monkeypatch.setattr(messages.time, "time_ns", lambda: next(clock))
+
+        assert [messages._now_ms() for _ in range(3)] == [5000, 5000, 6000]
+
+
+class TestNewId:
+    def test_ids_are_unique_uuid4_strings_across_batches(self):
+        ids = [messages._new_id() for _ in range(messages._ID_BATCH * 2 + 3)]
+
+        assert len(set(ids)) == len(ids)
+        for value in ids:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert str(parsed) == value
+
+
+@pytest.fixture()
+def agents():
+    """Register a sender allowed to message agents and a two-token recipient."""
+    with (
+        patch.object(
+            registry,
+            "_agents",
+            {
+                "sender": AgentDefinition(
+                    name="sender", image="img", capabilities=["message_agents"]
+                ),
+                "worker": AgentDefinition(name="worker", image="img"),
+            },
+        ),
+        patch.object(registry, "_tokens", {}),
+        patch.object(registry, "_tokens_by_agent", {}),
+        patch.object(registry, "_expiry_heap", []),
+        patch.object(registry, "_token_dumps", {}),
+    ):
+        yield (
+            registry.issue_token("sender", "t0"),
+            registry.issue_token("worker", "t1"),
+            registry.issue_token("worker", "t2"),
+        )
+
+
+class TestRouting:
+    def test_message_fans_out_to_every_recipient_token(self, message_log, agents):
+        sender, w1, w2 = agents
+
+        result = messages.route(
+            {"sender_token_id": sender.token_id, "recipient": "worker", "type": "ping"}
+        )
+
+        assert messages.get_messages(w1.token_id) == [result["message"]]
+        assert messages.get_messages(w2.token_id) == [result["message"]]
+        assert messages.get_messages(sender.token_id) == []
+        [entry] = messages.get_message_log(sender="sender", status="delivered")
+        assert entry["id"] == result["message_id"]
+
+    def test_get_messages_batch_drains_and_omits_empty_queues(self, message_log, agents):
+        sender, w1, w2 = agents
+        for kind in ("first", "second"):
+            messages.route(
+                {"sender_token_id": sender.token_id, "recipient": "worker", "type": kind}
+            )
+        messages.get_messages(w2.token_id)
+
+        drained = messages.get_messages_batch([w1.token_id, w2.token_id, "unknown"])
+
+        assert list(drained) == [w1.token_id]
+        assert [m["type"] for m in drained[w1.token_id]] == ["first", "second"]
+        assert messages.get_messages_batch([w1.token_id]) == {}
@@ -0,0 +1,200 @@
+"""Tests for the container health monitor loop."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from brainbox import monitor
+from brainbox.config import settings
+from brainbox.log import setup_logging
+from brainbox.models import SessionContext, SessionState
+
+
+def _ctx(name: str) -> SessionContext:
+    return SessionContext(
+        session_name=name,
+        container_name=f"developer-{name}",
+        port=7681,
+        created_at=int(time.time() * 1000),
+        ttl=3600,
+    )
+
+
+@pytest.fixture()
+def tracked():
+    sessions: dict[str, SessionContext] = {}
+    with (
+        patch.object(monitor, "_tracked", sessions),
+        patch.object(settings, "health_check_interval", 0),
+        patch.object(monitor, "_backends", {}),
+        patch.object(monitor, "_schedule", {}),
+    ):
+        yield sessions
+
+
+class TestMonitorLoop:
+    async def test_checks_sessions_concurrently(self, tracked):
+        for name in ("a", "b", "c"):
+            tracked[name] = _ctx(name)
+        in_flight = 0
+        peak = 0
+
+        async def health_check(ctx, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            tracked.clear()  # end the loop after this cycle
+            return {"healthy": True}
+
+        backend = MagicMock()
+        backend.health_check = health_check
+        with patch("brainbox.monitor.create_backend", return_value=backend):
+            await monitor._monitor_loop()
+
+        assert peak == 3
+
+    async def test_failing_check_does_not_affect_others(self, tracked):
+        ok, bad = _ctx("ok"), _ctx("bad")
+        ok.ttl = 1
+        ok.created_at = 0
+        tracked.update(ok=ok, bad=bad)
+
+        async def health_check(ctx, **kwargs):
+            if ctx is bad:
+                raise RuntimeError("boom")
+            return {"healthy": True}
+
+        backend = MagicMock()
+        backend.health_check = health_check
+        limit = asyncio.Semaphore(8)
+        with patch("brainbox.monitor.create_backend", return_value=backend):
+            await asyncio.gather(*(monitor._check_one(n, c, 5, limit) for n, c in tracked.items()))
+
+        assert ok.state == SessionState.RECYCLING
+        assert bad.health_failures == 0
+
+    async def test_not_found_stops_tracking(self, tracked):
+        tracked["gone"] = _ctx("gone")
+        backend = MagicMock()
+
+        async def health_check(ctx, **kwargs):
+            return {"healthy": False, "reason": "Container not found"}
+
+        backend.health_check = health_check
+        with patch("brainbox.monitor.create_backend", return_value=backend):
+            await monitor._monitor_loop()
+
+        assert tracked == {}
+
+    async def test_concurrency_is_bounded(self, tracked):
+        for i in range(5):
+            tracked[f"s{i}"] = _ctx(f"s{i}")
+        in_flight = 0
+        peak = 0
+
+        async def health_check(ctx, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            tracked.clear()
+            return {"healthy": True}
+
+        backend = MagicMock()
+        backend.health_check = health_check
+        with (
+            patch.object(settings, "health_check_concurrency", 2),
+            patch("brainbox.monitor.create_backend", return_value=backend),
+        ):
+            await monitor._monitor_loop()
+
+        assert peak == 2
+
+    async def test_backend_is_created_once(self, tracked):
+        ctx = _ctx("a")
+        backend = MagicMock()
+
+        async def health_check(ctx, **kwargs):
+            return {"healthy": True}
+
+        backend.health_check = health_check
+        limit = asyncio.Semaphore(8)
+        with patch("brainbox.monitor.create_backend", return_value=backend) as create:
+            await monitor._check_one("a", ctx, 5, limit)
+            await monitor._check_one("a", ctx, 5, limit)
+
+        create.assert_called_once_with("docker")
+
+    @pytest.mark.parametrize(("level", "expected"), [("debug", True), ("info", False)])
+    async def test_stats_follow_log_level(self, tracked, level, expected):
+        seen: list[bool] = []
+        backend = MagicMock()
+
+        async def health_check(ctx, *, include_stats):
+            seen.append(include_stats)
+            return {"healthy": True}
+
+        backend.health_check = health_check
+        try:
+            with (
+                patch.object(settings, "log_level", level),
+                patch("brainbox.monitor.create_backend", return_value=backend),
+            ):
+                setup_logging()
+                name = f"stats-{level}"
+                await monitor._check_one(name, _ctx(name), 5, asyncio.Semaphore(1))
+        finally:
+            setup_logging()
+
+        assert seen == [expected]
+
+    async def test_wakes_for_new_session_and_exits_when_idle(self, tracked):
+        checked: list[str] = []
+        backend = MagicMock()
+
+        async def health_check(ctx, **kwargs):
+            checked.append(ctx.session_name)
+            return {"healthy": True}
+
+        backend.health_check = health_check
+        with (
+            patch.object(settings, "health_check_interval", 30),
+            patch.object(monitor, "_task", None),
+            patch("brainbox.monitor.create_backend", return_value=backend),
+        ):
+            monitor.start_monitoring(_ctx("a"))
+            await asyncio.sleep(0.01)
+            monitor.start_monitoring(_ctx("b"))
+            await asyncio.sleep(0.01)
+            assert "b" in checked
+
+            monitor.stop_monitoring("a")
+            monitor.stop_monitoring("b")
+            await asyncio.wait_for(monitor._task, timeout=1)
+
+
+class TestReschedule:
+    def test_backs_off_while_healthy_and_resets_on_failure(self):
+        ctx = _ctx("a")
+        with patch.object(monitor, "_schedule", {}) as schedule:
+            delays = []
+            for healthy in (True, True, True, True, True, False):
+                schedule["a"] = monitor._reschedule("a", ctx, healthy, 0.0, 30, 120)
+                delays.append(schedule["a"][1])
+
+        assert delays == [30, 60, 120, 120, 120, 30]
+
+    def test_does_not_sleep_past_ttl(self):
+        ctx = _ctx("a")
+        ctx.ttl = 45
+        with patch.object(monitor, "_schedule", {"a": (0.0, 120, True)}):
+            _, delay, _ = monitor._reschedule("a", ctx, True, 0.0, 30, 240)
+
+        assert 30 <= delay <= 45
@@ -8,6 +8,18 @@ from unittest.mock import patch
 from brainbox.config import OllamaSettings, Settings
 from brainbox.models import SessionContext, SessionState
 
+# Settings() re-reads the environment and validates every field, so build
+# each env variant once per session
+_settings_cache: dict[tuple[tuple[str, str], ...], Settings] = {}
+
+
+def get_settings(**env: str) -> Settings:
+    key = tuple(sorted(env.items()))
+    if key not in _settings_cache:
+        with patch.dict(os.environ, env):
+            _settings_cache[key] = Settings()
+    return _settings_cache[key]
+
 
 # ---------------------------------------------------------------------------
 # SessionContext defaults
@@ -55,18 +67,11 @@ class TestOllamaSettings:
         assert s.model == "qwen3:8b"
 
     def test_env_override(self):
-        with patch.dict(
-            os.environ,
-            {
-                "CL_OLLAMA__HOST": "http://my-gpu:11434",
-                "CL_OLLAMA__MODEL": "glm-4.7",
-            },
-        ):
-            s = Settings()
-            assert s.ollama.host == "http://my-gpu:11434"
-            assert s.ollama.model == "glm-4.7"
+        s = get_settings(CL_OLLAMA__HOST="http://my-gpu:11434", CL_OLLAMA__MODEL="glm-4.7")
+        assert s.ollama.host == "http://my-gpu:11434"
+        assert s.ollama.model == "glm-4.7"
 
     def test_settings_includes_ollama(self):
-        s = Settings()
+        s = get_settings()
         assert hasattr(s, "ollama")
         assert isinstance(s.ollama, OllamaSettings)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from docker.errors import NotFound
 
+from brainbox import lifecycle as lc
 from brainbox.config import Settings, settings
+from brainbox.lifecycle import configure
 from brainbox.models import SessionContext, SessionState
 
 
@@ -44,72 +46,47 @@ def claude_ctx():
 
 
 @pytest.fixture()
-def mock_sessions(ollama_ctx, claude_ctx):
-    """Patch lifecycle._sessions so _resolve() works."""
-    sessions = {
-        ollama_ctx.session_name: ollama_ctx,
-        claude_ctx.session_name: claude_ctx,
-    }
-    with patch("brainbox.lifecycle._sessions", sessions):
-        yield sessions
+def mock_sessions(ollama_ctx, claude_ctx, monkeypatch):
+    """Register the test sessions in a fresh lifecycle registry so _resolve() works."""
+    monkeypatch.setattr(lc, "_sessions", {})
+    monkeypatch.setattr(lc, "_sessions_snapshot", None)
+    for ctx in (ollama_ctx, claude_ctx):
+        lc._register_session(ctx)
 
 
 class TestConfigureOllama:
-    @pytest.mark.asyncio
-    async def test_injects_ollama_env_vars(self, ollama_ctx, mock_sessions):
-        # Mock backend to avoid Docker dependency
-        mock_backend = MagicMock()
-        mock_backend.configure = AsyncMock(side_effect=lambda ctx, **kwargs: ctx)
-
-        with (
-            patch("brainbox.secrets.resolve_secrets", return_value={}),
-            patch("brainbox.secrets.has_op_integration", return_value=False),
-            patch("brainbox.backends.create_backend", return_value=mock_backend),
-        ):
-            from brainbox.lifecycle import configure
+    @pytest.fixture(autouse=True)
+    def resolved_secrets(self, monkeypatch):
+        """Stub secret resolution and the backend; tests may add to the returned dict."""
+        import brainbox.backends
+        import brainbox.secrets
+
+        secrets: dict[str, str] = {}
+        backend = MagicMock()
+        backend.configure = AsyncMock(side_effect=lambda ctx, **kwargs: ctx)
+        monkeypatch.setattr(brainbox.secrets, "resolve_secrets", lambda: dict(secrets))
+        monkeypatch.setattr(brainbox.secrets, "has_op_integration", lambda: False)
+        monkeypatch.setattr(brainbox.backends, "create_backend", lambda backend_type: backend)
+        return secrets
+
+    @pytest.mark.parametrize(
+        "host,expected_url",
+        [
+            (None, "http://host.docker.internal:11434"),
+            ("http://gpu-box:11434", "http://gpu-box:11434"),
+        ],
+        ids=["default-url", "custom-url"],
+    )
+    async def test_injects_ollama_env_vars(self, ollama_ctx, mock_sessions, host, expected_url):
+        ollama_ctx.ollama_host = host
 
-            ctx = await configure(ollama_ctx)
+        ctx = await configure(ollama_ctx)
 
         assert ctx.secrets["ANTHROPIC_AUTH_TOKEN"] == "ollama"
         assert ctx.secrets["ANTHROPIC_API_KEY"] == ""
-        assert ctx.secrets["ANTHROPIC_BASE_URL"] == settings.ollama.host
+        assert ctx.secrets["ANTHROPIC_BASE_URL"] == expected_url
         assert ctx.secrets["CLAUDE_MODEL"] == "qwen3-coder"
 
-    @pytest.mark.asyncio
-    async def test_uses_default_url_when_not_specified(self, ollama_ctx, mock_sessions):
-        ollama_ctx.ollama_host = None
-        mock_backend = MagicMock()
-        mock_backend.configure = AsyncMock(side_effect=lambda ctx, **kwargs: ctx)
-
-        with (
-            patch("brainbox.secrets.resolve_secrets", return_value={}),
-            patch("brainbox.secrets.has_op_integration", return_value=False),
-            patch("brainbox.backends.create_backend", return_value=mock_backend),
-        ):
-            from brainbox.lifecycle import configure
-
-            ctx = await configure(ollama_ctx)
-
-        assert ctx.secrets["ANTHROPIC_BASE_URL"] == "http://host.docker.internal:11434"
-
-    @pytest.mark.asyncio
-    async def test_uses_custom_url_when_specified(self, ollama_ctx, mock_sessions):
-        ollama_ctx.ollama_host = "http://gpu-box:11434"
-        mock_backend = MagicMock()
-        mock_backend.configure = AsyncMock(side_effect=lambda ctx, **kwargs: ctx)
-
-        with (
-            patch("brainbox.secrets.resolve_secrets", return_value={}),
-            patch("brainbox.secrets.has_op_integration", return_value=False),
-            patch("brainbox.backends.create_backend", return_value=mock_backend),
-        ):
-            from brainbox.lifecycle import configure
-
-            ctx = await configure(ollama_ctx)
-
-        assert ctx.secrets["ANTHROPIC_BASE_URL"] == "http://gpu-box:11434"
-
-    @pytest.mark.asyncio
     async def test_uses_default_model_when_not_specified(self, mock_sessions):
         ctx = SessionContext(
             session_name="test-ollama",
@@ -120,35 +97,16 @@ class TestConfigureOllama:
             llm_provider="ollama",
             llm_model=None,
         )
-        mock_sessions["test-ollama"] = ctx
-        mock_backend = MagicMock()
-        mock_backend.configure = AsyncMock(side_effect=lambda ctx, **kwargs: ctx)
+        lc._register_session(ctx)
 
-        with (
-            patch("brainbox.secrets.resolve_secrets", return_value={}),
-            patch("brainbox.secrets.has_op_integration", return_value=False),
-            patch("brainbox.backends.create_backend", return_value=mock_backend),
-        ):
-            from brainbox.lifecycle import configure
-
-            ctx = await configure(ctx)
+        ctx = await configure(ctx)
 
         assert ctx.secrets["CLAUDE_MODEL"] == settings.ollama.model
 
-    @pytest.mark.asyncio
-    async def test_preserves_secrets_for_claude(self, claude_ctx, mock_sessions):
-        base_secrets = {"ANTHROPIC_API_KEY": "sk-real-key", "GH_TOKEN": "ghp_abc"}
-        mock_backend = MagicMock()
-        mock_backend.configure = AsyncMock(side_effect=lambda ctx, **kwargs: ctx)
-
-        with (
-            patch("brainbox.secrets.resolve_secrets", return_value=dict(base_secrets)),
-            patch("brainbox.secrets.has_op_integration", return_value=False),
-            patch("brainbox.backends.create_backend", return_value=mock_backend),
-        ):
-            from brainbox.lifecycle import configure
+    async def test_preserves_secrets_for_claude(self, claude_ctx, mock_sessions, resolved_secrets):
+        resolved_secrets.update({"ANTHROPIC_API_KEY": "sk-real-key", "GH_TOKEN": "ghp_abc"})
 
-            ctx = await configure(claude_ctx)
+        ctx = await configure(claude_ctx)
 
         assert ctx.secrets["ANTHROPIC_API_KEY"] == "sk-real-key"
         assert ctx.secrets["GH_TOKEN"] == "ghp_abc"
@@ -156,61 +114,64 @@ class TestConfigureOllama:
         assert "ANTHROPIC_BASE_URL" not in ctx.secrets
         assert "CLAUDE_MODEL" not in ctx.secrets
 
+    async def test_legacy_mode_renders_env_exports(
+        self, ollama_ctx, mock_sessions, resolved_secrets
+    ):
+        ollama_ctx.hardened = False
+        resolved_secrets["GH_TOKEN"] = "ghp_abc"
+
+        ctx = await configure(ollama_ctx)
+
+        lines = ctx.env_content.splitlines()
+        assert lines[0] == "export GH_TOKEN=ghp_abc"
+        assert "export ANTHROPIC_AUTH_TOKEN=ollama" in lines
+        assert "export ANTHROPIC_API_KEY=" in lines
+        assert len(lines) == len(ctx.secrets) - 1  # agent-token is added afterwards
+
 
 # ---------------------------------------------------------------------------
 # provision() — Docker labels
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture()
+def mock_docker_client():
+    """A Docker client whose image exists and whose container does not yet."""
+    client = MagicMock()
+    client.images.get.return_value.attrs = {"RepoDigests": []}
+    client.containers.get.side_effect = NotFound("not found")
+    return client
+
+
+@pytest.fixture()
+def patched_lifecycle(mock_docker_client, monkeypatch):
+    """Route provision() through mock_docker_client with no port scan or cosign check."""
+    import brainbox.backends.docker as docker_backend
+
+    monkeypatch.setattr(lc, "_docker", lambda: mock_docker_client)
+    monkeypatch.setattr(docker_backend, "_docker", lambda docker_host=None: mock_docker_client)
+    monkeypatch.setattr(lc, "_find_available_port", lambda *args, **kwargs: 7681)
+    monkeypatch.setattr(lc, "_verify_cosign", AsyncMock())
+    monkeypatch.setattr(lc, "_sessions", {})
+    monkeypatch.setattr(lc, "_sessions_snapshot", None)
+    return lc
+
+
 class TestProvisionLabels:
-    @pytest.mark.asyncio
-    async def test_labels_include_llm_provider(self):
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._find_available_port", return_value=7681),
-            patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
-        ):
-            from brainbox.lifecycle import provision
-
-            ctx = await provision(
-                session_name="label-test",
-                llm_provider="ollama",
-                llm_model="glm-4.7",
-            )
-
-        create_call = mock_client.containers.create.call_args
-        labels = create_call[1]["labels"]
+    async def test_labels_include_llm_provider(self, mock_docker_client, patched_lifecycle):
+        await patched_lifecycle.provision(
+            session_name="label-test",
+            llm_provider="ollama",
+            llm_model="glm-4.7",
+        )
+
+        labels = mock_docker_client.containers.create.call_args[1]["labels"]
         assert labels["brainbox.llm_provider"] == "ollama"
         assert labels["brainbox.llm_model"] == "glm-4.7"
 
-    @pytest.mark.asyncio
-    async def test_labels_default_to_claude(self):
-        mock_client = MagicMock()
-        mock_image = MagicMock()
-        mock_image.attrs = {"RepoDigests": []}
-        mock_client.images.get.return_value = mock_image
-        mock_client.containers.get.side_effect = NotFound("not found")
-        mock_client.containers.create.return_value = MagicMock()
-
-        with (
-            patch("brainbox.lifecycle._docker", return_value=mock_client),
-            patch("brainbox.backends.docker._docker", return_value=mock_client),
-            patch("brainbox.lifecycle._find_available_port", return_value=7681),
-            patch("brainbox.lifecycle._verify_cosign", new_callable=AsyncMock),
-        ):
-            from brainbox.lifecycle import provision
-
-            ctx = await provision(session_name="label-test-claude")
-
-        create_call = mock_client.containers.create.call_args
-        labels = create_call[1]["labels"]
+    async def test_labels_default_to_claude(self, mock_docker_client, patched_lifecycle):
+        await patched_lifecycle.provision(session_name="label-test-claude")
+
+        labels = mock_docker_client.containers.create.call_args[1]["labels"]
         assert labels["brainbox.llm_provider"] == "claude"
         assert labels["brainbox.llm_model"] == ""
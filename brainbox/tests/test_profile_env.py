@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from docker.errors import NotFound
 
+import brainbox.lifecycle as lifecycle
 from brainbox.config import ProfileSettings, Settings
 from brainbox.lifecycle import (
+    _build_volume_map,
+    _invalidate_profile_cache,
     _read_cache_vars,
     _resolve_oauth_account,
     _resolve_profile_env,
@@ -18,6 +23,14 @@ from brainbox.lifecycle import (
 from brainbox.models import SessionContext
 
 
+@pytest.fixture(autouse=True)
+def _fresh_profile_cache():
+    """Each test resolves mounts from scratch."""
+    _invalidate_profile_cache()
+    yield
+    _invalidate_profile_cache()
+
+
 # ---------------------------------------------------------------------------
 # ProfileSettings defaults
 # ---------------------------------------------------------------------------
@@ -454,6 +467,73 @@ class TestResolveProfileMounts:
         sso_path = str(home / ".aws" / "sso" / "cache")
         assert sso_path not in result
 
+    # --- Memoization ---
+
+    def test_repeat_calls_are_memoized(self, tmp_path):
+        (tmp_path / ".aws").mkdir()
+        with (
+            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
+            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
+            patch("brainbox.lifecycle.settings") as mock_settings,
+            patch("brainbox.lifecycle._build_volume_map", wraps=_build_volume_map) as build,
+        ):
+            mock_settings.profile = ProfileSettings()
+            first = _resolve_profile_mounts()
+            first[str(tmp_path / ".aws")]["mode"] = "rw"
+            second = _resolve_profile_mounts()
+
+        build.assert_called_once()
+        # Callers get independent copies
+        assert second[str(tmp_path / ".aws")]["mode"] == "ro"
+
+    def test_toggling_a_mount_setting_invalidates(self, tmp_path):
+        (tmp_path / ".aws").mkdir()
+        with (
+            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
+            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
+            patch("brainbox.lifecycle.settings") as mock_settings,
+        ):
+            mock_settings.profile = ProfileSettings()
+            assert str(tmp_path / ".aws") in _resolve_profile_mounts()
+            mock_settings.profile.mount_aws = False
+            assert str(tmp_path / ".aws") not in _resolve_profile_mounts()
+
+    def test_cache_env_change_invalidates(self, tmp_path):
+        ws = tmp_path / "ws"
+        (ws / ".aws").mkdir(parents=True)
+        alt_aws = tmp_path / "alt-aws"
+        alt_aws.mkdir()
+        cache_env = tmp_path / "sp-profiles" / "prof" / ".env"
+        cache_env.parent.mkdir(parents=True)
+        cache_env.write_text('AWS_CONFIG_FILE="$WORKSPACE_HOME/.aws/config"\n')
+
+        with (
+            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
+            patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True),
+            patch("brainbox.lifecycle.settings") as mock_settings,
+        ):
+            mock_settings.profile = ProfileSettings()
+            before = _resolve_profile_mounts(workspace_profile="prof", workspace_home=str(ws))
+            cache_env.write_text(f'AWS_CONFIG_FILE="{alt_aws}/config"\n')
+            st = cache_env.stat()
+            os.utime(cache_env, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            after = _resolve_profile_mounts(workspace_profile="prof", workspace_home=str(ws))
+
+        assert str(ws / ".aws") in before
+        assert str(alt_aws) in after
+
+    def test_settings_change_invalidates(self, tmp_path):
+        (tmp_path / ".aws").mkdir()
+        with (
+            patch("brainbox.lifecycle.Path.home", return_value=tmp_path),
+            patch.dict("os.environ", {"WORKSPACE_HOME": str(tmp_path)}, clear=True),
+            patch("brainbox.lifecycle.settings") as mock_settings,
+        ):
+            mock_settings.profile = ProfileSettings()
+            assert str(tmp_path / ".aws") in _resolve_profile_mounts()
+            mock_settings.profile = ProfileSettings(mount_aws=False)
+            assert str(tmp_path / ".aws") not in _resolve_profile_mounts()
+
 
 # ---------------------------------------------------------------------------
 # _read_cache_vars() — volatile cache reader
@@ -497,6 +577,14 @@ class TestReadCacheVars:
             result = _read_cache_vars("prof", "/host/ws")
         assert result == {"MY_VAR": "hello"}
 
+    def test_decodes_utf8_values_and_crlf_lines(self, tmp_path):
+        cache_dir = tmp_path / "sp-profiles" / "prof"
+        cache_dir.mkdir(parents=True)
+        (cache_dir / ".env").write_bytes('GREETING="héllo"\r\nOTHER=x\r\n'.encode())
+        with patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True):
+            result = _read_cache_vars("prof", "/host/ws")
+        assert result == {"GREETING": "héllo", "OTHER": "x"}
+
 
 # ---------------------------------------------------------------------------
 # _resolve_profile_env() — reads volatile .env cache
@@ -655,6 +743,33 @@ class TestResolveProfileEnv:
         assert result is not None
         assert "WORKSPACE_PROFILE=firebuild" in result
 
+    def test_shares_parse_with_read_cache_vars(self, tmp_path):
+        """Mount resolution and container env reuse one parse of the cache file."""
+        cache_dir = tmp_path / "sp-profiles" / "prof"
+        cache_dir.mkdir(parents=True)
+        env_file = cache_dir / ".env"
+        env_file.write_text('KUBECONFIG="$WORKSPACE_HOME/.kube/config"\nHOME=/Users/me\n')
+
+        with (
+            patch.dict("os.environ", {"TMPDIR": str(tmp_path)}, clear=True),
+            patch(
+                "brainbox.lifecycle._read_env_bytes", wraps=lifecycle._read_env_bytes
+            ) as mock_read,
+        ):
+            cache_vars = _read_cache_vars("prof", "/host/ws")
+            env = _resolve_profile_env(workspace_profile="prof")
+            assert mock_read.call_count == 1
+
+            env_file.write_text("KEY=changed\n")
+            os.utime(env_file, ns=(0, 1))
+            assert _read_cache_vars("prof", "/host/ws") == {"KEY": "changed"}
+            assert mock_read.call_count == 2
+
+        assert cache_vars["KUBECONFIG"] == "/host/ws/.kube/config"
+        assert env is not None
+        assert 'KUBECONFIG="$WORKSPACE_HOME/.kube/config"' in env
+        assert "HOME=/Users/me" not in env
+
 
 # ---------------------------------------------------------------------------
 # _resolve_oauth_account() — host Claude auth
@@ -707,6 +822,21 @@ class TestResolveOauthAccount:
             result = _resolve_oauth_account()
         assert result is None
 
+    def test_reparses_only_when_file_changes(self, tmp_path):
+        claude_json = tmp_path / ".claude.json"
+        claude_json.write_text('{"oauthAccount": {"accountUuid": "abc-123"}}')
+        with (
+            patch.dict("os.environ", {"CLAUDE_CONFIG_DIR": str(tmp_path)}, clear=False),
+            patch("brainbox.lifecycle._json_loads", wraps=json.loads) as loads,
+        ):
+            assert _resolve_oauth_account()["accountUuid"] == "abc-123"
+            assert _resolve_oauth_account()["accountUuid"] == "abc-123"
+            assert loads.call_count == 1
+
+            claude_json.write_text('{"oauthAccount": {"accountUuid": "def-4567"}}')
+            assert _resolve_oauth_account()["accountUuid"] == "def-4567"
+            assert loads.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # provision() — profile mounts in volumes
@@ -714,7 +844,6 @@ class TestResolveOauthAccount:
 
 
 class TestProvisionProfileMounts:
-    @pytest.mark.asyncio
     async def test_provision_includes_profile_volumes(self, tmp_path):
         aws_dir = tmp_path / ".aws"
         aws_dir.mkdir()
@@ -753,7 +882,6 @@ class TestProvisionProfileMounts:
         assert "aws" in ctx.profile_mounts
         assert "ssh" in ctx.profile_mounts
 
-    @pytest.mark.asyncio
     async def test_provision_sets_workspace_profile_label(self):
         mock_client = MagicMock()
         mock_image = MagicMock()
@@ -778,7 +906,6 @@ class TestProvisionProfileMounts:
         labels = create_call[1]["labels"]
         assert labels["brainbox.workspace_profile"] == "PERSONAL"
 
-    @pytest.mark.asyncio
     async def test_provision_no_mounts_when_dirs_missing(self):
         mock_client = MagicMock()
         mock_image = MagicMock()
@@ -800,7 +927,6 @@ class TestProvisionProfileMounts:
 
         assert ctx.profile_mounts == set()
 
-    @pytest.mark.asyncio
     async def test_provision_passes_workspace_home_to_mounts(self):
         """workspace_profile and workspace_home are threaded to _resolve_profile_mounts()."""
         mock_client = MagicMock()
@@ -830,7 +956,6 @@ class TestProvisionProfileMounts:
             workspace_home="/Users/test/profiles/firebuild",
         )
 
-    @pytest.mark.asyncio
     async def test_provision_stores_workspace_fields_on_ctx(self):
         """workspace_profile and workspace_home are stored on SessionContext."""
         mock_client = MagicMock()
@@ -889,7 +1014,6 @@ class TestStartProfileEnv:
             profile_mounts=set(),
         )
 
-    @pytest.mark.asyncio
     async def test_writes_profile_env_file(self, ctx_with_profile):
         mock_client = MagicMock()
         mock_container = MagicMock()
@@ -928,7 +1052,6 @@ class TestStartProfileEnv:
         assert ".bashrc" in hook_strs
         assert ".env" in hook_strs
 
-    @pytest.mark.asyncio
     async def test_skips_profile_env_when_no_cache(self, ctx_without_profile):
         mock_client = MagicMock()
         mock_container = MagicMock()
@@ -954,7 +1077,6 @@ class TestStartProfileEnv:
         ]
         assert len(profile_env_calls) == 0
 
-    @pytest.mark.asyncio
     async def test_start_passes_workspace_profile_to_resolve(self):
         """start() threads ctx.workspace_profile to _resolve_profile_env()."""
         ctx = SessionContext(
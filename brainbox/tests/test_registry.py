@@ -0,0 +1,133 @@
+"""Tests for agent token issuance and expiry."""
+
+from __future__ import annotations
+
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from brainbox import registry
+from brainbox.models import AgentDefinition
+
+
+@pytest.fixture()
+def clean_registry():
+    with (
+        patch.object(registry, "_agents", {"worker": AgentDefinition(name="worker", image="img")}),
+        patch.object(registry, "_tokens", {}),
+        patch.object(registry, "_tokens_by_agent", {}),
+        patch.object(registry, "_expiry_heap", []),
+        patch.object(registry, "_token_dumps", {}),
+    ):
+        yield
+
+
+class TestTokenSweep:
+    def test_list_tokens_drops_only_expired(self, clean_registry):
+        with patch.object(registry, "_now_ms", return_value=1_000_000):
+            short = registry.issue_token("worker", "t1", ttl=10)
+            long = registry.issue_token("worker", "t2", ttl=3600)
+
+        with patch.object(registry, "_now_ms", return_value=1_000_000 + 60_000):
+            tokens = registry.list_tokens()
+            by_agent = registry.tokens_for_agent("worker")
+
+        assert [t.token_id for t in tokens] == [long.token_id]
+        assert by_agent == [long]
+        assert short.token_id not in registry._tokens
+
+    def test_revoked_token_heap_entry_is_skipped(self, clean_registry):
+        with patch.object(registry, "_now_ms", return_value=0):
+            token = registry.issue_token("worker", "t1", ttl=10)
+        assert registry.revoke_token(token.token_id) is True
+
+        with patch.object(registry, "_now_ms", return_value=60_000):
+            assert registry.list_tokens() == []
+        assert registry._expiry_heap == []
+
+    def test_validate_token_sweeps_other_expired_tokens(self, clean_registry):
+        with patch.object(registry, "_now_ms", return_value=0):
+            short = registry.issue_token("worker", "t1", ttl=10)
+            long = registry.issue_token("worker", "t2", ttl=3600)
+
+        with patch.object(registry, "_now_ms", return_value=60_000):
+            assert registry.validate_token(long.token_id) is long
+            assert registry.validate_token(short.token_id) is None
+        assert list(registry._tokens) == [long.token_id]
+        assert registry._tokens_by_agent == {"worker": {long.token_id}}
+
+    def test_revoking_most_tokens_compacts_heap(self, clean_registry):
+        tokens = [registry.issue_token("worker", f"t{i}") for i in range(40)]
+        for token in tokens[1:]:
+            registry.revoke_token(token.token_id)
+
+        assert len(registry._expiry_heap) < len(tokens)
+        assert (tokens[0].expiry, tokens[0].token_id) in registry._expiry_heap
+
+    def test_tokens_share_agent_capabilities(self, clean_registry):
+        registry._agents["worker"] = AgentDefinition(
+            name="worker", image="img", capabilities=["message_agents"]
+        )
+        first = registry.issue_token("worker", "t1")
+        second = registry.issue_token("worker", "t2")
+
+        assert first.capabilities == ("message_agents",)
+        assert first.capabilities is second.capabilities
+        assert first.agent_name is registry._agents["worker"].name
+        with pytest.raises(ValidationError):
+            first.expiry = 0
+
+
+class TestState:
+    def test_get_state_reuses_dumps_until_token_dropped(self, clean_registry):
+        token = registry.issue_token("worker", "t1")
+
+        first = registry.get_state()
+        assert first == {"tokens": [(token.token_id, token.model_dump())]}
+        assert registry.get_state()["tokens"][0][1] is first["tokens"][0][1]
+
+        registry.revoke_token(token.token_id)
+        assert registry.get_state() == {"tokens": []}
+        assert registry._token_dumps == {}
+
+
+class TestLoadAgents:
+    def test_reuses_unchanged_files_and_reparses_edits(self, tmp_path):
+        agent_file = tmp_path / "worker.json"
+        agent_file.write_text('{"name": "worker", "image": "img:1"}')
+
+        with (
+            patch.object(
+                type(registry.settings), "agents_dir", new_callable=PropertyMock
+            ) as agents_dir,
+            patch.object(registry, "_agents", {}),
+            patch.object(registry, "_agent_file_cache", {}),
+        ):
+            agents_dir.return_value = tmp_path
+            first = registry.load_agents()["worker"]
+            assert registry.load_agents()["worker"] is first
+
+            agent_file.write_text('{"name": "worker", "image": "img:22"}')
+            assert registry.load_agents()["worker"].image == "img:22"
+
+            agent_file.unlink()
+            assert registry.load_agents() == {}
+            assert registry._agent_file_cache == {}
+
+    def test_reads_several_new_files_and_skips_bad_ones(self, tmp_path):
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.json").write_text(f'{{"name": "{name}", "image": "img"}}')
+        (tmp_path / "broken.json").write_text("{")
+        (tmp_path / "no-image.json").write_text('{"name": "d"}')
+        (tmp_path / "empty-image.json").write_text('{"name": "e", "image": ""}')
+
+        with (
+            patch.object(
+                type(registry.settings), "agents_dir", new_callable=PropertyMock
+            ) as agents_dir,
+            patch.object(registry, "_agents", {}),
+            patch.object(registry, "_agent_file_cache", {}),
+        ):
+            agents_dir.return_value = tmp_path
+            assert sorted(registry.load_agents()) == ["a", "b", "c"]
@@ -0,0 +1,93 @@
+"""Tests for the hub task router."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from brainbox import router
+from brainbox.models import Task, TaskStatus
+
+
+def _task(task_id: str, agent: str, created_at: int, status=TaskStatus.RUNNING) -> Task:
+    return Task(
+        id=task_id,
+        description="d",
+        agent_name=agent,
+        status=status,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+@pytest.fixture()
+def tasks():
+    with (
+        patch.object(router, "_tasks", {}),
+        patch.object(router, "_tasks_by_status", {}),
+        patch.object(router, "_tasks_by_agent", {}),
+    ):
+        for t in (
+            _task("t1", "worker", 1),
+            _task("t2", "reviewer", 2),
+            _task("t3", "worker", 3),
+            _task("t4", "worker", 4, TaskStatus.PENDING),
+        ):
+            router._add_task(t)
+        yield router._tasks
+
+
+class TestListTasks:
+    def test_all_tasks_newest_first(self, tasks):
+        assert [t.id for t in router.list_tasks()] == ["t4", "t3", "t2", "t1"]
+
+    def test_filters_by_status_and_agent(self, tasks):
+        assert [t.id for t in router.list_tasks(status="running")] == ["t3", "t2", "t1"]
+        assert [t.id for t in router.list_tasks(agent_name="worker")] == ["t4", "t3", "t1"]
+        assert [t.id for t in router.list_tasks(status="running", agent_name="worker")] == [
+            "t3",
+            "t1",
+        ]
+        assert router.list_tasks(status="bogus") == []
+
+    async def test_status_transitions_update_index(self, tasks):
+        with (
+            patch("brainbox.router.revoke_token"),
+            patch("brainbox.lifecycle.recycle", new_callable=AsyncMock),
+        ):
+            await router.complete_task("t1")
+            await router.cancel_task("t4")
+
+        assert [t.id for t in router.list_tasks(status="running")] == ["t3", "t2"]
+        assert [t.id for t in router.list_tasks(status="completed")] == ["t1"]
+        assert [t.id for t in router.list_tasks(status=TaskStatus.CANCELLED)] == ["t4"]
+        assert "pending" not in router._tasks_by_status
+
+
+class TestCheckRunningTasks:
+    async def test_fails_tasks_with_missing_containers_concurrently(self, tasks):
+        for t in tasks.values():
+            t.session_name = f"s-{t.id}"
+        in_flight = 0
+        peak = 0
+
+        async def recycle(name, reason):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with (
+            patch("brainbox.lifecycle.get_session", return_value=None),
+            patch("brainbox.lifecycle.recycle", side_effect=recycle),
+            patch("brainbox.router.get_agent", return_value=None),
+            patch("brainbox.router.revoke_token"),
+        ):
+            await router.check_running_tasks()
+
+        assert peak == 3
+        assert [t.id for t in router.list_tasks(status="failed")] == ["t3", "t2", "t1"]
+        assert tasks["t4"].status == TaskStatus.PENDING
@@ -1,8 +1,18 @@
 """Security-focused tests for brainbox."""
 
 import shlex
+
 import pytest
 
+from brainbox.validation import (
+    ValidationError,
+    validate_artifact_key,
+    validate_port,
+    validate_role,
+    validate_session_name,
+    validate_volume_mount,
+)
+
 
 class TestShellQuoting:
     """Tests for shell quoting using shlex.quote() to prevent command injection."""
@@ -30,27 +40,20 @@ class TestShellQuoting:
         # Most importantly: these strings are safe and won't execute shell commands
         # We verify this is tested in the injection prevention test below
 
-    def test_injection_prevention(self):
+    @pytest.mark.parametrize(
+        "input_val,expected",
+        [
+            ("$HOME", "'$HOME'"),  # Variable expansion
+            ("`whoami`", "'`whoami`'"),  # Command substitution
+            ("test; rm -rf /", "'test; rm -rf /'"),  # Command chaining
+            ("$(malicious)", "'$(malicious)'"),  # Command substitution with $()
+            ("test | malicious", "'test | malicious'"),  # Pipe
+        ],
+    )
+    def test_injection_prevention(self, input_val, expected):
         """Verify shlex.quote prevents all command injection patterns."""
-        # Dollar sign (variable expansion) - SAFELY quoted
-        result = shlex.quote("$HOME")
-        assert result == "'$HOME'"  # Quoted, won't expand
-
-        # Backticks (command substitution) - SAFELY quoted
-        result = shlex.quote("`whoami`")
-        assert result == "'`whoami`'"  # Quoted, won't execute
-
-        # Command chaining - SAFELY quoted
-        result = shlex.quote("test; rm -rf /")
-        assert result == "'test; rm -rf /'"  # Quoted, won't chain
-
-        # Command substitution with $() - SAFELY quoted
-        result = shlex.quote("$(malicious)")
-        assert result == "'$(malicious)'"  # Quoted, won't execute
-
-        # Pipe - SAFELY quoted
-        result = shlex.quote("test | malicious")
-        assert result == "'test | malicious'"  # Quoted, won't pipe
+        # Quoted, so the shell won't expand, execute, chain, or pipe
+        assert shlex.quote(input_val) == expected
 
     def test_empty_string(self):
         """Should handle empty strings."""
@@ -73,9 +76,9 @@ class TestShellQuoting:
         # Should be safely quoted to prevent any interpretation
         assert quoted == "'sk-proj-abc123!@#$%^&*()'"
 
-    def test_special_characters(self):
-        """Test various special shell characters are properly handled."""
-        dangerous = [
+    @pytest.mark.parametrize(
+        "input_val,expected",
+        [
             ("$PATH", "'$PATH'"),
             ("`echo test`", "'`echo test`'"),
             ("test && echo", "'test && echo'"),
@@ -89,32 +92,34 @@ class TestShellQuoting:
             ("{brace}", "'{brace}'"),
             ("*glob*", "'*glob*'"),
             ("?glob?", "'?glob?'"),
-        ]
-        for input_val, expected in dangerous:
-            assert shlex.quote(input_val) == expected
+        ],
+    )
+    def test_special_characters(self, input_val, expected):
+        """Test various special shell characters are properly handled."""
+        assert shlex.quote(input_val) == expected
 
 
 class TestSecurityPatterns:
     """Tests for security patterns across the application."""
 
-    def test_shell_quoting_integration(self):
-        """Integration test: verify shlex.quote makes strings safe for shell."""
-        test_cases = [
-            # (input, should_be_quoted)
+    @pytest.mark.parametrize(
+        "input_val,should_quote",
+        [
             ("simple", False),  # No special chars, no quotes needed
             ("with space", True),  # Whitespace requires quotes
             ("with'quote", True),  # Special chars require quotes
             ("$VARIABLE", True),  # Metacharacters require quotes
             ("`command`", True),  # Metacharacters require quotes
-        ]
-
-        for input_val, should_quote in test_cases:
-            result = shlex.quote(input_val)
-            if should_quote:
-                # Should be wrapped in quotes or have special escaping
-                assert "'" in result or '"' in result or "\\" in result
-            # Result should always be safe - no unquoted special chars
-            assert shlex.quote(result) == result or result.startswith("'") or result.startswith('"')
+        ],
+    )
+    def test_shell_quoting_integration(self, input_val, should_quote):
+        """Integration test: verify shlex.quote makes strings safe for shell."""
+        result = shlex.quote(input_val)
+        if should_quote:
+            # Should be wrapped in quotes or have special escaping
+            assert "'" in result or '"' in result or "\\" in result
+        # Result should always be safe - no unquoted special chars
+        assert shlex.quote(result) == result or result.startswith("'") or result.startswith('"')
 
     def test_shell_quoting_prevents_injection(self):
         """
@@ -146,8 +151,6 @@ class TestInputValidation:
 
     def test_session_name_validation(self):
         """Session names should match Docker naming rules."""
-        from brainbox.validation import validate_session_name, ValidationError
-
         # Valid names
         valid_names = ["test", "test-session", "test_session", "test123", "test.name"]
         for name in valid_names:
@@ -170,8 +173,6 @@ class TestInputValidation:
 
     def test_artifact_key_validation(self):
         """Artifact keys should prevent path traversal."""
-        from brainbox.validation import validate_artifact_key, ValidationError
-
         # Valid keys
         valid_keys = ["file.txt", "dir/file.txt", "a/b/c/file.txt"]
         for key in valid_keys:
@@ -192,8 +193,6 @@ class TestInputValidation:
 
     def test_volume_mount_validation(self):
         """Volume mounts should be validated."""
-        from brainbox.validation import validate_volume_mount, ValidationError
-
         # Valid mounts
         valid_mounts = [
             ("/host/path:/container/path", ("/host/path", "/container/path", "rw")),
@@ -217,8 +216,6 @@ class TestInputValidation:
 
     def test_port_validation(self):
         """Ports should be in valid range."""
-        from brainbox.validation import validate_port, ValidationError
-
         # Valid ports
         assert validate_port(1024) == 1024
         assert validate_port(8080) == 8080
@@ -234,8 +231,6 @@ class TestInputValidation:
 
     def test_role_validation(self):
         """Roles should be from allowed set."""
-        from brainbox.validation import validate_role, ValidationError
-
         # Valid roles
         assert validate_role("developer") == "developer"
         assert validate_role("researcher") == "researcher"